@@ -1,10 +1,41 @@
-from typing import Optional
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
 
 import click
+from click.core import ParameterSource
 
 from openapi_python_generator import __version__
-from openapi_python_generator.common import Formatter, HTTPLibrary, PydanticVersion
-from openapi_python_generator.generate_data import generate_data
+from openapi_python_generator.common import (
+    EnumStrategy,
+    Formatter,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+)
+
+
+def _parse_target(value: str, output: str):
+    """
+    Parses a --target option of the form LIBRARY:PYDANTIC_VERSION:PATH.
+    """
+    from openapi_python_generator.models import GenerationTarget
+
+    parts = value.split(":", 2)
+    if len(parts) != 3:
+        raise click.BadParameter(
+            f"{value!r} is not of the form LIBRARY:PYDANTIC_VERSION:PATH.",
+            param_hint="--target",
+        )
+    library, pydantic_version, path = parts
+    try:
+        return GenerationTarget(
+            library=HTTPLibrary(library),
+            pydantic_version=PydanticVersion(pydantic_version),
+            output=str(Path(output) / path),
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--target") from None
 
 
 @click.command()
@@ -52,6 +83,120 @@ from openapi_python_generator.generate_data import generate_data
     show_default=True,
     help="Option to choose which auto formatter is applied.",
 )
+@click.option(
+    "--include-tags",
+    multiple=True,
+    help="Only generate operations with this tag (and the models they use). Can be passed multiple times.",
+)
+@click.option(
+    "--include-operations",
+    multiple=True,
+    help="Only generate the operation with this operationId (and the models it uses). Can be passed multiple times.",
+)
+@click.option(
+    "--include-paths",
+    multiple=True,
+    help="Only generate operations whose path matches this glob pattern, e.g. '/pets/*'. Can be passed multiple "
+    "times.",
+)
+@click.option(
+    "--service-split",
+    type=ServiceSplit,
+    default=ServiceSplit.TAG,
+    show_default=True,
+    help="Put the operations into one service module per tag, or per first segment of their path.",
+)
+@click.option(
+    "--max-operations-per-service",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Split service modules with more operations into several numbered modules.",
+)
+@click.option(
+    "--deduplicate-models",
+    is_flag=True,
+    default=False,
+    help="Merge structurally identical schemas into one model. The names of the merged schemas remain "
+    "importable from the models package as aliases.",
+)
+@click.option(
+    "--enum-strategy",
+    type=EnumStrategy,
+    default=EnumStrategy.AUTO,
+    show_default=True,
+    help="How enum schemas are generated: as Enum classes, Literal types, lazily built Enum classes, or types "
+    "validating against a frozenset of the values. auto builds enums with more than 1000 values lazily and "
+    "uses a frozenset above 10000 values.",
+)
+@click.option(
+    "--trust-spec",
+    is_flag=True,
+    default=False,
+    help="Skip the validation of SOURCE, for specifications that are validated elsewhere. Only the structure "
+    "the generator relies on is checked, which makes loading large specifications faster.",
+)
+@click.option(
+    "--lazy-components",
+    is_flag=True,
+    default=False,
+    help="Parse the components of SOURCE only when the generator first uses them. Components that are never "
+    "used, e.g. with --include-tags, are neither validated nor loaded.",
+)
+@click.option(
+    "--validation-workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Validate the paths and components of SOURCE in this many processes, 0 for one per CPU. Speeds up "
+    "the validation of large specifications. Can't be combined with --trust-spec or --lazy-components.",
+)
+@click.option(
+    "--render-workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Render the models and operations in this many processes, 0 for one per CPU. Speeds up the generation "
+    "of large specifications. With --target, the default is one per CPU.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Don't write anything, only verify that the client in OUTPUT is up to date. Exits with a non-zero status "
+    "and lists the differing files if it isn't.",
+)
+@click.option(
+    "--target",
+    "targets",
+    multiple=True,
+    metavar="LIBRARY:PYDANTIC_VERSION:PATH",
+    help="Generate a client with this library and pydantic version into PATH (relative to OUTPUT), e.g. "
+    "'requests:v1:requests_v1'. Can be passed multiple times; the specification is then only parsed once. "
+    "Overrides --library and --pydantic-version.",
+)
+@click.option(
+    "--compile",
+    "compile_bytecode",
+    is_flag=True,
+    default=False,
+    help="Precompile the generated modules to bytecode, into __pycache__ or, if OUTPUT is a wheel or zip "
+    "archive, into the archive.",
+)
+@click.option(
+    "--invalidation-mode",
+    type=click.Choice(["timestamp", "checked-hash", "unchecked-hash"]),
+    default="timestamp",
+    show_default=True,
+    help="How the interpreter validates the .pyc files written by --compile. Use unchecked-hash for reproducible "
+    "builds. Archives always contain unchecked-hash .pyc files.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and regenerate the client whenever SOURCE changes. Only the parts of the client affected "
+    "by a change are rendered and formatted again.",
+)
 @click.version_option(version=__version__)
 def main(
     source: str,
@@ -62,24 +207,164 @@ def main(
     custom_template_path: Optional[str] = None,
     pydantic_version: PydanticVersion = PydanticVersion.V2,
     formatter: Formatter = Formatter.BLACK,
+    include_tags: Tuple[str, ...] = (),
+    include_operations: Tuple[str, ...] = (),
+    include_paths: Tuple[str, ...] = (),
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: int = 1,
+    render_workers: int = 1,
+    check: bool = False,
+    targets: Tuple[str, ...] = (),
+    compile_bytecode: bool = False,
+    invalidation_mode: str = "timestamp",
+    watch: bool = False,
 ) -> None:
     """
     Generate Python code from an OpenAPI 3.0+ specification.
 
     Provide a SOURCE (file or URL) containing the OpenAPI 3.0+ specification and
-    an OUTPUT path, where the resulting client is created.
+    an OUTPUT path, where the resulting client is created. If OUTPUT ends in
+    .whl (named NAME-VERSION-py3-none-any.whl) or .zip, the client is written
+    into an archive instead.
+
+    Operations can be restricted with --include-tags, --include-operations and
+    --include-paths. An operation is generated if it matches any of them.
     """
-    generate_data(
-        source,
-        output,
-        library if library is not None else HTTPLibrary.httpx,
-        env_token_name,
-        use_orjson,
-        custom_template_path,
-        pydantic_version,
-        formatter,
+    if output.endswith((".whl", ".zip")) and (check or watch or targets):
+        raise click.UsageError(
+            "An archive OUTPUT can't be combined with --check, --watch or --target."
+        )
+
+    context = click.get_current_context()
+    if (trust_spec or lazy_components) and context.get_parameter_source(
+        "validation_workers"
+    ) != ParameterSource.DEFAULT:
+        raise click.UsageError(
+            "--validation-workers can't be combined with --trust-spec or --lazy-components."
+        )
+
+    if watch:
+        invalidation_mode_set = (
+            context.get_parameter_source("invalidation_mode") != ParameterSource.DEFAULT
+        )
+        if (
+            check
+            or deduplicate_models
+            or targets
+            or compile_bytecode
+            or invalidation_mode_set
+        ):
+            raise click.UsageError(
+                "--watch can't be combined with --check, --deduplicate-models, --target, --compile or "
+                "--invalidation-mode."
+            )
+        if source.startswith("http://") or source.startswith("https://"):
+            raise click.UsageError("--watch requires SOURCE to be a local file.")
+
+        from openapi_python_generator.models import OperationFilter
+        from openapi_python_generator.watch import Watcher
+
+        Watcher(
+            source,
+            output,
+            library if library is not None else HTTPLibrary.httpx,
+            env_token_name,
+            use_orjson,
+            custom_template_path,
+            pydantic_version,
+            formatter,
+            OperationFilter(
+                include_tags=list(include_tags),
+                include_operations=list(include_operations),
+                include_paths=list(include_paths),
+            ),
+            service_split,
+            max_operations_per_service,
+            enum_strategy,
+            trust_spec,
+            lazy_components,
+            validation_workers or None,
+            render_workers or None,
+        ).run()
+        return  # pragma: no cover
+
+    # Imported here, so --help and --version don't pay for importing the generator.
+    from py_compile import PycInvalidationMode
+
+    from openapi_python_generator.generate_data import (
+        generate_data,
+        generate_data_targets,
     )
 
+    pyc_invalidation_mode = PycInvalidationMode[
+        invalidation_mode.upper().replace("-", "_")
+    ]
+    if targets:
+        # The targets are rendered in parallel, unless the number of workers is set.
+        render_workers_set = (
+            context.get_parameter_source("render_workers") != ParameterSource.DEFAULT
+        )
+        outdated = generate_data_targets(
+            source,
+            [_parse_target(target, output) for target in targets],
+            env_token_name,
+            use_orjson,
+            custom_template_path,
+            formatter,
+            list(include_tags),
+            list(include_operations),
+            list(include_paths),
+            check,
+            service_split=service_split,
+            max_operations_per_service=max_operations_per_service,
+            deduplicate_models=deduplicate_models,
+            enum_strategy=enum_strategy,
+            trust_spec=trust_spec,
+            lazy_components=lazy_components,
+            validation_workers=validation_workers or None,
+            render_workers=render_workers or None if render_workers_set else None,
+            compile_bytecode=compile_bytecode,
+            invalidation_mode=pyc_invalidation_mode,
+        )
+    else:
+        outdated = generate_data(
+            source,
+            output,
+            library if library is not None else HTTPLibrary.httpx,
+            env_token_name,
+            use_orjson,
+            custom_template_path,
+            pydantic_version,
+            formatter,
+            list(include_tags),
+            list(include_operations),
+            list(include_paths),
+            check,
+            compile_bytecode,
+            pyc_invalidation_mode,
+            service_split,
+            max_operations_per_service,
+            deduplicate_models,
+            enum_strategy,
+            trust_spec,
+            lazy_components,
+            validation_workers or None,
+            render_workers or None,
+        )
+
+    if check:
+        if outdated:
+            click.echo(f"The client in {output} is out of date:")
+            for file in outdated:
+                click.echo(f"  {file}")
+            sys.exit(1)
+        click.echo(f"The client in {output} is up to date.")
+
 
 if __name__ == "__main__":  # pragma: no cover
     main()
@@ -0,0 +1,194 @@
+"""
+Output of a generated client as a wheel or zip archive, without writing the individual files to disk.
+"""
+
+import base64
+import hashlib
+import importlib.util
+import marshal
+import os
+import re
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from openapi_python_generator import __version__
+from openapi_python_generator.common import HTTPLibrary, PydanticVersion
+
+ARCHIVE_SUFFIXES = (".whl", ".zip")
+
+# Fixed timestamp (the earliest zip supports), so archives only differ if their content does.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+WHEEL_NAME = re.compile(
+    r"^(?P<name>[A-Za-z_][A-Za-z0-9_]*)-(?P<version>[^-]+)-py3-none-any\.whl$"
+)
+
+
+def is_archive(output: Union[str, Path]) -> bool:
+    """
+    Checks if the output path denotes an archive instead of a folder.
+    :param output: The output path.
+    :return: True if the path ends in .whl or .zip.
+    """
+    return Path(output).suffix in ARCHIVE_SUFFIXES
+
+
+def parse_wheel_name(output: Union[str, Path]) -> Tuple[str, str]:
+    """
+    Extracts the package name and version from a wheel file name of the form NAME-VERSION-py3-none-any.whl.
+    :param output: Path to the wheel.
+    :return: Tuple of the name, which is also the name of the generated package, and the version.
+    """
+    match = WHEEL_NAME.match(Path(output).name)
+    if match is None:
+        raise ValueError(
+            f"{Path(output).name} is not a valid wheel name. Use NAME-VERSION-py3-none-any.whl, where NAME is "
+            "a valid Python identifier."
+        )
+    return match.group("name"), match.group("version")
+
+
+def compile_source(source: str, filename: str) -> bytes:
+    """
+    Compiles a module to the content of an unchecked hash-based .pyc file (PEP 552). The interpreter
+    loads such files without looking at the source's modification time, which is meaningless inside an archive.
+    :param source: The source of the module.
+    :param filename: The file name recorded in the code object.
+    :return: The content of the .pyc file.
+    """
+    data = source.encode("utf-8")
+    code = compile(data, filename, "exec", dont_inherit=True)
+    return (
+        importlib.util.MAGIC_NUMBER
+        + (0b01).to_bytes(4, "little")
+        + importlib.util.source_hash(data)
+        + marshal.dumps(code)
+    )
+
+
+def requirements(
+    library: HTTPLibrary, pydantic_version: PydanticVersion, use_orjson: bool
+) -> List[str]:
+    """
+    The dependencies of a generated client.
+    """
+    dependencies = [
+        library.value,
+        "pydantic>=2" if pydantic_version == PydanticVersion.V2 else "pydantic<2",
+    ]
+    if use_orjson:
+        dependencies.append("orjson")
+    return dependencies
+
+
+def _archive_files(
+    files: Dict[str, str], package: str, compile_bytecode: bool, wheel: bool
+) -> Iterable[Tuple[str, bytes]]:
+    """
+    The entries of the client package within the archive, sorted by their path. Bytecode of a wheel goes to
+    __pycache__, where the interpreter looks for it once the wheel is installed. zipimport only looks for .pyc
+    files next to the sources, so that's where they go in a zip archive.
+    """
+    for relative in sorted(files):
+        path = f"{package}/{relative}"
+        yield path, files[relative].encode("utf-8")
+        if compile_bytecode:
+            pyc_path = (
+                Path(importlib.util.cache_from_source(path)).as_posix()
+                if wheel
+                else path[: -len(".py")] + ".pyc"
+            )
+            yield pyc_path, compile_source(files[relative], path)
+
+
+def _record_hash(data: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+    return f"sha256={digest.decode('ascii')}"
+
+
+def _write_entry(archive: zipfile.ZipFile, path: str, data: bytes) -> None:
+    info = zipfile.ZipInfo(path, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data)
+
+
+def write_archive(
+    files: Dict[str, str],
+    output: Union[str, Path],
+    compile_bytecode: bool = False,
+    dependencies: Optional[List[str]] = None,
+) -> None:
+    """
+    Writes the rendered files of a client into a wheel or zip archive, depending on the suffix of output. The
+    files are streamed into the archive, which is written next to its destination and then moved into place.
+
+    A zip archive contains the client as a package named after the archive. A wheel must be named
+    NAME-VERSION-py3-none-any.whl; it contains the client as package NAME, together with the metadata and the
+    RECORD of the wheel.
+    :param files: Mapping of the relative path to the content, as returned by render_files.
+    :param output: Path to the archive.
+    :param compile_bytecode: Add a .pyc file for every module, compiled for the running interpreter.
+    :param dependencies: Requirements written into the metadata of a wheel.
+    """
+    output_path = Path(output)
+    if output_path.suffix == ".whl":
+        package, version = parse_wheel_name(output_path)
+    else:
+        package, version = output_path.stem, None
+    if not package.isidentifier():
+        raise ValueError(f"{package} is not a valid package name.")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staged = tempfile.mkstemp(
+        prefix=f".{output_path.name}-", dir=output_path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w") as archive:
+            record = []
+            for path, data in _archive_files(
+                files, package, compile_bytecode, version is not None
+            ):
+                _write_entry(archive, path, data)
+                record.append(f"{path},{_record_hash(data)},{len(data)}")
+
+            if version is not None:
+                dist_info = f"{package}-{version}.dist-info"
+                metadata = {
+                    "METADATA": "".join(
+                        [
+                            "Metadata-Version: 2.1\n",
+                            f"Name: {package}\n",
+                            f"Version: {version}\n",
+                        ]
+                        + [
+                            f"Requires-Dist: {dependency}\n"
+                            for dependency in dependencies or []
+                        ]
+                    ),
+                    "WHEEL": (
+                        "Wheel-Version: 1.0\n"
+                        f"Generator: openapi-python-generator ({__version__})\n"
+                        "Root-Is-Purelib: true\n"
+                        "Tag: py3-none-any\n"
+                    ),
+                    "top_level.txt": f"{package}\n",
+                }
+                for name, content in metadata.items():
+                    data = content.encode("utf-8")
+                    _write_entry(archive, f"{dist_info}/{name}", data)
+                    record.append(
+                        f"{dist_info}/{name},{_record_hash(data)},{len(data)}"
+                    )
+                record.append(f"{dist_info}/RECORD,,")
+                _write_entry(
+                    archive,
+                    f"{dist_info}/RECORD",
+                    "".join(f"{line}\n" for line in record).encode("utf-8"),
+                )
+        os.replace(staged, output_path)
+    finally:
+        if os.path.exists(staged):
+            os.unlink(staged)
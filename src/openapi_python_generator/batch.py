@@ -0,0 +1,196 @@
+"""
+Generation of many clients in one invocation, spread over a pool of worker processes.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+
+import click
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from openapi_python_generator.common import (
+    EnumStrategy,
+    Formatter,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+)
+
+
+class BatchEntry(BaseModel):
+    """
+    A single client to generate. The options match the ones of generate_data.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    source: str
+    output: str
+    library: HTTPLibrary = HTTPLibrary.httpx
+    env_token_name: Optional[str] = None
+    use_orjson: bool = False
+    custom_template_path: Optional[str] = None
+    pydantic_version: PydanticVersion = PydanticVersion.V2
+    formatter: Formatter = Formatter.BLACK
+    include_tags: List[str] = []
+    include_operations: List[str] = []
+    include_paths: List[str] = []
+    compile_bytecode: bool = False
+    service_split: ServiceSplit = ServiceSplit.TAG
+    max_operations_per_service: Optional[int] = None
+    deduplicate_models: bool = False
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO
+    trust_spec: bool = False
+    lazy_components: bool = False
+    validation_workers: Optional[int] = 1
+    render_workers: Optional[int] = 1
+
+
+class BatchConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    workers: Optional[int] = None
+    specs: List[BatchEntry]
+
+
+class BatchResult(BaseModel):
+    source: str
+    output: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def load_batch_config(path: Union[str, Path]) -> BatchConfig:
+    """
+    Loads a batch configuration from a JSON or YAML file. Relative sources, outputs and template paths are
+    resolved against the folder of the configuration file.
+    :param path: Path to the configuration file.
+    :return: The parsed configuration.
+    :raises ValidationError: If the configuration is invalid, e.g. not a mapping.
+    """
+    path = Path(path)
+    content = path.read_text()
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        import yaml  # type: ignore
+
+        data = yaml.safe_load(content)
+
+    config = BatchConfig.model_validate(data)
+    base = path.parent
+    for entry in config.specs:
+        if not entry.source.startswith(("http://", "https://")):
+            entry.source = str(base / entry.source)
+        entry.output = str(base / entry.output)
+        if entry.custom_template_path is not None:
+            entry.custom_template_path = str(base / entry.custom_template_path)
+    return config
+
+
+def _initialize_worker() -> None:
+    """
+    Pays the import and template setup cost once per worker process instead of once per specification.
+    """
+    import black  # noqa: F401
+    import isort  # noqa: F401
+
+    from openapi_python_generator import generate_data  # noqa: F401
+    from openapi_python_generator.language_converters.python.jinja_config import (
+        TEMPLATE_PATH,
+        create_jinja_env,
+    )
+
+    env = create_jinja_env()
+    for template in TEMPLATE_PATH.glob("*.jinja2"):
+        env.get_template(template.name)
+
+
+def _generate_entry(entry: BatchEntry) -> BatchResult:
+    """
+    Generates a single client and measures the time it takes.
+    :param entry: The client to generate.
+    :return: The timing, and the error if the generation failed.
+    """
+    from openapi_python_generator.generate_data import generate_data
+
+    start = time.perf_counter()
+    error = None
+    try:
+        generate_data(**entry.model_dump())
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return BatchResult(
+        source=entry.source,
+        output=entry.output,
+        seconds=time.perf_counter() - start,
+        error=error,
+    )
+
+
+def generate_batch(
+    config: Union[str, Path, BatchConfig], workers: Optional[int] = None
+) -> List[BatchResult]:
+    """
+    Generates all clients of a batch configuration. The specifications are distributed over a pool of worker
+    processes, each of which imports the formatters and compiles the templates only once.
+    :param config: The configuration, or the path to a JSON/YAML file containing it.
+    :param workers: Number of worker processes. Overrides the configuration; defaults to the number of CPUs.
+        With a single worker, everything runs in the current process.
+    :return: One result per specification, in the order of the configuration.
+    """
+    if not isinstance(config, BatchConfig):
+        config = load_batch_config(config)
+    workers = workers if workers is not None else config.workers
+
+    if workers == 1 or len(config.specs) <= 1:
+        _initialize_worker()
+        return [_generate_entry(entry) for entry in config.specs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize_worker
+    ) as executor:
+        return list(executor.map(_generate_entry, config.specs))
+
+
+@click.command()
+@click.argument("config", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes. Defaults to the value in CONFIG, or the number of CPUs.",
+)
+def main(config: str, workers: Optional[int] = None) -> None:
+    """
+    Generate several Python clients from the OpenAPI 3.0+ specifications listed in CONFIG.
+
+    CONFIG is a JSON or YAML file with a "specs" list. Every entry needs a
+    "source" and an "output" and accepts the options of openapi-python-generator
+    (library, pydantic_version, formatter, ...).
+    """
+    start = time.perf_counter()
+    try:
+        batch_config = load_batch_config(config)
+    except ValidationError as e:
+        raise click.BadParameter(
+            f"{config} is not a valid batch configuration:\n{e}", param_hint="CONFIG"
+        ) from None
+    results = generate_batch(batch_config, workers)
+
+    for result in results:
+        status = "ok" if result.error is None else f"failed ({result.error})"
+        click.echo(
+            f"{result.seconds:8.2f}s  {result.source} -> {result.output}: {status}"
+        )
+    click.echo(f"{time.perf_counter() - start:8.2f}s  total")
+
+    if any(result.error is not None for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,7 +1,8 @@
 from enum import Enum
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from openapi_python_generator.models import LibraryConfig
+if TYPE_CHECKING:  # pragma: no cover
+    from openapi_python_generator.models import LibraryConfig
 
 
 class HTTPLibrary(str, Enum):
@@ -19,6 +20,28 @@ class PydanticVersion(str, Enum):
     V2 = "v2"
 
 
+class ServiceSplit(str, Enum):
+    """
+    Enum for the available strategies to distribute operations over service modules.
+    """
+
+    TAG = "tag"
+    PATH = "path"
+
+
+class EnumStrategy(str, Enum):
+    """
+    Enum for the available ways to generate enum schemas. AUTO picks one by the number of values, see
+    model_generator.enum_strategy.
+    """
+
+    AUTO = "auto"
+    ENUM = "enum"
+    LITERAL = "literal"
+    LAZY = "lazy"
+    FROZENSET = "frozenset"
+
+
 class Formatter(str, Enum):
     """
     Enum for the available code formatters.
@@ -33,26 +56,41 @@ class FormatOptions:
     line_length: int = 120
 
 
-library_config_dict: Dict[Optional[HTTPLibrary], LibraryConfig] = {
-    HTTPLibrary.httpx: LibraryConfig(
-        name="httpx",
-        library_name="httpx",
-        template_name="httpx.jinja2",
-        include_async=True,
-        include_sync=True,
-    ),
-    HTTPLibrary.requests: LibraryConfig(
-        name="requests",
-        library_name="requests",
-        template_name="requests.jinja2",
-        include_async=False,
-        include_sync=True,
-    ),
-    HTTPLibrary.aiohttp: LibraryConfig(
-        name="aiohttp",
-        library_name="aiohttp",
-        template_name="aiohttp.jinja2",
-        include_async=True,
-        include_sync=False,
-    ),
-}
+def _create_library_config_dict() -> Dict[Optional[HTTPLibrary], "LibraryConfig"]:
+    from openapi_python_generator.models import LibraryConfig
+
+    return {
+        HTTPLibrary.httpx: LibraryConfig(
+            name="httpx",
+            library_name="httpx",
+            template_name="httpx.jinja2",
+            include_async=True,
+            include_sync=True,
+        ),
+        HTTPLibrary.requests: LibraryConfig(
+            name="requests",
+            library_name="requests",
+            template_name="requests.jinja2",
+            include_async=False,
+            include_sync=True,
+        ),
+        HTTPLibrary.aiohttp: LibraryConfig(
+            name="aiohttp",
+            library_name="aiohttp",
+            template_name="aiohttp.jinja2",
+            include_async=True,
+            include_sync=False,
+        ),
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """
+    library_config_dict is only built on first access. Building it imports pydantic and the OpenAPI models,
+    which the enums of this module (used e.g. by the CLI) don't need.
+    """
+    if name == "library_config_dict":
+        value = _create_library_config_dict()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,48 +1,108 @@
+import importlib.util
+import itertools
+import os
+import py_compile
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from py_compile import PycInvalidationMode
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import black
 import click
-import httpx
-import isort
 import orjson
-import yaml  # type: ignore
-from black.report import NothingChanged  # type: ignore
-from httpx import ConnectError, ConnectTimeout
 from pydantic import ValidationError
 
-from .common import FormatOptions, Formatter, HTTPLibrary, PydanticVersion
-from .language_converters.python.jinja_config import SERVICE_TEMPLATE, create_jinja_env
-from .models import ConversionResult
+from .archive import is_archive, requirements, write_archive
+from .common import (
+    EnumStrategy,
+    FormatOptions,
+    Formatter,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+    library_config_dict,
+)
+from .language_converters.python.generator import OpenAPISpec, generate_targets
+from .language_converters.python.imports import with_imports
+from .language_converters.python.jinja_config import (
+    MODELS_INIT_TEMPLATE,
+    PACKAGE_INIT_TEMPLATE,
+    SERVICE_TEMPLATE,
+    SERVICES_INIT_TEMPLATE,
+    create_jinja_env,
+)
+from .models import (
+    ConversionResult,
+    GenerationContext,
+    GenerationTarget,
+    OperationFilter,
+)
 from .parsers import (
     generate_code_3_0,
     generate_code_3_1,
     parse_openapi_3_0,
     parse_openapi_3_1,
 )
-from .version_detector import detect_openapi_version
+from .parsers.sharded import json_pointer
+from .version_detector import OpenAPIVersion, detect_openapi_version
 
+GENERATED_PACKAGES = ("models", "services")
 
-def write_code(path: Path, content: str, formatter: Formatter) -> None:
+
+def format_code(content: str, formatter: Formatter) -> str:
     """
-    Write the content to the file at the given path.
-    :param path: The path to the file.
-    :param content: The content to write.
-    :param formatter: The formatter applied to the code written.
+    Format the content with the given formatter.
+    :param content: The code to format.
+    :param formatter: The formatter applied to the code.
+    :return: The formatted code.
     """
     if formatter == Formatter.BLACK:
-        formatted_contend = format_using_black(content)
+        return format_using_black(content)
     elif formatter == Formatter.NONE:
-        formatted_contend = content
+        return content
     else:
         raise NotImplementedError(
             f"Missing implementation for formatter {formatter!r}."
         )
-    with open(path, "w") as f:
-        f.write(formatted_contend)
+
+
+def format_sources(
+    contents: List[str], formatter: Formatter, workers: Optional[int] = 1
+) -> List[str]:
+    """
+    Format many sources. Identical sources are only formatted once, and with more than one worker the
+    formatting is distributed over a pool of processes.
+    :param contents: The code to format.
+    :param formatter: The formatter applied to the code.
+    :param workers: Number of worker processes, None for one per CPU. With one worker, everything is
+        formatted in the current process.
+    :return: The formatted code, in the order of contents.
+    """
+    unique = list(dict.fromkeys(contents))
+    if formatter == Formatter.NONE or workers == 1 or len(unique) <= 1:
+        formatted = [format_code(content, formatter) for content in unique]
+    else:
+        workers = workers if workers is not None else os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            formatted = list(
+                executor.map(
+                    format_code,
+                    unique,
+                    itertools.repeat(formatter),
+                    chunksize=max(1, len(unique) // (workers * 4)),
+                )
+            )
+    lookup = dict(zip(unique, formatted))
+    return [lookup[content] for content in contents]
 
 
 def format_using_black(content: str) -> str:
+    # black and isort are only imported when formatting, as importing them is expensive.
+    import black
+    import isort
+    from black.report import NothingChanged  # type: ignore
+
     try:
         formatted_contend = black.format_file_contents(
             content,
@@ -54,7 +114,101 @@ def format_using_black(content: str) -> str:
     return isort.code(formatted_contend, line_length=FormatOptions.line_length)
 
 
-def get_open_api(source: Union[str, Path]):
+def load_spec(source: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Fetches the openapi specification file from the web or loads it from a local file, without validating it.
+    Supports both JSON and YAML formats.
+
+    Args:
+        source: URL or file path to the OpenAPI specification
+
+    Returns:
+        dict: The raw specification data
+    """
+    # Handle remote files
+    if not isinstance(source, Path) and (
+        source.startswith("http://") or source.startswith("https://")
+    ):
+        import httpx
+
+        try:
+            content = httpx.get(source).text
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            click.echo(f"Could not connect to {source}.")
+            raise httpx.ConnectError(f"Could not connect to {source}.") from None
+        # Try JSON first, then YAML for remote files
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            import yaml  # type: ignore
+
+            return yaml.safe_load(content)
+
+    # Handle local files
+    with open(source, "r") as f:
+        file_content = f.read()
+
+        # Try JSON first
+        try:
+            return orjson.loads(file_content)
+        except orjson.JSONDecodeError:
+            # If JSON fails, try YAML
+            import yaml  # type: ignore
+
+            try:
+                return yaml.safe_load(file_content)
+            except yaml.YAMLError as e:
+                click.echo(
+                    f"File {source} is neither a valid JSON nor YAML file: {str(e)}"
+                )
+                raise
+
+
+def parse_spec(
+    data: Dict[str, Any],
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+) -> Tuple[OpenAPISpec, OpenAPIVersion]:
+    """
+    Detects the version of the raw specification data and parses it with the according parser.
+
+    Args:
+        data: The raw specification data
+        trust_spec: Skip the validation of a specification that is known to be valid, see construct_model
+        lazy_components: Parse the entries of the components only on first access, see
+            parse_with_lazy_components. The result is meant for the generator: call parse_all_components
+            before serializing it.
+        validation_workers: Number of processes validating the paths and components, see parse_sharded
+
+    Returns:
+        tuple: (OpenAPI object, version) where version is "3.0" or "3.1"
+    """
+    version = detect_openapi_version(data)
+
+    if version == "3.0":
+        openapi_obj = parse_openapi_3_0(
+            data, trust_spec, lazy_components, validation_workers
+        )  # type: ignore[assignment]
+    elif version == "3.1":
+        openapi_obj = parse_openapi_3_1(
+            data, trust_spec, lazy_components, validation_workers
+        )  # type: ignore[assignment]
+    else:
+        # Unsupported version detected (version detection already limited to 3.0 / 3.1)
+        raise ValueError(
+            f"Unsupported OpenAPI version: {version}. Only 3.0.x and 3.1.x are supported."
+        )
+
+    return openapi_obj, version
+
+
+def get_open_api(
+    source: Union[str, Path],
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+):
     """
     Tries to fetch the openapi specification file from the web or load from a local file.
     Supports both JSON and YAML formats. Returns the according OpenAPI object.
@@ -62,6 +216,11 @@ def get_open_api(source: Union[str, Path]):
 
     Args:
         source: URL or file path to the OpenAPI specification
+        trust_spec: Skip the validation of a specification that is known to be valid, see construct_model
+        lazy_components: Parse the entries of the components only on first access, see
+            parse_with_lazy_components. The result is meant for the generator: call parse_all_components
+            before serializing it.
+        validation_workers: Number of processes validating the paths and components, see parse_sharded
 
     Returns:
         tuple: (OpenAPI object, version) where version is "3.0" or "3.1"
@@ -73,126 +232,362 @@ def get_open_api(source: Union[str, Path]):
         JSONDecodeError/YAMLError: If the file cannot be parsed
     """
     try:
-        # Handle remote files
-        if not isinstance(source, Path) and (
-            source.startswith("http://") or source.startswith("https://")
-        ):
-            content = httpx.get(source).text
-            # Try JSON first, then YAML for remote files
-            try:
-                data = orjson.loads(content)
-            except orjson.JSONDecodeError:
-                data = yaml.safe_load(content)
-        else:
-            # Handle local files
-            with open(source, "r") as f:
-                file_content = f.read()
-
-                # Try JSON first
-                try:
-                    data = orjson.loads(file_content)
-                except orjson.JSONDecodeError:
-                    # If JSON fails, try YAML
-                    try:
-                        data = yaml.safe_load(file_content)
-                    except yaml.YAMLError as e:
-                        click.echo(
-                            f"File {source} is neither a valid JSON nor YAML file: {str(e)}"
-                        )
-                        raise
-
-        # Detect version and parse with appropriate parser
-        version = detect_openapi_version(data)
-
-        if version == "3.0":
-            openapi_obj = parse_openapi_3_0(data)  # type: ignore[assignment]
-        elif version == "3.1":
-            openapi_obj = parse_openapi_3_1(data)  # type: ignore[assignment]
-        else:
-            # Unsupported version detected (version detection already limited to 3.0 / 3.1)
-            raise ValueError(
-                f"Unsupported OpenAPI version: {version}. Only 3.0.x and 3.1.x are supported."
-            )
-
-        return openapi_obj, version
-
+        return parse_spec(
+            load_spec(source), trust_spec, lazy_components, validation_workers
+        )
     except FileNotFoundError:
         click.echo(
             f"File {source} not found. Please make sure to pass the path to the OpenAPI specification."
         )
         raise
-    except (ConnectError, ConnectTimeout):
-        click.echo(f"Could not connect to {source}.")
-        raise ConnectError(f"Could not connect to {source}.") from None
-    except ValidationError:
-        click.echo(f"File {source} is not a valid OpenAPI 3.0+ specification.")
+    except ValidationError as e:
+        click.echo(f"File {source} is not a valid OpenAPI 3.0+ specification:")
+        for error in e.errors():
+            click.echo(f"  {json_pointer(error['loc'])}: {error['msg']}")
         raise
 
 
-def write_data(
-    data: ConversionResult, output: Union[str, Path], formatter: Formatter
-) -> None:
+def render_sources(data: ConversionResult) -> Dict[str, str]:
     """
-    This function will firstly create the folder structure of output, if it doesn't exist. Then it will create the
-    models from data.models into the models sub module of the output folder. After this, the services will be created
-    into the services sub module of the output folder.
-    :param data: The data to write.
-    :param output: The path to the output folder.
-    :param formatter: The formatter applied to the code written.
+    Renders all files of the client in memory, without formatting them.
+    :param data: The data to render.
+    :return: Mapping of the path relative to the output folder (using "/" as separator) to the file content.
     """
+    files: Dict[str, str] = {}
+    jinja_env = create_jinja_env(
+        GenerationContext(
+            custom_template_path=data.custom_template_path, formats=data.formats
+        )
+    )
+    model_names = [model.file_name for model in data.models]
 
-    # Create the folder structure of the output folder.
-    Path(output).mkdir(parents=True, exist_ok=True)
-
-    # Create the models module.
-    models_path = Path(output) / "models"
-    models_path.mkdir(parents=True, exist_ok=True)
-
-    # Create the services module.
-    services_path = Path(output) / "services"
-    services_path.mkdir(parents=True, exist_ok=True)
-
-    files: List[str] = []
-
-    # Write the models.
+    # The models, and models.__init__.py importing them lazily.
     for model in data.models:
-        files.append(model.file_name)
-        write_code(models_path / f"{model.file_name}.py", model.content, formatter)
-
-    # Create models.__init__.py file containing imports to all models.
-    write_code(
-        models_path / "__init__.py",
-        "\n".join([f"from .{file} import *" for file in files]),
-        formatter,
+        files[f"models/{model.file_name}.py"] = model.content
+    files["models/__init__.py"] = jinja_env.get_template(MODELS_INIT_TEMPLATE).render(
+        models=model_names, aliases=sorted(data.model_aliases.items())
     )
 
-    files = []
-
-    # Write the services.
-    jinja_env = create_jinja_env()
+    # The services, importing only the models they use, and services.__init__.py indexing their operations.
+    operations: Dict[bool, Dict[str, str]] = {False: {}, True: {}}
     for service in data.services:
         if len(service.operations) == 0:
             continue
-        files.append(service.file_name)
-        write_code(
-            services_path / f"{service.file_name}.py",
+        files[f"services/{service.file_name}.py"] = with_imports(
             jinja_env.get_template(SERVICE_TEMPLATE).render(**service.model_dump()),
-            formatter,
+            model_names,
+            "..models",
+            data.formats,
         )
+        for operation in service.operations:
+            operations[bool(service.async_client)][
+                operation.operation_id
+            ] = service.file_name
+    files["services/__init__.py"] = jinja_env.get_template(
+        SERVICES_INIT_TEMPLATE
+    ).render(
+        operations=sorted(operations[False].items()),
+        async_operations=sorted(operations[True].items()),
+    )
+
+    files["api_config.py"] = data.api_config.content
+    files["__init__.py"] = jinja_env.get_template(PACKAGE_INIT_TEMPLATE).render(
+        models=model_names + sorted(data.model_aliases)
+    )
+    return files
 
-    # Create services.__init__.py file containing imports to all services.
-    write_code(services_path / "__init__.py", "", formatter)
 
-    # Write the api_config.py file.
-    write_code(Path(output) / "api_config.py", data.api_config.content, formatter)
+def render_files(
+    data: ConversionResult, formatter: Formatter, workers: Optional[int] = 1
+) -> Dict[str, str]:
+    """
+    Renders all files of the client in memory and formats them.
+    :param data: The data to render.
+    :param formatter: The formatter applied to the code.
+    :param workers: Number of processes used for formatting, see format_sources.
+    :return: Mapping of the path relative to the output folder (using "/" as separator) to the file content.
+    """
+    sources = render_sources(data)
+    return dict(
+        zip(sources, format_sources(list(sources.values()), formatter, workers))
+    )
 
-    # Write the __init__.py file.
-    write_code(
-        Path(output) / "__init__.py",
-        "from .models import *\nfrom .services import *\nfrom .api_config import *",
-        formatter,
+
+def generate_sources(
+    spec: Union[Dict[str, Any], OpenAPISpec],
+    library: HTTPLibrary = HTTPLibrary.httpx,
+    env_token_name: Optional[str] = None,
+    use_orjson: bool = False,
+    custom_template_path: Optional[str] = None,
+    pydantic_version: PydanticVersion = PydanticVersion.V2,
+    formatter: Formatter = Formatter.BLACK,
+    include_tags: Optional[List[str]] = None,
+    include_operations: Optional[List[str]] = None,
+    include_paths: Optional[List[str]] = None,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    workers: Optional[int] = 1,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+    render_workers: Optional[int] = 1,
+) -> Dict[str, str]:
+    """
+    Generate a client from an OpenAPI 3.0+ specification that is already in memory, and return its files
+    instead of writing them. Nothing is read from or written to disk, apart from custom templates.
+
+    The options behave like the ones of generate_data.
+    :param spec: The raw specification data, or an already parsed OpenAPI object.
+    :param workers: Number of processes used for formatting, see format_sources.
+    :return: Mapping of the path relative to the client folder (using "/" as separator) to the formatted file
+        content.
+    """
+    openapi_obj = (
+        parse_spec(spec, trust_spec, lazy_components, validation_workers)[0]
+        if isinstance(spec, dict)
+        else spec
     )
 
+    result = generate_targets(
+        openapi_obj,
+        [(library_config_dict[library], pydantic_version)],
+        env_token_name,
+        use_orjson,
+        custom_template_path,
+        OperationFilter(
+            include_tags=include_tags or [],
+            include_operations=include_operations or [],
+            include_paths=include_paths or [],
+        ),
+        service_split,
+        max_operations_per_service,
+        deduplicate_models,
+        enum_strategy,
+        render_workers,
+    )[0]
+    return render_files(result, formatter, workers)
+
+
+def _read_existing(path: Path) -> Optional[str]:
+    """
+    Reads the current content of a file.
+    :param path: The path to the file.
+    :return: The content, or None if the file doesn't exist or can't be read.
+    """
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except (FileNotFoundError, IsADirectoryError, UnicodeDecodeError):
+        return None
+
+
+def stale_files(files: Dict[str, str], output: Union[str, Path]) -> List[str]:
+    """
+    Finds previously generated modules in the output folder which are not part of the rendered files anymore,
+    e.g. because a schema or tag was removed from the specification.
+    :param files: The rendered files, as returned by render_files.
+    :param output: The path to the output folder.
+    :return: Paths relative to the output folder of the stale modules.
+    """
+    stale = []
+    for package in GENERATED_PACKAGES:
+        package_path = Path(output) / package
+        if not package_path.is_dir():
+            continue
+        for path in sorted(package_path.glob("*.py")):
+            relative = f"{package}/{path.name}"
+            if relative not in files:
+                stale.append(relative)
+    return stale
+
+
+def changed_files(files: Dict[str, str], output: Union[str, Path]) -> List[str]:
+    """
+    Finds the rendered files whose content differs from the file in the output folder, or which don't exist yet.
+    Files with a different size are detected from their metadata alone, without reading them.
+    :param files: The rendered files, as returned by render_files.
+    :param output: The path to the output folder.
+    :return: Relative paths of the changed files.
+    """
+    changed = []
+    for relative, content in files.items():
+        path = Path(output) / relative
+        encoded = content.encode("utf-8")
+        try:
+            if path.stat().st_size == len(encoded) and path.read_bytes() == encoded:
+                continue
+        except OSError:
+            pass
+        changed.append(relative)
+    return changed
+
+
+def check_files(files: Dict[str, str], output: Union[str, Path]) -> List[str]:
+    """
+    Compares the rendered files against the output folder without writing anything.
+    :param files: The rendered files, as returned by render_files.
+    :param output: The path to the output folder.
+    :return: Sorted relative paths of all files which are out of date, missing or stale.
+    """
+    return sorted(changed_files(files, output) + stale_files(files, output))
+
+
+def write_files(files: Dict[str, str], output: Union[str, Path]) -> List[str]:
+    """
+    Writes the rendered files to the output folder. Files whose content didn't change are not touched, so
+    __pycache__ stays valid and file watchers aren't triggered. Changed files are first written to a staging
+    folder next to the output folder and then moved into place with atomic renames, so a reader never sees a
+    half-written file. Afterwards, stale modules of the generated packages are deleted.
+    :param files: Mapping of the relative path to the content, as returned by render_files.
+    :param output: The path to the output folder.
+    :return: Relative paths of the files which were written.
+    """
+    output_path = Path(output)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    changed = changed_files(files, output_path)
+    stale = stale_files(files, output_path)
+
+    # Hash-based .pyc files aren't necessarily checked against their source, so they are removed with it.
+    for relative in changed + stale:
+        _remove_bytecode(output_path / relative)
+
+    if changed:
+        staging_path = Path(
+            tempfile.mkdtemp(prefix=f".{output_path.name}-", dir=output_path.parent)
+        )
+        try:
+            for relative in changed:
+                staged = staging_path / relative
+                staged.parent.mkdir(parents=True, exist_ok=True)
+                with open(staged, "w", encoding="utf-8") as f:
+                    f.write(files[relative])
+            for relative in changed:
+                target = output_path / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(staging_path / relative, target)
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+    for relative in stale:
+        (output_path / relative).unlink()
+
+    return changed
+
+
+def _remove_bytecode(path: Path) -> None:
+    """
+    Removes the .pyc files of a module for all interpreters.
+    """
+    for pyc in path.parent.glob(f"__pycache__/{path.stem}.*.pyc"):
+        pyc.unlink()
+
+
+def _compile_file(path: str, invalidation_mode: PycInvalidationMode) -> None:
+    py_compile.compile(path, doraise=True, invalidation_mode=invalidation_mode)
+
+
+# The flags in the header of a .pyc file for each invalidation mode, see PEP 552
+_PYC_FLAGS = {
+    PycInvalidationMode.TIMESTAMP: 0b00,
+    PycInvalidationMode.CHECKED_HASH: 0b11,
+    PycInvalidationMode.UNCHECKED_HASH: 0b01,
+}
+
+
+def _bytecode_is_current(path: Path, invalidation_mode: PycInvalidationMode) -> bool:
+    """
+    Checks if a module has a .pyc file for the running interpreter, written with the invalidation mode for
+    the current source of the module.
+    """
+    try:
+        with open(importlib.util.cache_from_source(str(path)), "rb") as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    if (
+        len(header) < 16
+        or header[:4] != importlib.util.MAGIC_NUMBER
+        or int.from_bytes(header[4:8], "little") != _PYC_FLAGS[invalidation_mode]
+    ):
+        return False
+    if invalidation_mode == PycInvalidationMode.TIMESTAMP:
+        stat = path.stat()
+        return (
+            int.from_bytes(header[8:12], "little") == int(stat.st_mtime) & 0xFFFFFFFF
+            and int.from_bytes(header[12:16], "little") == stat.st_size & 0xFFFFFFFF
+        )
+    return header[8:16] == importlib.util.source_hash(path.read_bytes())
+
+
+def compile_files(
+    files: Dict[str, str],
+    output: Union[str, Path],
+    invalidation_mode: PycInvalidationMode = PycInvalidationMode.TIMESTAMP,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Precompiles the written modules of a client into __pycache__, so their first import doesn't have to.
+    Modules that already have a .pyc file for the running interpreter, written with the same invalidation mode
+    for their current source, are skipped. The compilation is distributed over a pool of processes.
+    :param files: The written files, as returned by render_files.
+    :param output: The path to the output folder.
+    :param invalidation_mode: How the interpreter decides if a .pyc file is still valid. UNCHECKED_HASH makes
+        the .pyc files independent of file modification times, e.g. for reproducible container images.
+    :param workers: Number of worker processes, None for one per CPU. With one worker, everything is
+        compiled in the current process.
+    :return: Relative paths of the compiled modules.
+    """
+    output_path = Path(output)
+    pending = [
+        relative
+        for relative in sorted(files)
+        if not _bytecode_is_current(output_path / relative, invalidation_mode)
+    ]
+    paths = [str(output_path / relative) for relative in pending]
+
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            _compile_file(path, invalidation_mode)
+    else:
+        workers = workers if workers is not None else os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(
+                executor.map(
+                    _compile_file,
+                    paths,
+                    itertools.repeat(invalidation_mode),
+                    chunksize=max(1, len(paths) // (workers * 4)),
+                )
+            )
+    return pending
+
+
+def write_data(
+    data: ConversionResult,
+    output: Union[str, Path],
+    formatter: Formatter,
+    compile_bytecode: bool = False,
+    invalidation_mode: PycInvalidationMode = PycInvalidationMode.TIMESTAMP,
+) -> None:
+    """
+    This function will firstly render all files of the client in memory: the models into the models sub module
+    of the output folder, the services into the services sub module, the api_config and the __init__ files.
+    Afterwards, only the files whose content changed are written to the output folder, and modules of schemas or
+    tags which don't exist anymore are removed.
+    :param data: The data to write.
+    :param output: The path to the output folder.
+    :param formatter: The formatter applied to the code written.
+    :param compile_bytecode: Precompile the modules into __pycache__, see compile_files.
+    :param invalidation_mode: The invalidation mode of the precompiled .pyc files.
+    """
+    files = render_files(data, formatter)
+    write_files(files, output)
+    if compile_bytecode:
+        compile_files(files, output, invalidation_mode)
+
 
 def generate_data(
     source: Union[str, Path],
@@ -203,13 +598,71 @@ def generate_data(
     custom_template_path: Optional[str] = None,
     pydantic_version: PydanticVersion = PydanticVersion.V2,
     formatter: Formatter = Formatter.BLACK,
-) -> None:
+    include_tags: Optional[List[str]] = None,
+    include_operations: Optional[List[str]] = None,
+    include_paths: Optional[List[str]] = None,
+    check: bool = False,
+    compile_bytecode: bool = False,
+    invalidation_mode: PycInvalidationMode = PycInvalidationMode.TIMESTAMP,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+    render_workers: Optional[int] = 1,
+) -> Optional[List[str]]:
     """
     Generate Python code from an OpenAPI 3.0+ specification.
+
+    If include_tags, include_operations or include_paths (glob patterns) are given, only the operations matching
+    any of them are generated, together with the models they reference.
+
+    Operations are distributed over service modules by tag or by the first segment of their path
+    (service_split). Modules with more than max_operations_per_service operations are split into numbered
+    modules. services/__init__.py indexes all operations, so a single one can be imported cheaply.
+
+    deduplicate_models merges structurally identical schemas into one model. The names of the others remain
+    importable from the models package as aliases.
+
+    enum_strategy selects how enum schemas are generated. By default, enums with many values are built lazily
+    or validated against a set of their values instead of an Enum class, see model_generator.enum_strategy.
+
+    trust_spec skips the validation of the specification, for specifications that are validated elsewhere. The
+    models are built without validation and only checked for the structure the generators rely on, see
+    construct_model.
+
+    lazy_components parses the entries of the components (schemas, responses, ...) only when the generators
+    first access them, see parse_with_lazy_components. Components that are never reached, e.g. with an
+    operation filter, are neither validated nor built.
+
+    validation_workers validates the path items and the entries of the components in that many processes
+    (None for one per CPU), see parse_sharded. It has no effect with trust_spec or lazy_components.
+    render_workers renders the models and operations in that many processes, see render_jobs. The output
+    doesn't depend on the number of workers.
+
+    With check set, nothing is written. The client is rendered in memory and compared against the output
+    folder instead, and the relative paths of all files that are out of date are returned.
+
+    compile_bytecode precompiles the modules into __pycache__ with the given invalidation mode, see
+    compile_files. If output ends in .whl or .zip, the client is written into an archive instead of a folder,
+    see write_archive, and compile_bytecode adds unchecked hash-based .pyc files to the archive.
     """
-    openapi_obj, version = get_open_api(source)
+    if check and is_archive(output):
+        raise ValueError("Only a client folder can be checked, not an archive.")
+
+    openapi_obj, version = get_open_api(
+        source, trust_spec, lazy_components, validation_workers
+    )
     click.echo(f"Generating data from {source} (OpenAPI {version})")
 
+    operation_filter = OperationFilter(
+        include_tags=include_tags or [],
+        include_operations=include_operations or [],
+        include_paths=include_paths or [],
+    )
+
     # Use version-specific generator
     if version == "3.0":
         result = generate_code_3_0(
@@ -219,6 +672,12 @@ def generate_data(
             use_orjson,
             custom_template_path,
             pydantic_version,
+            operation_filter,
+            service_split,
+            max_operations_per_service,
+            deduplicate_models,
+            enum_strategy,
+            render_workers,
         )
     elif version == "3.1":
         result = generate_code_3_1(
@@ -228,8 +687,113 @@ def generate_data(
             use_orjson,
             custom_template_path,
             pydantic_version,
+            operation_filter,
+            service_split,
+            max_operations_per_service,
+            deduplicate_models,
+            enum_strategy,
+            render_workers,
         )
     else:
         raise ValueError(f"Unsupported OpenAPI version: {version}")
 
-    write_data(result, output, formatter)
+    if check:
+        return check_files(render_files(result, formatter), output)
+
+    if is_archive(output):
+        write_archive(
+            render_files(result, formatter),
+            output,
+            compile_bytecode,
+            requirements(library, pydantic_version, use_orjson),
+        )
+        return None
+
+    write_data(result, output, formatter, compile_bytecode, invalidation_mode)
+    return None
+
+
+def generate_data_targets(
+    source: Union[str, Path],
+    targets: List[GenerationTarget],
+    env_token_name: Optional[str] = None,
+    use_orjson: bool = False,
+    custom_template_path: Optional[str] = None,
+    formatter: Formatter = Formatter.BLACK,
+    include_tags: Optional[List[str]] = None,
+    include_operations: Optional[List[str]] = None,
+    include_paths: Optional[List[str]] = None,
+    check: bool = False,
+    workers: Optional[int] = None,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+    render_workers: Optional[int] = None,
+    compile_bytecode: bool = False,
+    invalidation_mode: PycInvalidationMode = PycInvalidationMode.TIMESTAMP,
+) -> Optional[List[str]]:
+    """
+    Generate several clients, e.g. for different HTTP libraries and pydantic versions, from one OpenAPI 3.0+
+    specification. The specification is loaded and validated once, the analysis of models and operations is
+    shared by all targets, and files that are identical between targets are formatted only once. The models
+    and operations of all targets are rendered concurrently by a pool of render_workers processes (None for
+    one per CPU), see generate_targets. Formatting is distributed over a pool of worker processes, see
+    format_sources.
+
+    The other options behave like the ones of generate_data. With check set, the returned paths are prefixed
+    with the output folder of their target.
+    """
+    openapi_obj, version = get_open_api(
+        source, trust_spec, lazy_components, validation_workers
+    )
+    click.echo(f"Generating data from {source} (OpenAPI {version})")
+
+    results = generate_targets(
+        openapi_obj,
+        [
+            (library_config_dict[target.library], target.pydantic_version)
+            for target in targets
+        ],
+        env_token_name,
+        use_orjson,
+        custom_template_path,
+        OperationFilter(
+            include_tags=include_tags or [],
+            include_operations=include_operations or [],
+            include_paths=include_paths or [],
+        ),
+        service_split,
+        max_operations_per_service,
+        deduplicate_models,
+        enum_strategy,
+        render_workers,
+    )
+
+    sources = [render_sources(result) for result in results]
+    formatted = iter(
+        format_sources(
+            [content for files in sources for content in files.values()],
+            formatter,
+            workers,
+        )
+    )
+    target_files = [
+        {relative: next(formatted) for relative in files} for files in sources
+    ]
+
+    if check:
+        return [
+            str(Path(target.output) / relative)
+            for target, files in zip(targets, target_files)
+            for relative in check_files(files, target.output)
+        ]
+
+    for target, files in zip(targets, target_files):
+        write_files(files, target.output)
+        if compile_bytecode:
+            compile_files(files, target.output, invalidation_mode)
+    return None
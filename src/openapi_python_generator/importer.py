@@ -0,0 +1,264 @@
+"""
+Import of generated clients at runtime, without writing a package to disk.
+"""
+
+import hashlib
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import orjson
+
+from openapi_python_generator import __version__
+from openapi_python_generator.common import Formatter, HTTPLibrary, PydanticVersion
+
+# Sources and code objects of all modules of a client, keyed by their path relative to the client folder.
+CompiledClient = Dict[str, Tuple[str, CodeType]]
+
+
+def default_cache_dir() -> Path:
+    """
+    The folder compiled clients are cached in: $OPENAPI_PYTHON_GENERATOR_CACHE if set, otherwise
+    openapi-python-generator in the user's cache folder.
+    """
+    configured = os.environ.get("OPENAPI_PYTHON_GENERATOR_CACHE")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "openapi-python-generator"
+
+
+def _read_source(source: Union[str, Path, Dict[str, Any]]) -> bytes:
+    if isinstance(source, dict):
+        return orjson.dumps(source, option=orjson.OPT_SORT_KEYS)
+    return Path(source).read_bytes()
+
+
+def cache_key(spec: bytes, **options: Any) -> str:
+    """
+    The key of a compiled client: a hash of the specification, the generation options, the version of the
+    generator and the bytecode format of the running interpreter.
+    """
+    digest = hashlib.sha256()
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(__version__.encode("utf-8"))
+    digest.update(orjson.dumps(options, option=orjson.OPT_SORT_KEYS))
+    digest.update(spec)
+    return digest.hexdigest()
+
+
+def _changed_formats() -> List[List[Any]]:
+    """
+    The formats registered or unregistered with type_mapping, which change the generated code. The built-in
+    formats are covered by the version of the generator. If type_mapping wasn't imported yet, no format was
+    changed, and it isn't imported for a cached import.
+    """
+    type_mapping = sys.modules.get(
+        "openapi_python_generator.language_converters.python.type_mapping"
+    )
+    if type_mapping is None:
+        return []
+    registered = type_mapping.registered_formats()
+    builtin = type_mapping.BUILTIN_FORMATS
+    changed: List[List[Any]] = []
+    for key in sorted(registered.keys() | builtin.keys()):
+        mapping = registered.get(key)
+        if mapping != builtin.get(key):
+            changed.append(
+                [*key, mapping.model_dump() if mapping is not None else None]
+            )
+    return changed
+
+
+def compile_client(files: Dict[str, str], package: str) -> CompiledClient:
+    """
+    Compiles all modules of a client.
+    :param files: Mapping of the relative path to the source, as returned by generate_sources.
+    :param package: The name the client is imported as, used for the file names in tracebacks.
+    :return: The sources and code objects of the modules.
+    """
+    return {
+        relative: (
+            content,
+            compile(content, f"<{package}>/{relative}", "exec", dont_inherit=True),
+        )
+        for relative, content in files.items()
+    }
+
+
+def _load_cached(path: Path) -> Optional[CompiledClient]:
+    try:
+        with open(path, "rb") as f:
+            # Only reads the cache entries written by _store_cached.
+            return marshal.load(f)  # noqa: S302
+    except (FileNotFoundError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _store_cached(path: Path, client: CompiledClient) -> None:
+    """
+    Writes the compiled client atomically, so concurrent imports never read a half-written cache entry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staged = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump(client, f)
+        os.replace(staged, path)
+    finally:
+        if os.path.exists(staged):
+            os.unlink(staged)
+
+
+class ClientLoader(importlib.abc.InspectLoader):
+    """
+    Loads the modules of a generated client from their precompiled code objects.
+    """
+
+    def __init__(self, client: CompiledClient, relative: str):
+        self.client = client
+        self.relative = relative
+
+    def is_package(self, fullname: str) -> bool:
+        return self.relative.endswith("__init__.py")
+
+    def get_code(self, fullname: str) -> CodeType:
+        return self.client[self.relative][1]
+
+    def get_source(self, fullname: str) -> str:
+        return self.client[self.relative][0]
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Runs the code compiled from the generated client by compile_client.
+        exec(self.get_code(module.__name__), module.__dict__)  # noqa: S102
+
+
+class ClientFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder serving the modules of a generated client as the package with the given name.
+    """
+
+    def __init__(self, package: str, client: CompiledClient):
+        self.package = package
+        self.client = client
+
+    def _relative_path(self, fullname: str) -> Optional[str]:
+        if fullname != self.package and not fullname.startswith(self.package + "."):
+            return None
+        parts = fullname.split(".")[1:]
+        for candidate in ("/".join(parts + ["__init__.py"]), "/".join(parts) + ".py"):
+            if candidate in self.client:
+                return candidate
+        return None
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]] = None,
+        target: Optional[ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        relative = self._relative_path(fullname)
+        if relative is None:
+            return None
+        loader = ClientLoader(self.client, relative)
+        spec = importlib.util.spec_from_loader(
+            fullname, loader, origin=f"<{self.package}>/{relative}"
+        )
+        if loader.is_package(fullname):
+            spec.submodule_search_locations = []
+        return spec
+
+
+def _uninstall(package: str) -> None:
+    """
+    Removes the finder and all imported modules of a previously imported client with the same name.
+    """
+    sys.meta_path[:] = [
+        finder
+        for finder in sys.meta_path
+        if not (isinstance(finder, ClientFinder) and finder.package == package)
+    ]
+    for name in list(sys.modules):
+        if name == package or name.startswith(package + "."):
+            del sys.modules[name]
+
+
+def import_client(
+    source: Union[str, Path, Dict[str, Any]],
+    name: Optional[str] = None,
+    library: HTTPLibrary = HTTPLibrary.httpx,
+    env_token_name: Optional[str] = None,
+    use_orjson: bool = False,
+    custom_template_path: Optional[str] = None,
+    pydantic_version: PydanticVersion = PydanticVersion.V2,
+    include_tags: Optional[List[str]] = None,
+    include_operations: Optional[List[str]] = None,
+    include_paths: Optional[List[str]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> ModuleType:
+    """
+    Generates a client from an OpenAPI 3.0+ specification and imports it, without writing the client to disk.
+    The modules are served by a finder on sys.meta_path, so the submodules of the client (e.g.
+    NAME.services.general_service) can be imported as usual.
+
+    The compiled client is cached, keyed on a hash of the specification and the options. Later imports of the
+    same specification skip parsing and generation and only load the cached code objects.
+    :param source: Path to a local specification file, or the raw specification data.
+    :param name: The name of the imported package. Defaults to the name of the specification file.
+    :param cache_dir: Folder of the cache, see default_cache_dir.
+    :return: The imported client package.
+
+    The other options behave like the ones of generate_data.
+    """
+    if name is None:
+        if isinstance(source, dict):
+            raise ValueError("A name is required to import a client from a dict.")
+        name = re.sub(r"\W", "_", Path(source).stem)
+    if not name.isidentifier():
+        raise ValueError(f"{name} is not a valid module name.")
+
+    spec = _read_source(source)
+    options: Dict[str, Any] = {
+        "library": library.value,
+        "env_token_name": env_token_name,
+        "use_orjson": use_orjson,
+        "custom_template_path": custom_template_path,
+        "pydantic_version": pydantic_version.value,
+        "include_tags": include_tags or [],
+        "include_operations": include_operations or [],
+        "include_paths": include_paths or [],
+    }
+    key = cache_key(spec, name=name, formats=_changed_formats(), **options)
+    cache_path = Path(cache_dir or default_cache_dir()) / f"{key}.marshal"
+
+    client = _load_cached(cache_path)
+    if client is None:
+        # Only imported on a cache miss, so cached imports don't pay for the generator.
+        from openapi_python_generator.generate_data import generate_sources, load_spec
+
+        options.update(
+            library=library,
+            pydantic_version=pydantic_version,
+            formatter=Formatter.NONE,
+        )
+        client = compile_client(
+            generate_sources(
+                source if isinstance(source, dict) else load_spec(Path(source)),
+                **options,
+            ),
+            name,
+        )
+        _store_cached(cache_path, client)
+
+    _uninstall(name)
+    sys.meta_path.insert(0, ClientFinder(name, client))
+    return importlib.import_module(name)
@@ -8,13 +8,14 @@ from openapi_python_generator.language_converters.python.jinja_config import (
     API_CONFIG_TEMPLATE_PYDANTIC_V2,
     create_jinja_env,
 )
-from openapi_python_generator.models import APIConfig
+from openapi_python_generator.models import APIConfig, GenerationContext
 
 
 def generate_api_config(
     data: OpenAPI,
     env_token_name: Optional[str] = None,
     pydantic_version: PydanticVersion = PydanticVersion.V2,
+    context: Optional[GenerationContext] = None,
 ) -> APIConfig:
     """
     Generate the API model.
@@ -25,11 +26,13 @@ def generate_api_config(
         if pydantic_version == PydanticVersion.V2
         else API_CONFIG_TEMPLATE
     )
-    jinja_env = create_jinja_env()
+    jinja_env = create_jinja_env(context)
     return APIConfig(
         file_name="api_config",
         content=jinja_env.get_template(template_name).render(
-            env_token_name=env_token_name, **data.model_dump()
+            env_token_name=env_token_name,
+            # The paths and components aren't used by the templates, and may be parsed lazily.
+            **data.model_dump(exclude={"paths", "components"}),
         ),
         base_url=data.servers[0].url if len(data.servers) > 0 else "NO SERVER",
     )
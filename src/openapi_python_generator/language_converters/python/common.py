@@ -1,10 +1,12 @@
-import keyword
-import re
 from typing import Optional
 
+from openapi_python_generator.language_converters.python.symbols import (  # noqa: F401
+    normalize_symbol,
+)
+from openapi_python_generator.models import GenerationContext
+
 _use_orjson: bool = False
 _custom_template_path: Optional[str] = None
-_symbol_ascii_strip_re = re.compile(r"[^A-Za-z0-9_]")
 
 
 def set_use_orjson(value: bool) -> None:
@@ -43,14 +45,12 @@ def get_custom_template_path() -> Optional[str]:
     return _custom_template_path
 
 
-def normalize_symbol(symbol: str) -> str:
+def default_context() -> GenerationContext:
     """
-    Remove invalid characters & keywords in Python symbol names
-    :param symbol: name of the identifier
-    :return: normalized identifier name
+    Get the context used by the generators if none is passed explicitly. It is built from the global
+    variables set with set_use_orjson and set_custom_template_path.
+    :return: the default generation context
     """
-    symbol = symbol.replace("-", "_")
-    normalized_symbol = _symbol_ascii_strip_re.sub("", symbol)
-    if normalized_symbol in keyword.kwlist:
-        normalized_symbol = normalized_symbol + "_"
-    return normalized_symbol
+    return GenerationContext(
+        use_orjson=_use_orjson, custom_template_path=_custom_template_path
+    )
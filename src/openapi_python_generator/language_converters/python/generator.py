@@ -1,20 +1,41 @@
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import click
 from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
 from openapi_pydantic.v3.v3_1 import OpenAPI as OpenAPI31
 
-from openapi_python_generator.common import PydanticVersion
-from openapi_python_generator.language_converters.python import common
+from openapi_python_generator.common import EnumStrategy, PydanticVersion, ServiceSplit
 from openapi_python_generator.language_converters.python.api_config_generator import (
     generate_api_config,
 )
 from openapi_python_generator.language_converters.python.model_generator import (
-    generate_models,
+    analyze_models,
+    model_render_job,
+    with_model_contents,
+)
+from openapi_python_generator.language_converters.python.operation_filter import (
+    apply_operation_filter,
+)
+from openapi_python_generator.language_converters.python.parallel import render_jobs
+from openapi_python_generator.language_converters.python.schema_dedup import (
+    deduplicate_schemas,
 )
 from openapi_python_generator.language_converters.python.service_generator import (
-    generate_services,
+    analyze_service_operations,
+    group_service_operations,
+    operation_render_job,
+    with_operation_contents,
+)
+from openapi_python_generator.language_converters.python.symbols import MODELS
+from openapi_python_generator.models import (
+    APIConfig,
+    ConversionResult,
+    GenerationContext,
+    LibraryConfig,
+    Model,
+    OperationFilter,
+    Service,
 )
-from openapi_python_generator.models import ConversionResult, LibraryConfig
 
 # Type alias for both OpenAPI versions
 OpenAPISpec = Union[OpenAPI30, OpenAPI31]
@@ -27,28 +48,137 @@ def generator(
     use_orjson: bool = False,
     custom_template_path: Optional[str] = None,
     pydantic_version: PydanticVersion = PydanticVersion.V2,
+    operation_filter: Optional[OperationFilter] = None,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    render_workers: Optional[int] = 1,
 ) -> ConversionResult:
     """
     Generate Python code from an OpenAPI 3.0+ specification.
+    If an operation filter is given, only the selected operations and the models reachable from them are generated.
+    Operations are distributed over service modules by tag or path prefix (service_split), with at most
+    max_operations_per_service operations per module. With deduplicate_models, structurally identical schemas
+    are merged into one model, see deduplicate_schemas. enum_strategy selects how enum schemas are generated,
+    see model_generator.enum_strategy. With render_workers, the models and operations are rendered by a pool
+    of processes, see render_jobs.
     """
+    return generate_targets(
+        data,
+        [(library_config, pydantic_version)],
+        env_token_name,
+        use_orjson,
+        custom_template_path,
+        operation_filter,
+        service_split,
+        max_operations_per_service,
+        deduplicate_models,
+        enum_strategy,
+        render_workers,
+    )[0]
+
 
-    common.set_use_orjson(use_orjson)
-    common.set_custom_template_path(custom_template_path)
+def generate_targets(
+    data: OpenAPISpec,
+    targets: List[Tuple[LibraryConfig, PydanticVersion]],
+    env_token_name: Optional[str] = None,
+    use_orjson: bool = False,
+    custom_template_path: Optional[str] = None,
+    operation_filter: Optional[OperationFilter] = None,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    render_workers: Optional[int] = 1,
+) -> List[ConversionResult]:
+    """
+    Generate Python code for several combinations of HTTP library and pydantic version from one OpenAPI 3.0+
+    specification. The analysis of models and operations is done once and shared by all targets, models are
+    rendered once per pydantic version and services once per library. With render_workers, the models and
+    operations of all targets are rendered concurrently by one pool of processes, see render_jobs.
+    :return: One result per target, in the order of the targets.
+    """
 
-    if data.components is not None:
-        models = generate_models(data.components, pydantic_version)
-    else:
-        models = []
+    context = GenerationContext(
+        use_orjson=use_orjson,
+        custom_template_path=custom_template_path,
+        service_split=service_split,
+        max_operations_per_service=max_operations_per_service,
+        enum_strategy=enum_strategy,
+    )
 
-    if data.paths is not None:
-        services = generate_services(data.paths, library_config)
-    else:
-        services = []
+    data = apply_operation_filter(data, operation_filter)
+    duplicates: Dict[str, str] = {}
+    if deduplicate_models:
+        data, duplicates = deduplicate_schemas(data)
 
-    api_config = generate_api_config(data, env_token_name, pydantic_version)
+    analyzed_models = (
+        analyze_models(data.components, context) if data.components is not None else []
+    )
+    analyzed_operations = (
+        analyze_service_operations(data.paths, context)
+        if data.paths is not None
+        else []
+    )
+    # The removed schemas stay importable from the models package, as aliases of the model they were merged into.
+    model_aliases = {
+        context.symbols.identifier(MODELS, duplicate): context.symbols.identifier(
+            MODELS, name
+        )
+        for duplicate, name in duplicates.items()
+    }
+    for namespace, name, identifier in context.symbols.renamed:
+        click.echo(
+            f"Warning: {name} is generated as {identifier}, because other {namespace} have the same name."
+        )
 
-    return ConversionResult(
-        models=models,
-        services=services,
-        api_config=api_config,
+    pydantic_versions = list(dict.fromkeys(version for _, version in targets))
+    library_configs = list(
+        {library_config.name: library_config for library_config, _ in targets}.values()
+    )
+    contents = render_jobs(
+        [
+            model_render_job(analyzed_models, pydantic_version, context)
+            for pydantic_version in pydantic_versions
+        ]
+        + [
+            operation_render_job(analyzed_operations, library_config, context)
+            for library_config in library_configs
+        ],
+        render_workers,
     )
+
+    models: Dict[PydanticVersion, List[Model]] = {}
+    api_configs: Dict[PydanticVersion, APIConfig] = {}
+    for pydantic_version, model_contents in zip(pydantic_versions, contents):
+        models[pydantic_version] = with_model_contents(analyzed_models, model_contents)
+        api_configs[pydantic_version] = generate_api_config(
+            data, env_token_name, pydantic_version, context
+        )
+    services: Dict[str, List[Service]] = {
+        library_config.name: group_service_operations(
+            with_operation_contents(
+                analyzed_operations, operation_contents, library_config
+            ),
+            library_config,
+            context,
+        )
+        for library_config, operation_contents in zip(
+            library_configs, contents[len(pydantic_versions) :]
+        )
+    }
+
+    results = []
+    for library_config, pydantic_version in targets:
+        results.append(
+            ConversionResult(
+                models=models[pydantic_version],
+                services=services[library_config.name],
+                api_config=api_configs[pydantic_version],
+                custom_template_path=custom_template_path,
+                model_aliases=model_aliases,
+                formats=context.formats,
+            )
+        )
+    return results
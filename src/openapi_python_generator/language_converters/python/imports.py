@@ -0,0 +1,151 @@
+import ast
+import builtins
+import typing
+from typing import Dict, Iterable, List, Optional, Set
+
+from openapi_python_generator.language_converters.python import type_mapping
+from openapi_python_generator.models import Formats
+
+TYPING_NAMES = frozenset(typing.__all__)
+
+BUILTIN_NAMES = frozenset(dir(builtins))
+
+
+def _imported_names(tree: ast.Module) -> Set[str]:
+    """
+    Names bound at module level by imports.
+    """
+    imported: Set[str] = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                imported.add((alias.asname or alias.name).split(".")[0])
+    return imported
+
+
+def _bound_names(tree: ast.Module) -> Set[str]:
+    """
+    Names bound at module level, i.e. by imports, definitions and assignments.
+    """
+    bound = _imported_names(tree)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                bound.update(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+    return bound
+
+
+def _forward_references(annotation: ast.AST) -> Set[str]:
+    """
+    Names in the string constants of an annotation, apart from the values of Literal.
+    """
+    if (
+        isinstance(annotation, ast.Subscript)
+        and isinstance(annotation.value, ast.Name)
+        and annotation.value.id == "Literal"
+    ):
+        return set()
+    if isinstance(annotation, ast.Constant):
+        if isinstance(annotation.value, str) and annotation.value.isidentifier():
+            return {annotation.value}
+        return set()
+    names: Set[str] = set()
+    for child in ast.iter_child_nodes(annotation):
+        names |= _forward_references(child)
+    return names
+
+
+def _used_names(tree: ast.Module) -> Set[str]:
+    """
+    Names a module loads, without builtins. Identifiers in string constants of annotations are included, to
+    cover forward references.
+    """
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, (ast.AnnAssign, ast.arg)) and node.annotation is not None:
+            names |= _forward_references(node.annotation)
+        elif (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.returns is not None
+        ):
+            names |= _forward_references(node.returns)
+    return names - BUILTIN_NAMES
+
+
+def referenced_names(source: str) -> Set[str]:
+    """
+    Finds the names a module uses without binding them at module level. Local variables of functions are
+    included as well, so the result may contain more names than needed, but never less. Identifiers in string
+    constants of annotations are included, to cover forward references.
+    :param source: The source of the module.
+    :return: The referenced names, without builtins.
+    """
+    tree = ast.parse(source)
+    return _used_names(tree) - _bound_names(tree)
+
+
+def import_statements(
+    source: str,
+    models: Iterable[str] = (),
+    models_package: Optional[str] = None,
+    formats: Optional[Formats] = None,
+) -> List[str]:
+    """
+    Computes explicit imports for the names a generated module uses, replacing wildcard imports of typing
+    and the models package.
+    :param source: The source of the module, without the imports to compute.
+    :param models: Names of all models of the client.
+    :param models_package: The package the models are imported from, relative to the module. If None, no
+        models are imported.
+    :param formats: The formats of the generation, see GenerationContext.formats. Defaults to the registered ones.
+    :return: The import statements, in a stable order.
+    """
+    tree = ast.parse(source)
+    used = _used_names(tree)
+    # A definition of the module may shadow a name used before it, e.g. Dict in the annotations of a model
+    # named Dict. The name is imported anyway and rebound by the definition, like with a wildcard import.
+    unimported = used - _imported_names(tree)
+    names = used - _bound_names(tree)
+    statements = []
+
+    typing_names = sorted(unimported & TYPING_NAMES)
+    if typing_names:
+        statements.append(f"from typing import {', '.join(typing_names)}")
+
+    # Names used by generated type annotations which don't come from typing, see type_mapping.
+    known_imports = type_mapping.imported_names(formats)
+    known: Dict[str, List[str]] = {}
+    for name in sorted(unimported & known_imports.keys()):
+        known.setdefault(known_imports[name], []).append(name)
+    for module, imported in sorted(known.items()):
+        statements.append(f"from {module} import {', '.join(imported)}")
+
+    if models_package is not None:
+        for model in sorted(names.intersection(models)):
+            statements.append(f"from {models_package}.{model} import {model}")
+
+    return statements
+
+
+def with_imports(
+    source: str,
+    models: Iterable[str] = (),
+    models_package: Optional[str] = None,
+    formats: Optional[Formats] = None,
+) -> str:
+    """
+    Prepends the explicit imports computed by import_statements to a generated module. Invalid code is
+    returned unchanged, so the syntax error is reported by the compile check of the caller.
+    """
+    try:
+        statements = import_statements(source, models, models_package, formats)
+    except SyntaxError:
+        return source
+    if not statements:
+        return source
+    return "\n".join(statements) + "\n" + source
@@ -0,0 +1,221 @@
+"""
+Compact, version neutral representation of OpenAPI schemas, consumed by the generators.
+
+Schemas of OpenAPI 3.0 and 3.1 are lowered once into slotted nodes. Type names are interned strings, so they
+are compared by identity, and references carry the Python name of the model they point to. The generators
+don't need to care about the version specific openapi_pydantic classes anymore.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from openapi_python_generator.language_converters.python.symbols import (
+    MODELS,
+    SymbolTable,
+    normalize_symbol,
+)
+
+STRING = sys.intern("string")
+INTEGER = sys.intern("integer")
+NUMBER = sys.intern("number")
+BOOLEAN = sys.intern("boolean")
+ARRAY = sys.intern("array")
+OBJECT = sys.intern("object")
+NULL = sys.intern("null")
+
+
+class RefNode:
+    """
+    A reference to a component.
+    :param ref: The raw reference, e.g. #/components/schemas/User.
+    :param name: The Python name of the referenced model, by default the normalized name of the component.
+    """
+
+    __slots__ = ("ref", "name")
+
+    def __init__(self, ref: str, name: Optional[str] = None):
+        self.ref = ref
+        self.name = name if name is not None else normalize_symbol(ref.split("/")[-1])
+
+    def __repr__(self) -> str:
+        return f"RefNode({self.ref!r})"
+
+
+class SchemaNode:
+    """
+    A lowered schema.
+    :param type: The interned type, for a list of types (OpenAPI 3.1) the first one. None if there is no type.
+    :param type_list: True if the type was given as a list.
+    :param type_name: The type as it is written into TypeConversion.original_type, None if there is no type.
+    :param format: The format of the schema.
+    :param items: The lowered items of an array.
+    :param all_of: The lowered sub schemas of allOf.
+    :param one_of: The lowered sub schemas of oneOf.
+    :param any_of: The lowered sub schemas of anyOf.
+    :param properties: The lowered properties, by their name in the specification.
+    :param required: The names of the required properties.
+    :param enum: The values of an enum.
+    """
+
+    __slots__ = (
+        "type",
+        "type_list",
+        "type_name",
+        "format",
+        "items",
+        "all_of",
+        "one_of",
+        "any_of",
+        "properties",
+        "required",
+        "enum",
+    )
+
+    def __init__(
+        self,
+        type: Optional[str] = None,
+        type_list: bool = False,
+        type_name: Optional[str] = None,
+        format: Optional[str] = None,
+        items: Optional["Node"] = None,
+        all_of: Optional[Tuple["Node", ...]] = None,
+        one_of: Optional[Tuple["Node", ...]] = None,
+        any_of: Optional[Tuple["Node", ...]] = None,
+        properties: Optional[Dict[str, "Node"]] = None,
+        required: Optional[Tuple[str, ...]] = None,
+        enum: Optional[Tuple[Any, ...]] = None,
+    ):
+        self.type = type
+        self.type_list = type_list
+        self.type_name = type_name
+        self.format = format
+        self.items = items
+        self.all_of = all_of
+        self.one_of = one_of
+        self.any_of = any_of
+        self.properties = properties
+        self.required = required
+        self.enum = enum
+
+    def __repr__(self) -> str:
+        return f"SchemaNode(type={self.type!r}, format={self.format!r})"
+
+
+Node = Union[RefNode, SchemaNode]
+
+
+def intern_type(value: Any) -> str:
+    """
+    The interned type tag of a type, given as string or DataType.
+    """
+    return sys.intern(str(getattr(value, "value", value)))
+
+
+def _make_node(
+    schema: Any,
+    memo: Dict[int, Node],
+    pending: List[Tuple[Any, SchemaNode]],
+    symbols: Optional[SymbolTable],
+) -> Node:
+    """
+    Creates the node of a schema without its sub schemas, which are lowered once the node is taken from pending.
+    """
+    if isinstance(schema, (RefNode, SchemaNode)):
+        return schema
+    key = id(schema)
+    if key in memo:
+        return memo[key]
+
+    if hasattr(schema, "ref"):
+        node: Node = RefNode(
+            schema.ref,
+            (
+                symbols.identifier(MODELS, schema.ref.split("/")[-1])
+                if symbols is not None
+                else None
+            ),
+        )
+        memo[key] = node
+        return node
+
+    raw_type = schema.type
+    type_list = isinstance(raw_type, list)
+    if type_list:
+        type_tag = intern_type(raw_type[0]) if len(raw_type) > 0 else None
+        type_name: Optional[str] = str(raw_type)
+    elif raw_type is not None:
+        type_tag = intern_type(raw_type)
+        type_name = getattr(raw_type, "value", None) or str(raw_type)
+    else:
+        type_tag = type_name = None
+
+    node = SchemaNode(
+        type=type_tag,
+        type_list=type_list,
+        type_name=type_name,
+        format=schema.schema_format,
+        required=tuple(schema.required) if schema.required is not None else None,
+        enum=tuple(schema.enum) if schema.enum is not None else None,
+    )
+    # Registered before the sub schemas are lowered, so shared sub schemas are lowered only once.
+    memo[key] = node
+    pending.append((schema, node))
+    return node
+
+
+def _lower(schema: Any, memo: Dict[int, Node], symbols: Optional[SymbolTable]) -> Node:
+    """
+    Lowers a schema with an explicit stack instead of recursion, so arbitrarily deep schemas can be lowered.
+    """
+    pending: List[Tuple[Any, SchemaNode]] = []
+    root = _make_node(schema, memo, pending, symbols)
+
+    def _make_all(schemas: Optional[Any]) -> Optional[Tuple[Node, ...]]:
+        if schemas is None:
+            return None
+        return tuple(_make_node(s, memo, pending, symbols) for s in schemas)
+
+    while pending:
+        raw, node = pending.pop()
+        if raw.items is not None:
+            node.items = _make_node(raw.items, memo, pending, symbols)
+        node.all_of = _make_all(raw.allOf)
+        node.one_of = _make_all(raw.oneOf)
+        node.any_of = _make_all(raw.anyOf)
+        if raw.properties is not None:
+            node.properties = {
+                name: _make_node(prop, memo, pending, symbols)
+                for name, prop in raw.properties.items()
+            }
+    return root
+
+
+def lower(
+    schema: Any,
+    memo: Optional[Dict[int, Node]] = None,
+    symbols: Optional[SymbolTable] = None,
+) -> Node:
+    """
+    Lowers a Schema or Reference of OpenAPI 3.0 or 3.1 into a node. Nodes are returned unchanged.
+    :param schema: The schema or reference.
+    :param memo: Nodes of already lowered objects, by their id. Pass the same dictionary to share the nodes of
+        sub schemas between several calls; the lowered objects must be alive as long as the dictionary is used.
+    :param symbols: The symbol table references are resolved with.
+    :return: The lowered node.
+    """
+    return _lower(schema, memo if memo is not None else {}, symbols)
+
+
+def lower_schemas(
+    schemas: Optional[Dict[str, Any]], symbols: Optional[SymbolTable] = None
+) -> Dict[str, Node]:
+    """
+    Lowers all schemas of the components of a specification in one pass.
+    :param schemas: components.schemas of the specification.
+    :param symbols: The symbol table references are resolved with.
+    :return: The lowered schemas, by their name in the specification.
+    """
+    if schemas is None:
+        return {}
+    memo: Dict[int, Node] = {}
+    return {name: _lower(schema, memo, symbols) for name, schema in schemas.items()}
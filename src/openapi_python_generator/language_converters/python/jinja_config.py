@@ -1,21 +1,41 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from jinja2 import ChoiceLoader, Environment, FileSystemLoader
 
+from openapi_python_generator.models import GenerationContext
+
 from . import common
 
 ENUM_TEMPLATE = "enum.jinja2"
+ENUM_LITERAL_TEMPLATE = "enum_literal.jinja2"
+ENUM_LAZY_TEMPLATE = "enum_lazy.jinja2"
+ENUM_FROZENSET_TEMPLATE = "enum_frozenset.jinja2"
+ENUM_FROZENSET_TEMPLATE_PYDANTIC_V2 = "enum_frozenset_pydantic_2.jinja2"
 MODELS_TEMPLATE = "models.jinja2"
 MODELS_TEMPLATE_PYDANTIC_V2 = "models_pydantic_2.jinja2"
 SERVICE_TEMPLATE = "service.jinja2"
+SERVICES_INIT_TEMPLATE = "services_init.jinja2"
+MODELS_INIT_TEMPLATE = "models_init.jinja2"
+PACKAGE_INIT_TEMPLATE = "package_init.jinja2"
 HTTPX_TEMPLATE = "httpx.jinja2"
 API_CONFIG_TEMPLATE = "apiconfig.jinja2"
 API_CONFIG_TEMPLATE_PYDANTIC_V2 = "apiconfig_pydantic_2.jinja2"
 TEMPLATE_PATH = Path(__file__).parent / "templates"
 
 
-def create_jinja_env():
-    custom_template_path = common.get_custom_template_path()
+def create_jinja_env(context: Optional[GenerationContext] = None) -> Environment:
+    context = context if context is not None else common.default_context()
+    return _cached_jinja_env(context.custom_template_path)
+
+
+@lru_cache(maxsize=None)
+def _cached_jinja_env(custom_template_path: Optional[str]) -> Environment:
+    """
+    One environment per template path is shared by all generations in the process, so every template is
+    only compiled once. Changed template files are still picked up, as jinja checks them for modifications.
+    """
     return Environment(
         loader=(
             ChoiceLoader(
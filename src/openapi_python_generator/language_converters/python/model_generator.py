@@ -1,8 +1,9 @@
 import itertools
 import re
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
+from jinja2 import Environment
 from openapi_pydantic.v3.v3_0 import (
     Components as Components30,
 )
@@ -22,45 +23,129 @@ from openapi_pydantic.v3.v3_1 import (
     Schema as Schema31,
 )
 
-from openapi_python_generator.common import PydanticVersion
-from openapi_python_generator.language_converters.python import common
+from openapi_python_generator.common import EnumStrategy, PydanticVersion
+from openapi_python_generator.language_converters.python import (
+    common,
+    ir,
+    type_mapping,
+)
+from openapi_python_generator.language_converters.python.imports import with_imports
 from openapi_python_generator.language_converters.python.jinja_config import (
+    ENUM_FROZENSET_TEMPLATE,
+    ENUM_FROZENSET_TEMPLATE_PYDANTIC_V2,
+    ENUM_LAZY_TEMPLATE,
+    ENUM_LITERAL_TEMPLATE,
     ENUM_TEMPLATE,
     MODELS_TEMPLATE,
     MODELS_TEMPLATE_PYDANTIC_V2,
     create_jinja_env,
 )
-from openapi_python_generator.models import Model, Property, TypeConversion
+from openapi_python_generator.language_converters.python.parallel import (
+    RenderJob,
+    render_jobs,
+)
+from openapi_python_generator.language_converters.python.symbols import MODELS
+from openapi_python_generator.models import (
+    GenerationContext,
+    Model,
+    Property,
+    TypeConversion,
+)
 
 # Type aliases for compatibility
 Schema = Union[Schema30, Schema31]
 Reference = Union[Reference30, Reference31]
 Components = Union[Components30, Components31]
 
+# With EnumStrategy.AUTO, enums with more values than this are built lazily, resp. validated against a set.
+LAZY_ENUM_THRESHOLD = 1000
+FROZENSET_ENUM_THRESHOLD = 10000
+
+_enum_member_re = re.compile(r"[\s\/=\*\+]+")
+
 
-def type_converter(  # noqa: C901
-    schema: Union[Schema, Reference],
+def type_converter(
+    schema: Union[Schema, Reference, ir.Node],
     required: bool = False,
     model_name: Optional[str] = None,
+    context: Optional[GenerationContext] = None,
+    converted: Optional[Dict[ir.Node, TypeConversion]] = None,
 ) -> TypeConversion:
     """
     Converts an OpenAPI type to a Python type.
-    :param schema: Schema or Reference containing the type to be converted
+    :param schema: Schema or Reference containing the type to be converted, or its lowered node
     :param model_name: Name of the original model on which the type is defined
     :param required: Flag indicating if the type is required by the class
+    :param context: Options of the generation, defaults to common.default_context()
+    :param converted: Conversions of nested sub schemas by their node. Pass the same dictionary to share
+        them between calls with the same context.
     :return: The converted type
     """
-    # Handle Reference objects by converting them to type references
-    if isinstance(schema, Reference30) or isinstance(schema, Reference31):
-        import_type = common.normalize_symbol(schema.ref.split("/")[-1])
-        if required:
-            converted_type = import_type
+    context = context if context is not None else common.default_context()
+    converted = converted if converted is not None else {}
+    node = ir.lower(schema, symbols=context.symbols)
+    _convert_sub_schemas(node, context, converted)
+    return _convert_node(node, required, model_name, context, converted)
+
+
+def _sub_schemas(node: ir.Node) -> Tuple[ir.SchemaNode, ...]:
+    """
+    The sub schemas whose conversion is part of the conversion of the node.
+    """
+    if not isinstance(node, ir.SchemaNode):
+        return ()
+    if node.all_of is not None:
+        used: Tuple[ir.Node, ...] = node.all_of
+    elif node.one_of is not None:
+        used = node.one_of
+    elif node.any_of is not None:
+        used = node.any_of
+    elif node.type is ir.ARRAY and node.items is not None:
+        used = (node.items,)
+    else:
+        return ()
+    return tuple(s for s in used if isinstance(s, ir.SchemaNode))
+
+
+def _convert_sub_schemas(
+    node: ir.Node,
+    context: GenerationContext,
+    converted: Dict[ir.Node, TypeConversion],
+) -> None:
+    """
+    Converts all nested sub schemas of a node bottom up. It uses an explicit stack instead of recursion, so
+    deeply nested schemas don't hit the recursion limit, and converts every sub schema only once. Sub schemas
+    are always converted as required and without model name.
+    """
+    stack = list(_sub_schemas(node))
+    while stack:
+        current = stack[-1]
+        if current in converted:
+            stack.pop()
+            continue
+        pending = [s for s in _sub_schemas(current) if s not in converted]
+        if pending:
+            stack.extend(pending)
         else:
-            converted_type = f"Optional[{import_type}]"
+            stack.pop()
+            converted[current] = _convert_node(current, True, None, context, converted)
+
 
+def _convert_node(  # noqa: C901
+    node: ir.Node,
+    required: bool,
+    model_name: Optional[str],
+    context: GenerationContext,
+    converted: Dict[ir.Node, TypeConversion],
+) -> TypeConversion:
+    """
+    Converts a node whose sub schemas are already converted.
+    """
+    if isinstance(node, ir.RefNode):
+        import_type = node.name
         return TypeConversion(
-            original_type=schema.ref,
-            converted_type=converted_type,
+            original_type=node.ref,
+            converted_type=import_type if required else f"Optional[{import_type}]",
             import_types=(
                 [f"from .{import_type} import {import_type}"]
                 if import_type != model_name
@@ -75,38 +160,32 @@ def type_converter(  # noqa: C901
         pre_type = "Optional["
         post_type = "]"
 
-    original_type = (
-        schema.type.value
-        if hasattr(schema.type, "value") and schema.type is not None
-        else str(schema.type) if schema.type is not None else "object"
-    )
+    original_type = node.type_name if node.type_name is not None else "object"
     import_types: Optional[List[str]] = None
 
-    if schema.allOf is not None:
+    if node.all_of is not None:
         conversions = []
-        for sub_schema in schema.allOf:
-            if isinstance(sub_schema, Schema30) or isinstance(sub_schema, Schema31):
-                conversions.append(type_converter(sub_schema, True))
-            else:
-                import_type = common.normalize_symbol(sub_schema.ref.split("/")[-1])
-                if import_type == model_name and model_name is not None:
-                    conversions.append(
-                        TypeConversion(
-                            original_type=sub_schema.ref,
-                            converted_type='"' + model_name + '"',
-                            import_types=None,
-                        )
+        for sub_schema in node.all_of:
+            if isinstance(sub_schema, ir.SchemaNode):
+                conversions.append(converted[sub_schema])
+            elif sub_schema.name == model_name and model_name is not None:
+                conversions.append(
+                    TypeConversion(
+                        original_type=sub_schema.ref,
+                        converted_type='"' + model_name + '"',
+                        import_types=None,
                     )
-                else:
-                    import_types = [f"from .{import_type} import {import_type}"]
-                    conversions.append(
-                        TypeConversion(
-                            original_type=sub_schema.ref,
-                            converted_type=import_type,
-                            import_types=import_types,
-                        )
+                )
+            else:
+                conversions.append(
+                    TypeConversion(
+                        original_type=sub_schema.ref,
+                        converted_type=sub_schema.name,
+                        import_types=[
+                            f"from .{sub_schema.name} import {sub_schema.name}"
+                        ],
                     )
-
+                )
         original_type = (
             "tuple<" + ",".join([i.original_type for i in conversions]) + ">"
         )
@@ -125,21 +204,20 @@ def type_converter(  # noqa: C901
             if i.import_types is not None and len(i.import_types) > 0
         ] or None
 
-    elif schema.oneOf is not None or schema.anyOf is not None:
-        used = schema.oneOf if schema.oneOf is not None else schema.anyOf
-        used = used if used is not None else []
+    elif node.one_of is not None or node.any_of is not None:
+        used = node.one_of if node.one_of is not None else node.any_of
         conversions = []
-        for sub_schema in used:
-            if isinstance(sub_schema, Schema30) or isinstance(sub_schema, Schema31):
-                conversions.append(type_converter(sub_schema, True))
+        for sub_schema in used or ():
+            if isinstance(sub_schema, ir.SchemaNode):
+                conversions.append(converted[sub_schema])
             else:
-                import_type = common.normalize_symbol(sub_schema.ref.split("/")[-1])
-                import_types = [f"from .{import_type} import {import_type}"]
                 conversions.append(
                     TypeConversion(
                         original_type=sub_schema.ref,
-                        converted_type=import_type,
-                        import_types=import_types,
+                        converted_type=sub_schema.name,
+                        import_types=[
+                            f"from .{sub_schema.name} import {sub_schema.name}"
+                        ],
                     )
                 )
         original_type = (
@@ -159,152 +237,34 @@ def type_converter(  # noqa: C901
                 *[i.import_types for i in conversions if i.import_types is not None]
             )
         )
-    # We only want to auto convert to datetime if orjson is used throghout the code, otherwise we can not
-    # serialize it to JSON.
-    elif (schema.type == "string" or str(schema.type) == "DataType.STRING") and (
-        schema.schema_format is None or not common.get_use_orjson()
-    ):
-        converted_type = pre_type + "str" + post_type
-    elif (
-        (schema.type == "string" or str(schema.type) == "DataType.STRING")
-        and schema.schema_format is not None
-        and schema.schema_format.startswith("uuid")
-        and common.get_use_orjson()
-    ):
-        if len(schema.schema_format) > 4 and schema.schema_format[4].isnumeric():
-            uuid_type = schema.schema_format.upper()
-            converted_type = pre_type + uuid_type + post_type
-            import_types = ["from pydantic import " + uuid_type]
-        else:
-            converted_type = pre_type + "UUID" + post_type
-            import_types = ["from uuid import UUID"]
-    elif (
-        schema.type == "string" or str(schema.type) == "DataType.STRING"
-    ) and schema.schema_format == "date-time":
-        converted_type = pre_type + "datetime" + post_type
-        import_types = ["from datetime import datetime"]
-    elif schema.type == "integer" or str(schema.type) == "DataType.INTEGER":
-        converted_type = pre_type + "int" + post_type
-    elif schema.type == "number" or str(schema.type) == "DataType.NUMBER":
-        converted_type = pre_type + "float" + post_type
-    elif schema.type == "boolean" or str(schema.type) == "DataType.BOOLEAN":
-        converted_type = pre_type + "bool" + post_type
-    elif schema.type == "array" or str(schema.type) == "DataType.ARRAY":
+    elif node.type is ir.ARRAY:
         retVal = pre_type + "List["
-        if isinstance(schema.items, Reference30) or isinstance(
-            schema.items, Reference31
-        ):
+        if isinstance(node.items, ir.RefNode):
             converted_reference = _generate_property_from_reference(
-                model_name or "", "", schema.items, schema, required
+                model_name or "", "", node.items, node, required
             )
             import_types = converted_reference.type.import_types
             original_type = "array<" + converted_reference.type.original_type + ">"
             retVal += converted_reference.type.converted_type
-        elif isinstance(schema.items, Schema30) or isinstance(schema.items, Schema31):
-            type_str = schema.items.type
-            if hasattr(type_str, "value"):
-                type_value = str(type_str.value) if type_str is not None else "unknown"
-            else:
-                type_value = str(type_str) if type_str is not None else "unknown"
+        elif isinstance(node.items, ir.SchemaNode):
+            type_value = (
+                node.items.type_name if node.items.type_name is not None else "unknown"
+            )
             original_type = "array<" + type_value + ">"
-            retVal += type_converter(schema.items, True).converted_type
+            retVal += converted[node.items].converted_type
         else:
             original_type = "array<unknown>"
             retVal += "Any"
 
         converted_type = retVal + "]" + post_type
-    elif schema.type == "object" or str(schema.type) == "DataType.OBJECT":
-        converted_type = pre_type + "Dict[str, Any]" + post_type
-    elif schema.type == "null" or str(schema.type) == "DataType.NULL":
-        converted_type = pre_type + "None" + post_type
-    elif schema.type is None:
+    elif node.type is None and not node.type_list:
         converted_type = pre_type + "Any" + post_type
     else:
-        # Handle DataType enum types as strings
-        if hasattr(schema.type, "value"):
-            # Single DataType enum
-            if schema.type.value == "string":
-                # Check for UUID format first
-                if (
-                    schema.schema_format is not None
-                    and schema.schema_format.startswith("uuid")
-                    and common.get_use_orjson()
-                ):
-                    if (
-                        len(schema.schema_format) > 4
-                        and schema.schema_format[4].isnumeric()
-                    ):
-                        uuid_type = schema.schema_format.upper()
-                        converted_type = pre_type + uuid_type + post_type
-                        import_types = ["from pydantic import " + uuid_type]
-                    else:
-                        converted_type = pre_type + "UUID" + post_type
-                        import_types = ["from uuid import UUID"]
-                # Check for date-time format
-                elif schema.schema_format == "date-time":
-                    converted_type = pre_type + "datetime" + post_type
-                    import_types = ["from datetime import datetime"]
-                else:
-                    converted_type = pre_type + "str" + post_type
-            elif schema.type.value == "integer":
-                converted_type = pre_type + "int" + post_type
-            elif schema.type.value == "number":
-                converted_type = pre_type + "float" + post_type
-            elif schema.type.value == "boolean":
-                converted_type = pre_type + "bool" + post_type
-            elif schema.type.value == "array":
-                converted_type = pre_type + "List[Any]" + post_type
-            elif schema.type.value == "object":
-                converted_type = pre_type + "Dict[str, Any]" + post_type
-            elif schema.type.value == "null":
-                converted_type = pre_type + "None" + post_type
-            else:
-                converted_type = pre_type + "str" + post_type  # Default fallback
-        elif isinstance(schema.type, list) and len(schema.type) > 0:
-            # List of DataType enums - use first one
-            first_type = schema.type[0]
-            if hasattr(first_type, "value"):
-                if first_type.value == "string":
-                    # Check for UUID format first
-                    if (
-                        schema.schema_format is not None
-                        and schema.schema_format.startswith("uuid")
-                        and common.get_use_orjson()
-                    ):
-                        if (
-                            len(schema.schema_format) > 4
-                            and schema.schema_format[4].isnumeric()
-                        ):
-                            uuid_type = schema.schema_format.upper()
-                            converted_type = pre_type + uuid_type + post_type
-                            import_types = ["from pydantic import " + uuid_type]
-                        else:
-                            converted_type = pre_type + "UUID" + post_type
-                            import_types = ["from uuid import UUID"]
-                    # Check for date-time format
-                    elif schema.schema_format == "date-time":
-                        converted_type = pre_type + "datetime" + post_type
-                        import_types = ["from datetime import datetime"]
-                    else:
-                        converted_type = pre_type + "str" + post_type
-                elif first_type.value == "integer":
-                    converted_type = pre_type + "int" + post_type
-                elif first_type.value == "number":
-                    converted_type = pre_type + "float" + post_type
-                elif first_type.value == "boolean":
-                    converted_type = pre_type + "bool" + post_type
-                elif first_type.value == "array":
-                    converted_type = pre_type + "List[Any]" + post_type
-                elif first_type.value == "object":
-                    converted_type = pre_type + "Dict[str, Any]" + post_type
-                elif first_type.value == "null":
-                    converted_type = pre_type + "None" + post_type
-                else:
-                    converted_type = pre_type + "str" + post_type  # Default fallback
-            else:
-                converted_type = pre_type + "str" + post_type  # Default fallback
-        else:
-            converted_type = pre_type + "str" + post_type  # Default fallback
+        mapping = type_mapping.lookup(
+            node.type, node.format, context.use_orjson, context.formats
+        )
+        converted_type = pre_type + mapping.python_type + post_type
+        import_types = mapping.import_types
 
     return TypeConversion(
         original_type=original_type,
@@ -314,7 +274,12 @@ def type_converter(  # noqa: C901
 
 
 def _generate_property_from_schema(
-    model_name: str, name: str, schema: Schema, parent_schema: Optional[Schema] = None
+    model_name: str,
+    name: str,
+    schema: Union[Schema, ir.SchemaNode],
+    parent_schema: Optional[Union[Schema, ir.SchemaNode]] = None,
+    context: Optional[GenerationContext] = None,
+    converted: Optional[Dict[ir.Node, TypeConversion]] = None,
 ) -> Property:
     """
     Generates a property from a schema. It takes the type of the schema and converts it to a python type, and then
@@ -323,6 +288,8 @@ def _generate_property_from_schema(
     :param name: Name of the schema
     :param schema: schema to be converted
     :param parent_schema: Component this belongs to
+    :param context: Options of the generation
+    :param converted: Conversions of sub schemas shared between the properties, see type_converter
     :return: Property
     """
     required = (
@@ -337,7 +304,7 @@ def _generate_property_from_schema(
 
     return Property(
         name=name,
-        type=type_converter(schema, required, model_name),
+        type=type_converter(schema, required, model_name, context, converted),
         required=required,
         default=None if required else "None",
         import_type=import_type,
@@ -347,8 +314,8 @@ def _generate_property_from_schema(
 def _generate_property_from_reference(
     model_name: str,
     name: str,
-    reference: Reference,
-    parent_schema: Optional[Schema] = None,
+    reference: Union[Reference, ir.RefNode],
+    parent_schema: Optional[Union[Schema, ir.SchemaNode]] = None,
     force_required: bool = False,
 ) -> Property:
     """
@@ -365,7 +332,7 @@ def _generate_property_from_reference(
         and parent_schema.required is not None
         and name in parent_schema.required
     ) or force_required
-    import_model = common.normalize_symbol(reference.ref.split("/")[-1])
+    import_model = ir.lower(reference).name
 
     if import_model == model_name:
         type_conv = TypeConversion(
@@ -392,66 +359,138 @@ def _generate_property_from_reference(
     )
 
 
-def generate_models(
-    components: Components, pydantic_version: PydanticVersion = PydanticVersion.V2
+def analyze_models(
+    components: Components, context: Optional[GenerationContext] = None
 ) -> List[Model]:
     """
-    Receives components from an OpenAPI 3.0+ specification and generates the models from it.
-    It does so, by iterating over the components.schemas dictionary. For each schema, it checks if
-    it is a normal schema (i.e. simple type like string, integer, etc.), a reference to another schema, or
-    an array of types/references. It then computes pydantic models from it using jinja2
+    Receives components from an OpenAPI 3.0+ specification and analyzes the models in it, i.e. converts the
+    types of all properties. This doesn't depend on the pydantic version, the content of the returned models
+    is empty and filled by render_models.
     :param components: The components from an OpenAPI 3.0+ specification.
-    :param pydantic_version: The version of pydantic to use.
-    :return: A list of models.
+    :param context: Options of the generation, defaults to common.default_context()
+    :return: A list of models without content.
     """
+    context = context if context is not None else common.default_context()
     models: List[Model] = []
 
     if components.schemas is None:
         return models
 
-    jinja_env = create_jinja_env()
-    for schema_name, schema_or_reference in components.schemas.items():
-        name = common.normalize_symbol(schema_name)
-        if schema_or_reference.enum is not None:
-            value_dict = schema_or_reference.model_dump()
-            regex = re.compile(r"[\s\/=\*\+]+")
-            value_dict["enum"] = [
-                re.sub(regex, "_", i) if isinstance(i, str) else f"value_{i}"
-                for i in value_dict["enum"]
-            ]
-            m = Model(
-                file_name=name,
-                content=jinja_env.get_template(ENUM_TEMPLATE).render(
-                    name=name, **value_dict
-                ),
-                openapi_object=schema_or_reference,
-                properties=[],
-            )
-            try:
-                compile(m.content, "<string>", "exec")
-                models.append(m)
-            except SyntaxError as e:  # pragma: no cover
-                click.echo(f"Error in model {name}: {e}")
-
-            continue  # pragma: no cover
-
+    # All models are named before any reference is resolved, so the names don't depend on the order of use.
+    names = {
+        schema_name: context.symbols.identifier(MODELS, schema_name)
+        for schema_name in components.schemas
+    }
+    converted: Dict[ir.Node, TypeConversion] = {}
+    for schema_name, node in ir.lower_schemas(
+        components.schemas, context.symbols
+    ).items():
+        name = names[schema_name]
         properties = []
         property_iterator = (
-            schema_or_reference.properties.items()
-            if schema_or_reference.properties is not None
+            node.properties.items()
+            if isinstance(node, ir.SchemaNode)
+            and node.enum is None
+            and node.properties is not None
             else {}
         )
         for prop_name, property in property_iterator:
-            if isinstance(property, Reference30) or isinstance(property, Reference31):
+            if isinstance(property, ir.RefNode):
                 conv_property = _generate_property_from_reference(
-                    name, prop_name, property, schema_or_reference
+                    name, prop_name, property, node
                 )
             else:
                 conv_property = _generate_property_from_schema(
-                    name, prop_name, property, schema_or_reference
+                    name, prop_name, property, node, context, converted
                 )
             properties.append(conv_property)
 
+        models.append(
+            Model(
+                file_name=name,
+                content="",
+                openapi_object=components.schemas[schema_name],
+                properties=properties,
+            )
+        )
+
+    return models
+
+
+def render_models(
+    models: List[Model],
+    pydantic_version: PydanticVersion = PydanticVersion.V2,
+    context: Optional[GenerationContext] = None,
+    workers: Optional[int] = 1,
+) -> List[Model]:
+    """
+    Renders analyzed models into pydantic models (or enums) using jinja2.
+    :param models: The models as returned by analyze_models. They are not modified.
+    :param pydantic_version: The version of pydantic to use.
+    :param context: Options of the generation, defaults to common.default_context()
+    :param workers: Number of processes rendering the models, see render_jobs.
+    :return: A list of models with content.
+    """
+    (contents,) = render_jobs(
+        [model_render_job(models, pydantic_version, context)], workers
+    )
+    return with_model_contents(models, contents)
+
+
+def model_render_job(
+    models: List[Model],
+    pydantic_version: PydanticVersion = PydanticVersion.V2,
+    context: Optional[GenerationContext] = None,
+) -> RenderJob:
+    """
+    The job rendering the contents of analyzed models, to render it together with other jobs, see render_jobs.
+    The contents are put into the models by with_model_contents.
+    """
+    return RenderJob(_render_model_contents, models, (pydantic_version, context))
+
+
+def with_model_contents(
+    models: List[Model], contents: List[Optional[str]]
+) -> List[Model]:
+    """
+    Copies of analyzed models with the contents rendered by their model_render_job, without the models that
+    couldn't be rendered.
+    """
+    return [
+        model.model_copy(update={"content": content})
+        for model, content in zip(models, contents)
+        if content is not None
+    ]
+
+
+def _render_model_contents(
+    models: List[Model],
+    pydantic_version: PydanticVersion,
+    context: Optional[GenerationContext],
+) -> List[Optional[str]]:
+    """
+    Renders the content of the modules of models, None for enums that can't be rendered.
+    """
+    context = context if context is not None else common.default_context()
+    jinja_env = create_jinja_env(context)
+    contents: List[Optional[str]] = []
+
+    for model in models:
+        name = model.file_name
+        schema_or_reference = model.openapi_object
+        if schema_or_reference.enum is not None:
+            content = _render_enum(
+                name, schema_or_reference, jinja_env, pydantic_version, context
+            )
+            try:
+                compile(content, "<string>", "exec")
+                contents.append(content)
+            except SyntaxError as e:  # pragma: no cover
+                click.echo(f"Error in model {name}: {e}")
+                contents.append(None)
+
+            continue  # pragma: no cover
+
         template_name = (
             MODELS_TEMPLATE_PYDANTIC_V2
             if pydantic_version == PydanticVersion.V2
@@ -459,21 +498,135 @@ def generate_models(
         )
 
         generated_content = jinja_env.get_template(template_name).render(
-            schema_name=name, schema=schema_or_reference, properties=properties
+            schema_name=name, schema=schema_or_reference, properties=model.properties
         )
+        generated_content = with_imports(generated_content, formats=context.formats)
 
         try:
             compile(generated_content, "<string>", "exec")
         except SyntaxError as e:  # pragma: no cover
             click.echo(f"Error in model {name}: {e}")  # pragma: no cover
 
-        models.append(
-            Model(
-                file_name=name,
-                content=generated_content,
-                openapi_object=schema_or_reference,
-                properties=properties,
-            )
+        contents.append(generated_content)
+
+    return contents
+
+
+def enum_strategy(
+    values: List[Any], context: Optional[GenerationContext] = None
+) -> EnumStrategy:
+    """
+    Chooses how an enum schema is generated. Unless context.enum_strategy fixes it, enums are generated as
+    Enum classes, which are built lazily above LAZY_ENUM_THRESHOLD values. Above FROZENSET_ENUM_THRESHOLD
+    values, even building them once is too slow, and a type validating against a set of the values is
+    generated instead.
+    :param values: The values of the enum.
+    :param context: Options of the generation, defaults to common.default_context()
+    :return: The strategy to use, never EnumStrategy.AUTO.
+    """
+    context = context if context is not None else common.default_context()
+    if context.enum_strategy != EnumStrategy.AUTO:
+        return context.enum_strategy
+    if len(values) > FROZENSET_ENUM_THRESHOLD:
+        return EnumStrategy.FROZENSET
+    if len(values) > LAZY_ENUM_THRESHOLD:
+        return EnumStrategy.LAZY
+    return EnumStrategy.ENUM
+
+
+def _enum_value_type(values: List[Any]) -> str:
+    """
+    The Python type of all values of an enum, or Any if they have different types.
+    """
+    types = {type(value) for value in values}
+    if types == {str}:
+        return "str"
+    if types == {int}:
+        return "int"
+    if types <= {int, float}:
+        return "float"
+    return "Any"
+
+
+def _enum_members(values: List[Any]) -> List[Tuple[str, str]]:
+    """
+    The member names of a lazily built Enum class, named like the members of the Enum classes of
+    ENUM_TEMPLATE. Names that collide get a numeric suffix.
+    :return: The name and value of each member, as Python literals.
+    """
+    members = []
+    taken: Dict[str, int] = {}
+    for value in values:
+        if isinstance(value, str):
+            member = _enum_member_re.sub("_", value).upper()
+        else:
+            member = f"value_{value}"
+        if member in taken:
+            taken[member] += 1
+            member = f"{member}_{taken[member]}"
+        taken.setdefault(member, 0)
+        members.append((repr(member), repr(value)))
+    return members
+
+
+def _render_enum(
+    name: str,
+    schema: Schema,
+    jinja_env: Environment,
+    pydantic_version: PydanticVersion,
+    context: Optional[GenerationContext],
+) -> str:
+    """
+    Renders an enum schema with the strategy chosen by enum_strategy.
+    :return: The content of the module.
+    """
+    strategy = enum_strategy(schema.enum, context)
+    if strategy == EnumStrategy.ENUM:
+        value_dict = schema.model_dump()
+        value_dict["enum"] = [
+            re.sub(_enum_member_re, "_", i) if isinstance(i, str) else f"value_{i}"
+            for i in value_dict["enum"]
+        ]
+        content = jinja_env.get_template(ENUM_TEMPLATE).render(name=name, **value_dict)
+    elif strategy == EnumStrategy.LAZY:
+        content = jinja_env.get_template(ENUM_LAZY_TEMPLATE).render(
+            name=name, members=_enum_members(schema.enum)
         )
+    else:
+        if strategy == EnumStrategy.LITERAL:
+            template_name = ENUM_LITERAL_TEMPLATE
+        elif pydantic_version == PydanticVersion.V2:
+            template_name = ENUM_FROZENSET_TEMPLATE_PYDANTIC_V2
+        else:
+            template_name = ENUM_FROZENSET_TEMPLATE
+        content = jinja_env.get_template(template_name).render(
+            name=name,
+            values=[repr(value) for value in schema.enum],
+            value_type=_enum_value_type(schema.enum),
+        )
+    return with_imports(
+        content, formats=context.formats if context is not None else None
+    )
 
-    return models
+
+def generate_models(
+    components: Components,
+    pydantic_version: PydanticVersion = PydanticVersion.V2,
+    context: Optional[GenerationContext] = None,
+    workers: Optional[int] = 1,
+) -> List[Model]:
+    """
+    Receives components from an OpenAPI 3.0+ specification and generates the models from it.
+    It does so, by iterating over the components.schemas dictionary. For each schema, it checks if
+    it is a normal schema (i.e. simple type like string, integer, etc.), a reference to another schema, or
+    an array of types/references. It then computes pydantic models from it using jinja2
+    :param components: The components from an OpenAPI 3.0+ specification.
+    :param pydantic_version: The version of pydantic to use.
+    :param context: Options of the generation, defaults to common.default_context()
+    :param workers: Number of processes rendering the models, see render_jobs.
+    :return: A list of models.
+    """
+    context = context if context is not None else common.default_context()
+    return render_models(
+        analyze_models(components, context), pydantic_version, context, workers
+    )
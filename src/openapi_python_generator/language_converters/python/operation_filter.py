@@ -0,0 +1,182 @@
+import fnmatch
+from typing import Any, Dict, List, Optional, Set, Union
+
+from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
+from openapi_pydantic.v3.v3_1 import OpenAPI as OpenAPI31
+
+from openapi_python_generator.language_converters.python import common
+from openapi_python_generator.language_converters.python.service_generator import (
+    HTTP_OPERATIONS,
+)
+from openapi_python_generator.models import OperationFilter, PathItem
+
+OpenAPISpec = Union[OpenAPI30, OpenAPI31]
+
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+
+def operation_matches(
+    operation_filter: OperationFilter, path_name: str, http_op: str, operation: Any
+) -> bool:
+    """
+    Checks if an operation is selected by the filter. An operation is selected if it matches any of the given
+    criteria, i.e. one of its tags, its operationId or its path.
+    :param operation_filter: The filter to apply.
+    :param path_name: The path the operation is defined on.
+    :param http_op: The HTTP method of the operation.
+    :param operation: The operation itself.
+    :return: True if the operation should be generated.
+    """
+    if operation_filter.is_empty():
+        return True
+
+    if operation_filter.include_tags and operation.tags:
+        tags = set(operation_filter.include_tags)
+        for tag in operation.tags:
+            if tag in tags or common.normalize_symbol(tag) in tags:
+                return True
+
+    if operation_filter.include_operations:
+        operation_ids = set(operation_filter.include_operations)
+        if operation.operationId is not None:
+            candidates = [
+                operation.operationId,
+                common.normalize_symbol(operation.operationId),
+            ]
+        else:
+            candidates = [common.normalize_symbol(f"{http_op}_{path_name}")]
+        if any(candidate in operation_ids for candidate in candidates):
+            return True
+
+    return any(
+        fnmatch.fnmatchcase(path_name, pattern)
+        for pattern in operation_filter.include_paths
+    )
+
+
+def filter_paths(
+    paths: Dict[str, PathItem], operation_filter: OperationFilter
+) -> Dict[str, PathItem]:
+    """
+    Removes all operations from the paths object that are not selected by the filter. Path items without any
+    selected operation are dropped entirely.
+    :param paths: The paths object of the specification.
+    :param operation_filter: The filter to apply.
+    :return: A new paths object only containing the selected operations.
+    """
+    if operation_filter.is_empty():
+        return paths
+
+    filtered: Dict[str, PathItem] = {}
+    for path_name, path in paths.items():
+        update = {}
+        selected = False
+        for http_op in HTTP_OPERATIONS:
+            op = getattr(path, http_op)
+            if op is None:
+                continue
+            if operation_matches(operation_filter, path_name, http_op, op):
+                selected = True
+            else:
+                update[http_op] = None
+        if selected:
+            filtered[path_name] = path.model_copy(update=update)
+    return filtered
+
+
+def _collect_refs(data: Any, refs: Set[str]) -> None:
+    """
+    Collects all $ref values within a dumped specification fragment.
+    :param data: Dumped (dict/list) fragment of the specification.
+    :param refs: Set the found references are added to.
+    """
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get("$ref")
+            if isinstance(ref, str):
+                refs.add(ref)
+            # Discriminator mappings reference schemas by plain strings.
+            mapping = current.get("mapping")
+            if isinstance(mapping, dict):
+                refs.update(v for v in mapping.values() if isinstance(v, str))
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def _resolve_component(components: Any, ref: str) -> Optional[Any]:
+    """
+    Resolves a local reference of the form #/components/<section>/<name>.
+    :param components: The components object of the specification.
+    :param ref: The reference to resolve.
+    :return: The referenced component or None if it can't be resolved.
+    """
+    parts = ref.split("/")
+    if len(parts) != 4 or parts[0] != "#" or parts[1] != "components":
+        return None
+    section = getattr(components, parts[2], None)
+    if not isinstance(section, dict):
+        return None
+    return section.get(parts[3])
+
+
+def reachable_schemas(paths: Dict[str, PathItem], components: Any) -> List[str]:
+    """
+    Walks all references starting at the given paths and returns the names of all schemas in
+    components.schemas that are reachable from them, including references through other components
+    (responses, parameters, request bodies, ...) and transitively through other schemas.
+    :param paths: The paths object to start the walk from.
+    :param components: The components object of the specification.
+    :return: Names of the reachable schemas, in the order of components.schemas.
+    """
+    pending: Set[str] = set()
+    for path in paths.values():
+        _collect_refs(path.model_dump(by_alias=True, exclude_none=True), pending)
+
+    visited: Set[str] = set()
+    while pending:
+        ref = pending.pop()
+        if ref in visited:
+            continue
+        visited.add(ref)
+        component = _resolve_component(components, ref)
+        if component is None:
+            continue
+        found: Set[str] = set()
+        _collect_refs(component.model_dump(by_alias=True, exclude_none=True), found)
+        pending.update(found - visited)
+
+    schemas = components.schemas or {}
+    return [name for name in schemas if SCHEMA_REF_PREFIX + name in visited]
+
+
+def apply_operation_filter(
+    data: OpenAPISpec, operation_filter: Optional[OperationFilter]
+) -> OpenAPISpec:
+    """
+    Tree-shakes the specification: only the operations selected by the filter are kept, and only the schemas
+    reachable from these operations remain in components.schemas.
+    :param data: The parsed specification.
+    :param operation_filter: The filter to apply. If None or empty, the specification is returned unchanged.
+    :return: The pruned specification.
+    """
+    if operation_filter is None or operation_filter.is_empty():
+        return data
+
+    paths = filter_paths(data.paths or {}, operation_filter)
+    update: Dict[str, Any] = {"paths": paths}
+
+    if data.components is not None and data.components.schemas is not None:
+        schemas = data.components.schemas
+        update["components"] = data.components.model_copy(
+            update={
+                "schemas": {
+                    name: schemas[name]
+                    for name in reachable_schemas(paths, data.components)
+                }
+            }
+        )
+
+    return data.model_copy(update=update)
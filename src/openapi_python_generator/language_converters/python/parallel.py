@@ -0,0 +1,53 @@
+"""
+Rendering over a pool of processes.
+
+Models and operations are rendered independently of each other, so they can be split into chunks which are
+rendered in worker processes. Everything the rendering depends on, e.g. the formats of the generation, is
+passed along in the GenerationContext. The workers only send back the rendered content, which the current
+process puts into the models and operations, in their original order.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+
+class RenderJob(NamedTuple):
+    """
+    Items to render, called as render(chunk, *args). render must be a module-level function, and its results
+    must not depend on the order of the chunks.
+    """
+
+    render: Callable[..., List[Any]]
+    items: Sequence[Any]
+    args: Sequence[Any] = ()
+
+
+def render_jobs(jobs: Sequence[RenderJob], workers: Optional[int]) -> List[List[Any]]:
+    """
+    Renders several jobs, with more than one worker in chunks over a single pool of processes, so the chunks
+    of all jobs (e.g. the models of every pydantic version of several targets) are rendered concurrently.
+    :param jobs: The jobs to render.
+    :param workers: Number of worker processes, None for one per CPU. With one worker, everything is
+        rendered in the current process.
+    :return: For every job, the concatenated results of its chunks, in the order of its items.
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    total = sum(len(job.items) for job in jobs)
+    if workers == 1 or total <= 1:
+        return [job.render(list(job.items), *job.args) for job in jobs]
+
+    size = max(1, -(-total // (workers * 4)))
+    chunks = [
+        (index, job, list(job.items[i : i + size]))
+        for index, job in enumerate(jobs)
+        for i in range(0, len(job.items), size)
+    ]
+    results: List[List[Any]] = [[] for _ in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(job.render, chunk, *job.args) for _, job, chunk in chunks
+        ]
+        for (index, _, _), future in zip(chunks, futures):
+            results[index].extend(future.result())
+    return results
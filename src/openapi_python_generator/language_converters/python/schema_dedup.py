@@ -0,0 +1,133 @@
+"""
+Structural deduplication of the schemas of a specification.
+"""
+
+from typing import Any, Dict, Tuple, Union
+
+import orjson
+from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
+from openapi_pydantic.v3.v3_1 import OpenAPI as OpenAPI31
+from pydantic import BaseModel
+
+OpenAPISpec = Union[OpenAPI30, OpenAPI31]
+
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# Keys which only document a schema, and don't change the generated types.
+DOCUMENTATION_KEYS = frozenset(
+    ["title", "description", "example", "examples", "externalDocs"]
+)
+
+
+def _canonical(
+    value: Any, duplicates: Dict[str, str], in_properties: bool = False
+) -> Any:
+    """
+    The canonical form of a dumped schema: without documentation, and with references to duplicates replaced
+    by references to the schema they are merged into.
+    """
+    if isinstance(value, dict):
+        canonical = {}
+        for key, item in value.items():
+            if not in_properties and key in DOCUMENTATION_KEYS:
+                continue
+            if key == "$ref" and isinstance(item, str):
+                name = item[len(SCHEMA_REF_PREFIX) :]
+                if item.startswith(SCHEMA_REF_PREFIX) and name in duplicates:
+                    item = SCHEMA_REF_PREFIX + duplicates[name]
+                canonical[key] = item
+            else:
+                # The keys of a properties map are property names, even if they look like documentation
+                item_in_properties = not in_properties and key == "properties"
+                canonical[key] = _canonical(
+                    item, duplicates, in_properties=item_in_properties
+                )
+        return canonical
+    if isinstance(value, list):
+        return [_canonical(item, duplicates) for item in value]
+    return value
+
+
+def find_duplicate_schemas(schemas: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Finds the schemas that are structurally identical to an earlier schema, i.e. equal apart from their
+    documentation. Schemas which only differ in references to identical schemas are identical as well.
+    :param schemas: components.schemas of the specification.
+    :return: Mapping of the name of every duplicate to the name of the first identical schema.
+    """
+    dumped = {
+        name: schema.model_dump(by_alias=True, exclude_none=True)
+        for name, schema in schemas.items()
+    }
+    duplicates: Dict[str, str] = {}
+    # Merging schemas can make the schemas referencing them identical, so repeat until nothing changes.
+    for _ in range(len(schemas) + 1):
+        first: Dict[bytes, str] = {}
+        found: Dict[str, str] = {}
+        for name, schema in dumped.items():
+            key = orjson.dumps(
+                _canonical(schema, duplicates), option=orjson.OPT_SORT_KEYS
+            )
+            if key in first:
+                found[name] = first[key]
+            else:
+                first[key] = name
+        if found == duplicates:
+            break
+        duplicates = found
+    return duplicates
+
+
+def _rewrite_refs(value: Any, refs: Dict[str, str]) -> Any:
+    """
+    Replaces references within a part of the parsed specification. Objects are copied only if something
+    within them changes, the parsed specification itself isn't modified.
+    """
+    if isinstance(value, str):
+        return refs.get(value, value)
+    if isinstance(value, BaseModel):
+        update = {}
+        for field in type(value).model_fields:
+            item = getattr(value, field)
+            rewritten = _rewrite_refs(item, refs)
+            if rewritten is not item:
+                update[field] = rewritten
+        return value.model_copy(update=update) if update else value
+    if isinstance(value, list):
+        items = [_rewrite_refs(item, refs) for item in value]
+        changed = any(new is not old for new, old in zip(items, value))
+        return items if changed else value
+    if isinstance(value, dict):
+        entries = {key: _rewrite_refs(item, refs) for key, item in value.items()}
+        changed = any(entries[key] is not item for key, item in value.items())
+        return entries if changed else value
+    return value
+
+
+def deduplicate_schemas(data: OpenAPISpec) -> Tuple[OpenAPISpec, Dict[str, str]]:
+    """
+    Merges structurally identical schemas: only the first of them is kept, and all references to the others
+    are replaced by references to it.
+    :param data: The parsed specification.
+    :return: The specification without duplicates, and the mapping of the name of every removed schema to the
+        name of the schema it was merged into.
+    """
+    if data.components is None or not data.components.schemas:
+        return data, {}
+    duplicates = find_duplicate_schemas(data.components.schemas)
+    if not duplicates:
+        return data, {}
+
+    refs = {
+        SCHEMA_REF_PREFIX + duplicate: SCHEMA_REF_PREFIX + name
+        for duplicate, name in duplicates.items()
+    }
+    schemas = {
+        name: schema
+        for name, schema in data.components.schemas.items()
+        if name not in duplicates
+    }
+    data = data.model_copy(
+        update={"components": data.components.model_copy(update={"schemas": schemas})}
+    )
+    return _rewrite_refs(data, refs), duplicates
@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypeVar, Union
 
 import click
 from openapi_pydantic.v3 import (
@@ -8,7 +8,6 @@ from openapi_pydantic.v3 import (
     PathItem,
     Reference,
     Response,
-    Schema,
 )
 from openapi_pydantic.v3.v3_0 import (
     MediaType as MediaType30,
@@ -37,6 +36,7 @@ from openapi_pydantic.v3.v3_1 import (
     Schema as Schema31,
 )
 
+from openapi_python_generator.common import ServiceSplit
 from openapi_python_generator.language_converters.python import common
 from openapi_python_generator.language_converters.python.common import normalize_symbol
 from openapi_python_generator.language_converters.python.jinja_config import (
@@ -45,7 +45,18 @@ from openapi_python_generator.language_converters.python.jinja_config import (
 from openapi_python_generator.language_converters.python.model_generator import (
     type_converter,
 )
+from openapi_python_generator.language_converters.python.parallel import (
+    RenderJob,
+    render_jobs,
+)
+from openapi_python_generator.language_converters.python.symbols import (
+    MODELS,
+    OPERATIONS,
+    SERVICES,
+    SymbolTable,
+)
 from openapi_python_generator.models import (
+    GenerationContext,
     LibraryConfig,
     OpReturnType,
     Service,
@@ -53,6 +64,8 @@ from openapi_python_generator.models import (
     TypeConversion,
 )
 
+T = TypeVar("T")
+
 
 # Helper functions for isinstance checks across OpenAPI versions
 def is_response_type(obj) -> bool:
@@ -89,6 +102,14 @@ def is_schema_type(obj: Any) -> bool:
     return isinstance(obj, (Schema30, Schema31))
 
 
+def _model_name(reference: Any, context: Optional[GenerationContext]) -> str:
+    """
+    The name of the model a reference points to.
+    """
+    context = context if context is not None else common.default_context()
+    return context.symbols.identifier(MODELS, reference.ref.split("/")[-1])
+
+
 HTTP_OPERATIONS = ["get", "post", "put", "delete", "options", "head", "patch", "trace"]
 
 
@@ -96,9 +117,7 @@ def generate_body_param(operation: Operation) -> Union[str, None]:
     if operation.requestBody is None:
         return None
     else:
-        if isinstance(operation.requestBody, Reference30) or isinstance(
-            operation.requestBody, Reference31
-        ):
+        if is_reference_type(operation.requestBody):
             return "data.dict()"
 
         if operation.requestBody.content is None:
@@ -112,14 +131,12 @@ def generate_body_param(operation: Operation) -> Union[str, None]:
         if media_type is None:
             return None  # pragma: no cover
 
-        if isinstance(
-            media_type.media_type_schema, (Reference, Reference30, Reference31)
-        ):
+        if is_reference_type(media_type.media_type_schema):
             return "data.dict()"
         elif hasattr(media_type.media_type_schema, "ref"):
             # Handle Reference objects from different OpenAPI versions
             return "data.dict()"
-        elif isinstance(media_type.media_type_schema, (Schema, Schema30, Schema31)):
+        elif is_schema_type(media_type.media_type_schema):
             schema = media_type.media_type_schema
             if schema.type == "array":
                 return "[i.dict() for i in data]"
@@ -135,13 +152,17 @@ def generate_body_param(operation: Operation) -> Union[str, None]:
             )  # pragma: no cover
 
 
-def generate_params(operation: Operation) -> str:
+def generate_params(
+    operation: Operation, context: Optional[GenerationContext] = None
+) -> str:
+    context = context if context is not None else common.default_context()
+
     def _generate_params_from_content(content: Any):
         # Accept reference from either 3.0 or 3.1
-        if isinstance(content, (Reference, Reference30, Reference31)):
-            return f"data : {content.ref.split('/')[-1]}"  # type: ignore
-        elif isinstance(content, (Schema, Schema30, Schema31)):
-            return f"data : {type_converter(content, True).converted_type}"  # type: ignore
+        if is_reference_type(content):
+            return f"data : {_model_name(content, context)}"  # type: ignore
+        elif is_schema_type(content):
+            return f"data : {type_converter(content, True, context=context).converted_type}"  # type: ignore
         else:  # pragma: no cover
             raise Exception(f"Unsupported request body schema type: {type(content)}")
 
@@ -158,26 +179,16 @@ def generate_params(operation: Operation) -> str:
             required = False
             param_name_cleaned = common.normalize_symbol(param.name)
 
-            if isinstance(param.param_schema, Schema30) or isinstance(
-                param.param_schema, Schema31
-            ):
+            if is_schema_type(param.param_schema):
                 converted_result = (
-                    f"{param_name_cleaned} : {type_converter(param.param_schema, param.required).converted_type}"
+                    f"{param_name_cleaned} : {type_converter(param.param_schema, param.required, context=context).converted_type}"
                     + ("" if param.required else " = None")
                 )
                 required = param.required
-            elif isinstance(param.param_schema, Reference30) or isinstance(
-                param.param_schema, Reference31
-            ):
+            elif is_reference_type(param.param_schema):
                 converted_result = (
-                    f"{param_name_cleaned} : {param.param_schema.ref.split('/')[-1] }"
-                    + (
-                        ""
-                        if isinstance(param, Reference30)
-                        or isinstance(param, Reference31)
-                        or param.required
-                        else " = None"
-                    )
+                    f"{param_name_cleaned} : {_model_name(param.param_schema, context)}"
+                    + ("" if is_reference_type(param) or param.required else " = None")
                 )
                 required = isinstance(param, Reference) or param.required
 
@@ -207,10 +218,7 @@ def generate_params(operation: Operation) -> str:
             content = rb_content.get(get_keyword)
             if content is not None and hasattr(content, "media_type_schema"):
                 mts = getattr(content, "media_type_schema", None)
-                if isinstance(
-                    mts,
-                    (Reference, Reference30, Reference31, Schema, Schema30, Schema31),
-                ):
+                if is_reference_type(mts) or is_schema_type(mts):
                     params += f"{_generate_params_from_content(mts)}, "
                 else:  # pragma: no cover
                     raise Exception(
@@ -225,16 +233,26 @@ def generate_params(operation: Operation) -> str:
 
 
 def generate_operation_id(
-    operation: Operation, http_op: str, path_name: Optional[str] = None
+    operation: Operation,
+    http_op: str,
+    path_name: Optional[str] = None,
+    symbols: Optional[SymbolTable] = None,
 ) -> str:
+    """
+    Gets the name of the function of an operation: its operationId, or the method and path if it has none.
+    With a symbol table, operations with colliding names get unique names.
+    """
     if operation.operationId is not None:
-        return common.normalize_symbol(operation.operationId)
+        name = operation.operationId
     elif path_name is not None:
-        return common.normalize_symbol(f"{http_op}_{path_name}")
+        name = f"{http_op}_{path_name}"
     else:
         raise Exception(
             f"OperationId is not defined for {http_op} of path_name {path_name} --> {operation.summary}"
         )  # pragma: no cover
+    if symbols is None:
+        return common.normalize_symbol(name)
+    return symbols.identifier(OPERATIONS, name, key=(path_name, http_op))
 
 
 def _generate_params(
@@ -260,7 +278,9 @@ def generate_header_params(operation: Operation) -> List[str]:
     return _generate_params(operation, "header")
 
 
-def generate_return_type(operation: Operation) -> OpReturnType:
+def generate_return_type(
+    operation: Operation, context: Optional[GenerationContext] = None
+) -> OpReturnType:
     if operation.responses is None:
         return OpReturnType(type=None, status_code=200, complex_type=False)
 
@@ -290,10 +310,11 @@ def generate_return_type(operation: Operation) -> OpReturnType:
     if is_media_type(media_type_schema):
         inner_schema = getattr(media_type_schema, "media_type_schema", None)
         if is_reference_type(inner_schema):
+            model_name = _model_name(inner_schema, context)
             type_conv = TypeConversion(
                 original_type=inner_schema.ref,  # type: ignore
-                converted_type=inner_schema.ref.split("/")[-1],  # type: ignore
-                import_types=[inner_schema.ref.split("/")[-1]],  # type: ignore
+                converted_type=model_name,
+                import_types=[model_name],
             )
             return OpReturnType(
                 type=type_conv,
@@ -301,7 +322,7 @@ def generate_return_type(operation: Operation) -> OpReturnType:
                 complex_type=True,
             )
         elif is_schema_type(inner_schema):
-            converted_result = type_converter(inner_schema, True)  # type: ignore
+            converted_result = type_converter(inner_schema, True, context=context)  # type: ignore
             if "array" in converted_result.original_type and isinstance(
                 converted_result.import_types, list
             ):
@@ -335,18 +356,21 @@ def generate_return_type(operation: Operation) -> OpReturnType:
         raise Exception("Unknown media type schema type")  # pragma: no cover
 
 
-def generate_services(
-    paths: Dict[str, PathItem], library_config: LibraryConfig
-) -> List[Service]:
+def analyze_service_operations(
+    paths: Dict[str, PathItem], context: Optional[GenerationContext] = None
+) -> List[ServiceOperation]:
     """
-    Generates services from a paths object.
+    Analyzes all operations of a paths object, in the order of the paths: their parameters, return types,
+    bodies and tags. This doesn't depend on the HTTP library, the content of the returned operations is empty
+    and filled by render_service_operations.
     :param paths: paths object to be converted
-    :return: List of services
+    :param context: Options of the generation, defaults to common.default_context()
+    :return: List of service operations without content
     """
-    jinja_env = create_jinja_env()
+    context = context if context is not None else common.default_context()
 
-    def generate_service_operation(
-        op: Operation, path_name: str, async_type: bool
+    def analyze_service_operation(
+        op: Operation, path_name: str, path: PathItem, http_operation: str
     ) -> ServiceOperation:
         # Merge path-level parameters (always required by spec) into the
         # operation-level parameters so they get turned into function args.
@@ -360,18 +384,23 @@ def generate_services(
                     for p in op.parameters:  # type: ignore
                         if isinstance(p, Parameter):
                             existing_names.add(p.name)
-                for p in path_level_params:
-                    if isinstance(p, Parameter) and p.name not in existing_names:
-                        if op.parameters is None:
-                            op.parameters = []  # type: ignore
-                        op.parameters.append(p)  # type: ignore
+                missing = [
+                    p
+                    for p in path_level_params
+                    if isinstance(p, Parameter) and p.name not in existing_names
+                ]
+                if missing:
+                    # Work on a copy, the parsed specification may be shared with other generations.
+                    op = op.model_copy(
+                        update={"parameters": list(op.parameters or []) + missing}
+                    )
         except Exception:  # pragma: no cover
             print(
                 f"Error merging path-level parameters for {path_name}"
             )  # pragma: no cover
             pass
 
-        params = generate_params(op)
+        params = generate_params(op, context)
         # Fallback: ensure all {placeholders} in path are present as function params
         try:
             placeholder_names = [
@@ -389,103 +418,254 @@ def generate_services(
                 f"Error ensuring path placeholders in params for {path_name}"
             )  # pragma: no cover
             pass
-        operation_id = generate_operation_id(op, http_operation, path_name)
-        query_params = generate_query_params(op)
-        header_params = generate_header_params(op)
-        return_type = generate_return_type(op)
-        body_param = generate_body_param(op)
 
         so = ServiceOperation(
             params=params,
-            operation_id=operation_id,
-            query_params=query_params,
-            header_params=header_params,
-            return_type=return_type,
+            operation_id=generate_operation_id(
+                op, http_operation, path_name, context.symbols
+            ),
+            query_params=generate_query_params(op),
+            header_params=generate_header_params(op),
+            return_type=generate_return_type(op, context),
             operation=op,
             pathItem=path,
             content="",
-            async_client=async_type,
-            body_param=body_param,
+            body_param=generate_body_param(op),
             path_name=path_name,
             method=http_operation,
-            use_orjson=common.get_use_orjson(),
-        )
-
-        so.content = jinja_env.get_template(library_config.template_name).render(
-            **so.model_dump()
+            use_orjson=context.use_orjson,
         )
 
         if op.tags is not None and len(op.tags) > 0:
             so.tag = normalize_symbol(op.tags[0])
-
-        try:
-            compile(so.content, "<string>", "exec")
-        except SyntaxError as e:  # pragma: no cover
-            click.echo(f"Error in service {so.operation_id}: {e}")  # pragma: no cover
+        else:
+            # Fallback to "default" for untagged operations
+            so.tag = "default"
 
         return so
 
-    services = []
     service_ops = []
     for path_name, path in paths.items():
         for http_operation in HTTP_OPERATIONS:
             op = path.__getattribute__(http_operation)
             if op is None:
                 continue
+            service_ops.append(
+                analyze_service_operation(op, path_name, path, http_operation)
+            )
 
-            if library_config.include_sync:
-                sync_so = generate_service_operation(op, path_name, False)
-                service_ops.append(sync_so)
+    return service_ops
 
-            if library_config.include_async:
-                async_so = generate_service_operation(op, path_name, True)
-                service_ops.append(async_so)
 
-    # Ensure every operation has a tag; fallback to "default" for untagged operations
-    for so in service_ops:
-        if not so.tag:
-            so.tag = "default"
+def _async_types(library_config: LibraryConfig) -> List[bool]:
+    async_types = []
+    if library_config.include_sync:
+        async_types.append(False)
+    if library_config.include_async:
+        async_types.append(True)
+    return async_types
 
-    tags = list({so.tag for so in service_ops})
-
-    for tag in tags:
-        services.append(
-            Service(
-                file_name=f"{tag}_service",
-                operations=[
-                    so for so in service_ops if so.tag == tag and not so.async_client
-                ],
-                content="\n".join(
-                    [
-                        so.content
-                        for so in service_ops
-                        if so.tag == tag and not so.async_client
-                    ]
-                ),
-                async_client=False,
-                library_import=library_config.library_name,
-                use_orjson=common.get_use_orjson(),
-            )
+
+def render_service_operations(
+    service_ops: List[ServiceOperation],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext] = None,
+    workers: Optional[int] = 1,
+) -> List[ServiceOperation]:
+    """
+    Renders analyzed operations with the template of the HTTP library. Every operation is rendered as sync
+    and/or async function, depending on what the library supports.
+    :param service_ops: The operations as returned by analyze_service_operations. They are not modified.
+    :param library_config: The library the operations are rendered for
+    :param context: Options of the generation, defaults to common.default_context()
+    :param workers: Number of processes rendering the operations, see render_jobs.
+    :return: List of rendered service operations
+    """
+    (contents,) = render_jobs(
+        [operation_render_job(service_ops, library_config, context)], workers
+    )
+    return with_operation_contents(service_ops, contents, library_config)
+
+
+def operation_render_job(
+    service_ops: List[ServiceOperation],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext] = None,
+) -> RenderJob:
+    """
+    The job rendering the functions of analyzed operations, to render it together with other jobs, see
+    render_jobs. The functions are put into the operations by with_operation_contents.
+    """
+    return RenderJob(_render_operation_contents, service_ops, (library_config, context))
+
+
+def with_operation_contents(
+    service_ops: List[ServiceOperation],
+    contents: List[str],
+    library_config: LibraryConfig,
+) -> List[ServiceOperation]:
+    """
+    The sync and/or async variants of analyzed operations, with the functions rendered by their
+    operation_render_job.
+    """
+    functions = iter(contents)
+    return [
+        analyzed.model_copy(
+            update={"async_client": async_type, "content": next(functions)}
         )
+        for analyzed in service_ops
+        for async_type in _async_types(library_config)
+    ]
 
-    for tag in tags:
-        services.append(
-            Service(
-                file_name=f"async_{tag}_service",
-                operations=[
-                    so for so in service_ops if so.tag == tag and so.async_client
-                ],
-                content="\n".join(
-                    [
-                        so.content
-                        for so in service_ops
-                        if so.tag == tag and so.async_client
-                    ]
-                ),
-                async_client=True,
-                library_import=library_config.library_name,
-                use_orjson=common.get_use_orjson(),
+
+def _render_operation_contents(
+    service_ops: List[ServiceOperation],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext],
+) -> List[str]:
+    """
+    Renders the functions of operations, for every operation the sync and/or async function.
+    """
+    jinja_env = create_jinja_env(context)
+    template = jinja_env.get_template(library_config.template_name)
+
+    contents = []
+    for analyzed in service_ops:
+        for async_type in _async_types(library_config):
+            so = analyzed.model_copy(update={"async_client": async_type})
+            content = template.render(**so.model_dump())
+
+            try:
+                compile(content, "<string>", "exec")
+            except SyntaxError as e:  # pragma: no cover
+                click.echo(
+                    f"Error in service {so.operation_id}: {e}"
+                )  # pragma: no cover
+
+            contents.append(content)
+
+    return contents
+
+
+def generate_service_operations(
+    paths: Dict[str, PathItem],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext] = None,
+    workers: Optional[int] = 1,
+) -> List[ServiceOperation]:
+    """
+    Generates the operations of all services from a paths object, in the order of the paths.
+    :param paths: paths object to be converted
+    :param library_config: The library the operations are rendered for
+    :param context: Options of the generation, defaults to common.default_context()
+    :param workers: Number of processes rendering the operations, see render_jobs.
+    :return: List of service operations
+    """
+    context = context if context is not None else common.default_context()
+    return render_service_operations(
+        analyze_service_operations(paths, context), library_config, context, workers
+    )
+
+
+def service_module_name(
+    service_op: ServiceOperation, context: GenerationContext
+) -> Optional[str]:
+    """
+    Gets the name of the service module an operation belongs to, without the suffix.
+    :param service_op: The operation
+    :param context: Options of the generation, selecting the strategy
+    :return: The first tag of the operation, or the first static segment of its path
+    """
+    if context.service_split == ServiceSplit.PATH:
+        for segment in service_op.path_name.split("/"):
+            if segment and not segment.startswith("{"):
+                return common.normalize_symbol(segment) or "default"
+        return "default"
+    return service_op.tag
+
+
+def _chunks(items: List[T], size: Optional[int]) -> List[List[T]]:
+    if size is None or len(items) <= size:
+        return [items]
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def group_service_operations(
+    service_ops: List[ServiceOperation],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext] = None,
+) -> List[Service]:
+    """
+    Groups service operations into one sync and one async service per tag or path prefix, as selected by
+    context.service_split. Services with more than context.max_operations_per_service operations are split
+    into several numbered modules.
+    :param service_ops: The operations to group
+    :param library_config: The library the operations were rendered for
+    :param context: Options of the generation, defaults to common.default_context()
+    :return: List of services
+    """
+    context = context if context is not None else common.default_context()
+
+    modules: Dict[str, List[ServiceOperation]] = {}
+    for so in service_ops:
+        name = service_module_name(so, context)
+        if name is not None:
+            modules.setdefault(name, []).append(so)
+
+    services: Dict[bool, List[Service]] = {False: [], True: []}
+
+    # Sorted, so the generated output doesn't depend on hash randomization. The names of the modules are
+    # reserved first, so the numbered chunks of a split module never take the name of another module.
+    names = sorted(modules)
+    for name in names:
+        context.symbols.identifier(SERVICES, name)
+    for name in names:
+        for async_client in (False, True):
+            chunks = _chunks(
+                [so for so in modules[name] if bool(so.async_client) == async_client],
+                context.max_operations_per_service,
             )
-        )
+            for index, operations in enumerate(chunks, start=1):
+                file_name = (
+                    context.symbols.identifier(
+                        SERVICES, f"{name}_{index}", key=(name, index)
+                    )
+                    if len(chunks) > 1
+                    else context.symbols.identifier(SERVICES, name)
+                )
+                services[async_client].append(
+                    Service(
+                        file_name=(
+                            f"async_{file_name}_service"
+                            if async_client
+                            else f"{file_name}_service"
+                        ),
+                        operations=operations,
+                        content="\n".join([so.content for so in operations]),
+                        async_client=async_client,
+                        library_import=library_config.library_name,
+                        use_orjson=context.use_orjson,
+                    )
+                )
+
+    return services[False] + services[True]
+
 
-    return services
+def generate_services(
+    paths: Dict[str, PathItem],
+    library_config: LibraryConfig,
+    context: Optional[GenerationContext] = None,
+) -> List[Service]:
+    """
+    Generates services from a paths object.
+    :param paths: paths object to be converted
+    :param library_config: The library the services are rendered for
+    :param context: Options of the generation, defaults to common.default_context()
+    :return: List of services
+    """
+    context = context if context is not None else common.default_context()
+    return group_service_operations(
+        generate_service_operations(paths, library_config, context),
+        library_config,
+        context,
+    )
@@ -0,0 +1,76 @@
+"""
+Python identifiers of the names used in a specification.
+"""
+
+import keyword
+import re
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+_symbol_ascii_strip_re = re.compile(r"[^A-Za-z0-9_]")
+
+# Namespaces of the symbol table. Models are modules of the models package, so their names must not collide
+# on case-insensitive file systems either.
+MODELS = "models"
+OPERATIONS = "operations"
+SERVICES = "services"
+CASE_INSENSITIVE_NAMESPACES = frozenset([MODELS])
+
+
+@lru_cache(maxsize=65536)
+def normalize_symbol(symbol: str) -> str:
+    """
+    Remove invalid characters & keywords in Python symbol names
+    :param symbol: name of the identifier
+    :return: normalized identifier name
+    """
+    symbol = symbol.replace("-", "_")
+    normalized_symbol = _symbol_ascii_strip_re.sub("", symbol)
+    if normalized_symbol in keyword.kwlist:
+        normalized_symbol = normalized_symbol + "_"
+    return normalized_symbol
+
+
+class SymbolTable:
+    """
+    Assigns the identifiers of one generation. Every name gets the normalized name as identifier, unless it
+    is already taken by another name of the same namespace. Then a numeric suffix is added, so distinct names
+    never end up as the same module or function. The identifier of a name never changes once it is assigned,
+    so names should be added in the order of the specification.
+    """
+
+    def __init__(self) -> None:
+        self._identifiers: Dict[Tuple[str, Hashable], str] = {}
+        self._taken: Dict[str, Set[str]] = {}
+        self.renamed: List[Tuple[str, str, str]] = []
+
+    def identifier(
+        self, namespace: str, name: str, key: Optional[Hashable] = None
+    ) -> str:
+        """
+        Gets the identifier of a name, assigning it on first use.
+        :param namespace: The namespace the identifier must be unique in, e.g. MODELS.
+        :param name: The name in the specification.
+        :param key: What the name belongs to, if distinct objects may have the same name (e.g. the path and
+            method of an operation). Defaults to the name.
+        :return: The identifier.
+        """
+        identifiers_key = (namespace, name if key is None else key)
+        identifier = self._identifiers.get(identifiers_key)
+        if identifier is not None:
+            return identifier
+
+        fold = namespace in CASE_INSENSITIVE_NAMESPACES
+        taken = self._taken.setdefault(namespace, set())
+        normalized = normalize_symbol(name)
+        identifier = normalized
+        suffix = 0
+        while (identifier.lower() if fold else identifier) in taken:
+            suffix += 1
+            identifier = f"{normalized}_{suffix}"
+
+        taken.add(identifier.lower() if fold else identifier)
+        self._identifiers[identifiers_key] = identifier
+        if identifier != normalized:
+            self.renamed.append((namespace, name, identifier))
+        return identifier
@@ -0,0 +1,118 @@
+"""
+Table of the Python types OpenAPI types and formats are converted to.
+
+Custom formats can be registered, e.g. to convert decimals or dates:
+
+    register_format("string", "decimal", "Decimal", module="decimal")
+
+Every generation copies the registered formats when it starts (GenerationContext.formats) and only reads its
+copy, so concurrent generations with different formats don't affect each other.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from openapi_python_generator.language_converters.python import ir
+from openapi_python_generator.models import FormatMapping, Formats
+
+# Types used if a schema has no format, or a format without a mapping.
+BASE_TYPES: Dict[str, FormatMapping] = {
+    ir.STRING: FormatMapping(python_type="str"),
+    ir.INTEGER: FormatMapping(python_type="int"),
+    ir.NUMBER: FormatMapping(python_type="float"),
+    ir.BOOLEAN: FormatMapping(python_type="bool"),
+    ir.OBJECT: FormatMapping(python_type="Dict[str, Any]"),
+    ir.NULL: FormatMapping(python_type="None"),
+}
+
+# Fallback for unknown types.
+DEFAULT_TYPE = FormatMapping(python_type="str")
+
+# Formats are only converted if orjson is used throughout the code, otherwise we can not serialize them to JSON.
+BUILTIN_FORMATS: Dict[Tuple[str, str], FormatMapping] = {
+    (ir.STRING, "date-time"): FormatMapping(
+        python_type="datetime", module="datetime", requires_orjson=True
+    ),
+    (ir.STRING, "uuid"): FormatMapping(
+        python_type="UUID", module="uuid", requires_orjson=True
+    ),
+    **{
+        (ir.STRING, f"uuid{version}"): FormatMapping(
+            python_type=f"UUID{version}", module="pydantic", requires_orjson=True
+        )
+        for version in (1, 3, 4, 5)
+    },
+}
+
+_formats: Dict[Tuple[str, str], FormatMapping] = dict(BUILTIN_FORMATS)
+
+
+def register_format(
+    schema_type: str,
+    schema_format: str,
+    python_type: str,
+    module: Optional[str] = None,
+    requires_orjson: bool = False,
+) -> None:
+    """
+    Registers the Python type schemas with the given type and format are converted to. A registration for
+    the same type and format replaces the previous one, including the built-in ones.
+    :param schema_type: The OpenAPI type, e.g. string.
+    :param schema_format: The format, e.g. decimal.
+    :param python_type: Name of the Python type, e.g. Decimal.
+    :param module: Module the type is imported from, e.g. decimal. None for builtins and typing.
+    :param requires_orjson: Only convert the format if orjson is used, because the type can't be
+        serialized by json.
+    """
+    _formats[(ir.intern_type(schema_type), schema_format)] = FormatMapping(
+        python_type=python_type, module=module, requires_orjson=requires_orjson
+    )
+
+
+def unregister_format(schema_type: str, schema_format: str) -> None:
+    """
+    Removes the mapping of a format, schemas with it are converted to the type without format again.
+    """
+    _formats.pop((ir.intern_type(schema_type), schema_format), None)
+
+
+def registered_formats() -> Formats:
+    """
+    A copy of the registered formats, by type and format. Every generation starts with a copy, see
+    GenerationContext.formats, so registering a format doesn't affect generations that already started.
+    """
+    return dict(_formats)
+
+
+def lookup(
+    schema_type: Optional[str],
+    schema_format: Optional[str],
+    use_orjson: bool,
+    formats: Optional[Formats] = None,
+) -> FormatMapping:
+    """
+    The Python type of a schema without composition and items.
+    :param schema_type: The interned type of the schema.
+    :param schema_format: The format of the schema.
+    :param use_orjson: If orjson is used by the generated code.
+    :param formats: The formats of the generation, see GenerationContext.formats. Defaults to the registered ones.
+    :return: The mapping of the format if there is one, otherwise the one of the type.
+    """
+    formats = formats if formats is not None else _formats
+    if schema_format is not None:
+        mapping = formats.get((schema_type, schema_format))  # type: ignore
+        if mapping is not None and (use_orjson or not mapping.requires_orjson):
+            return mapping
+    return BASE_TYPES.get(schema_type, DEFAULT_TYPE)  # type: ignore
+
+
+def imported_names(formats: Optional[Formats] = None) -> Dict[str, str]:
+    """
+    The modules the types of all formats are imported from, by the name of the type.
+    :param formats: The formats of the generation, see GenerationContext.formats. Defaults to the registered ones.
+    """
+    formats = formats if formats is not None else _formats
+    return {
+        mapping.python_type: mapping.module
+        for mapping in formats.values()
+        if mapping.module is not None
+    }
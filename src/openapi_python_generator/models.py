@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from openapi_pydantic.v3.v3_0 import (
     Operation as Operation30,
@@ -18,7 +18,15 @@ from openapi_pydantic.v3.v3_1 import (
 from openapi_pydantic.v3.v3_1 import (
     Schema as Schema31,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from openapi_python_generator.common import (
+    EnumStrategy,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+)
+from openapi_python_generator.language_converters.python.symbols import SymbolTable
 
 # Type unions for compatibility with both OpenAPI 3.0 and 3.1
 Operation = Union[Operation30, Operation31]
@@ -34,6 +42,70 @@ class LibraryConfig(BaseModel):
     include_sync: bool
 
 
+class FormatMapping(BaseModel):
+    """
+    The Python type an OpenAPI type and format are converted to.
+    :param python_type: Name of the Python type.
+    :param module: Module the type is imported from, None for builtins and typing.
+    :param requires_orjson: Only use the mapping if orjson is used, because the type can't be serialized by json.
+    """
+
+    python_type: str
+    module: Optional[str] = None
+    requires_orjson: bool = False
+
+    @property
+    def import_types(self) -> Optional[List[str]]:
+        if self.module is None:
+            return None
+        return [f"from {self.module} import {self.python_type}"]
+
+
+# The Python types of formats, by OpenAPI type and format
+Formats = Dict[Tuple[str, str], FormatMapping]
+
+
+def _registered_formats() -> Formats:
+    # Imported here, as type_mapping imports this module.
+    from openapi_python_generator.language_converters.python import type_mapping
+
+    return type_mapping.registered_formats()
+
+
+class GenerationContext(BaseModel):
+    """
+    Options of a single generation. It is passed explicitly through the generators instead of being stored
+    globally, so several generations with different options can run concurrently in one process. It also
+    holds the symbol table of the generation, which assigns the identifiers of models and operations, and
+    the formats of the generation, which start as a copy of the ones registered with type_mapping.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    use_orjson: bool = False
+    custom_template_path: Optional[str] = None
+    service_split: ServiceSplit = ServiceSplit.TAG
+    max_operations_per_service: Optional[int] = None
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO
+    symbols: SymbolTable = Field(default_factory=SymbolTable)
+    formats: Formats = Field(default_factory=_registered_formats)
+
+
+class GenerationTarget(BaseModel):
+    library: HTTPLibrary = HTTPLibrary.httpx
+    pydantic_version: PydanticVersion = PydanticVersion.V2
+    output: str
+
+
+class OperationFilter(BaseModel):
+    include_tags: List[str] = []
+    include_operations: List[str] = []
+    include_paths: List[str] = []
+
+    def is_empty(self) -> bool:
+        return not (self.include_tags or self.include_operations or self.include_paths)
+
+
 class TypeConversion(BaseModel):
     original_type: str
     converted_type: str
@@ -98,3 +170,8 @@ class ConversionResult(BaseModel):
     models: List[Model]
     services: List[Service]
     api_config: APIConfig
+    custom_template_path: Optional[str] = None
+    # Names of merged duplicate models, mapped to the name of the model they were merged into.
+    model_aliases: Dict[str, str] = {}
+    # The formats of the generation, which the imports of the services depend on.
+    formats: Formats = Field(default_factory=_registered_formats)
@@ -0,0 +1,210 @@
+"""
+Lazy parsing of the components of a specification.
+
+Specifications often embed a shared library of components, most of which the generator never reaches. With
+lazy components, every map of the components object (schemas, responses, parameters, ...) keeps the raw
+entries and parses an entry only when it is first accessed. Entries that are never accessed are neither
+validated nor materialized as models, and an invalid entry only raises when it is accessed.
+
+The lazily parsed specification is meant for the generator. Pydantic serializes the maps without accessing
+their entries, so model_dump() and model_dump_json() only see the entries parsed so far and warn about the raw
+ones. Call parse_all_components first to serialize it.
+"""
+
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from openapi_python_generator.parsers.trusted import construct, construct_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class LazyComponentMap(dict):
+    """
+    A map of components, e.g. components.schemas, which parses each entry on first access. It is a dict, so it
+    can be read like the parsed map, but pydantic serializes it as it is, see the module documentation. Only the
+    names are available without parsing: iterating over the map or its keys and membership tests don't parse any
+    entry, while items(), values() and copies parse all of them.
+    """
+
+    def __init__(self, entries: Dict[str, Any], parse: Callable[[str, Any], Any]):
+        super().__init__(entries)
+        self._parse = parse
+        self._unparsed = set(entries)
+
+    def __getitem__(self, name: str) -> Any:
+        value = super().__getitem__(name)
+        if name in self._unparsed:
+            value = self._parse(name, value)
+            super().__setitem__(name, value)
+            self._unparsed.discard(name)
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        super().__setitem__(name, value)
+        self._unparsed.discard(name)
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding __iter__ makes dict(), update() and ** unpacking go through keys() and __getitem__.
+        return super().__iter__()
+
+    def parse_all(self) -> None:
+        """
+        Parses all entries that weren't accessed yet.
+        """
+        for name in list(self._unparsed):
+            self[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def items(self):  # type: ignore[override]
+        self.parse_all()
+        return super().items()
+
+    def values(self):  # type: ignore[override]
+        self.parse_all()
+        return super().values()
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if name in self:
+            self[name]
+        self._unparsed.discard(name)
+        return super().pop(name, *default)
+
+    def popitem(self) -> Any:
+        self.parse_all()
+        return super().popitem()
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        if name in self:
+            return self[name]
+        self[name] = default
+        return default
+
+    def copy(self) -> Dict[str, Any]:  # type: ignore[override]
+        return dict(self)
+
+    def __eq__(self, other: object) -> bool:
+        self.parse_all()
+        if isinstance(other, LazyComponentMap):
+            other.parse_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        self.parse_all()
+        return super().__repr__()
+
+    def __reduce__(self) -> Any:
+        # Pickled as the parsed map, the parser itself isn't picklable.
+        return dict, (dict(self),)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _entry_parser(
+    title: str, section: str, annotation: Any, trust_spec: bool
+) -> Callable[[str, Any], Any]:
+    """
+    Gets the function parsing the entries of a map of the components.
+    :param title: The title of validation errors, i.e. the name of the OpenAPI model.
+    :param section: The key of the map within the components, used in the location of validation errors.
+    :param annotation: The annotation of the map.
+    :param trust_spec: Skip the validation, see construct_model.
+    """
+    entry_type = typing.get_args(annotation)[1]
+    convert: Callable[[Any], Any] = (
+        (lambda value: construct(entry_type, value, title))
+        if trust_spec
+        else _type_adapter(entry_type).validate_python
+    )
+
+    def parse(name: str, value: Any) -> Any:
+        try:
+            return convert(value)
+        except ValidationError as e:
+            errors = []
+            for error in e.errors():
+                details = {
+                    "type": error["type"],
+                    "loc": ("components", section, name) + tuple(error["loc"]),
+                    "input": error["input"],
+                }
+                if "ctx" in error:
+                    details["ctx"] = error["ctx"]
+                errors.append(details)
+            raise ValidationError.from_exception_data(title, errors) from None
+
+    return parse
+
+
+def parse_with_lazy_components(
+    model: Type[ModelT], data: Dict[str, Any], trust_spec: bool = False
+) -> ModelT:
+    """
+    Parses a specification, except for the entries of its components, which are parsed on first access.
+    :param model: The OpenAPI model of the version of the specification.
+    :param data: The raw specification data.
+    :param trust_spec: Skip the validation, see construct_model.
+    :return: The parsed specification. Call parse_all_components before serializing it.
+    """
+    parse: Callable[[Dict[str, Any]], ModelT] = (
+        (lambda raw: construct_model(model, raw))
+        if trust_spec
+        else (lambda raw: model(**raw))
+    )
+    components_model = typing.get_args(model.model_fields["components"].annotation)[0]
+    fields = {
+        field.alias or name: (name, field)
+        for name, field in components_model.model_fields.items()
+    }
+    raw_components = data.get("components")
+    if not isinstance(raw_components, dict) or not all(
+        isinstance(entries, dict)
+        for key, entries in raw_components.items()
+        if key in fields
+    ):
+        # Invalid components are reported by the regular parse.
+        return parse(data)
+
+    openapi = parse({key: value for key, value in data.items() if key != "components"})
+    values: Dict[str, Any] = {}
+    extra: Dict[str, Any] = {}
+    for key, entries in raw_components.items():
+        if key not in fields:
+            extra[key] = entries
+            continue
+        name, field = fields[key]
+        values[name] = LazyComponentMap(
+            entries,
+            _entry_parser(
+                model.__name__, key, typing.get_args(field.annotation)[0], trust_spec
+            ),
+        )
+    components = components_model.model_construct(**extra, **values)
+    return openapi.model_copy(update={"components": components})
+
+
+def parse_all_components(openapi: ModelT) -> ModelT:
+    """
+    Parses the entries of the components of a specification that weren't accessed yet, so it can be
+    serialized like a fully parsed one.
+    :param openapi: A specification parsed by parse_with_lazy_components, or a fully parsed one.
+    :return: The same specification.
+    """
+    components = getattr(openapi, "components", None)
+    if components is not None:
+        for name in type(components).model_fields:
+            entries = getattr(components, name)
+            if isinstance(entries, LazyComponentMap):
+                entries.parse_all()
+    return openapi
@@ -6,19 +6,37 @@ from typing import Optional
 
 from openapi_pydantic.v3.v3_1 import OpenAPI
 
-from openapi_python_generator.common import HTTPLibrary, PydanticVersion
+from openapi_python_generator.common import (
+    EnumStrategy,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+)
 from openapi_python_generator.language_converters.python.generator import (
     generator as base_generator,
 )
-from openapi_python_generator.models import ConversionResult
+from openapi_python_generator.models import ConversionResult, OperationFilter
+from openapi_python_generator.parsers.lazy import parse_with_lazy_components
+from openapi_python_generator.parsers.sharded import parse_sharded
+from openapi_python_generator.parsers.trusted import construct_model
 
 
-def parse_openapi_3_1(spec_data: dict) -> OpenAPI:
+def parse_openapi_3_1(
+    spec_data: dict,
+    trust_spec: bool = False,
+    lazy_components: bool = False,
+    validation_workers: Optional[int] = 1,
+) -> OpenAPI:
     """
     Parse OpenAPI 3.1 specification data.
 
     Args:
         spec_data: Dictionary containing OpenAPI 3.1 specification
+        trust_spec: Skip the validation of a specification that is known to be valid, see construct_model
+        lazy_components: Parse the entries of the components only on first access, see
+            parse_with_lazy_components
+        validation_workers: Number of processes validating the paths and components, see parse_sharded.
+            Ignored with trust_spec or lazy_components.
 
     Returns:
         OpenAPI: Parsed OpenAPI 3.1 specification object
@@ -26,6 +44,12 @@ def parse_openapi_3_1(spec_data: dict) -> OpenAPI:
     Raises:
         ValidationError: If the specification is invalid
     """
+    if lazy_components:
+        return parse_with_lazy_components(OpenAPI, spec_data, trust_spec)
+    if trust_spec:
+        return construct_model(OpenAPI, spec_data)
+    if validation_workers != 1:
+        return parse_sharded(OpenAPI, spec_data, validation_workers)
     return OpenAPI(**spec_data)  # type: ignore - pydantic issue with extra fields
 
 
@@ -36,6 +60,12 @@ def generate_code_3_1(
     use_orjson: bool = False,
     custom_template_path: Optional[str] = None,
     pydantic_version: PydanticVersion = PydanticVersion.V2,
+    operation_filter: Optional[OperationFilter] = None,
+    service_split: ServiceSplit = ServiceSplit.TAG,
+    max_operations_per_service: Optional[int] = None,
+    deduplicate_models: bool = False,
+    enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+    render_workers: Optional[int] = 1,
 ) -> ConversionResult:
     """
     Generate Python code from OpenAPI 3.1 specification.
@@ -47,6 +77,12 @@ def generate_code_3_1(
         use_orjson: Whether to use orjson for serialization
         custom_template_path: Custom template path
         pydantic_version: Pydantic version to use
+        operation_filter: Restricts generation to the selected operations
+        service_split: Strategy to distribute operations over service modules
+        max_operations_per_service: Maximum number of operations per service module
+        deduplicate_models: Merge structurally identical schemas into one model
+        enum_strategy: How enum schemas are generated
+        render_workers: Number of processes rendering models and operations
 
     Returns:
         ConversionResult: Generated code and metadata
@@ -62,4 +98,10 @@ def generate_code_3_1(
         use_orjson=use_orjson,
         custom_template_path=custom_template_path,
         pydantic_version=pydantic_version,
+        operation_filter=operation_filter,
+        service_split=service_split,
+        max_operations_per_service=max_operations_per_service,
+        deduplicate_models=deduplicate_models,
+        enum_strategy=enum_strategy,
+        render_workers=render_workers,
     )
@@ -0,0 +1,168 @@
+"""
+Validation of large specifications over a pool of processes.
+
+The path items and the entries of the components are independent of each other, as the OpenAPI models don't
+validate anything across fields. They are validated as separate shards in worker processes, while the rest of
+the specification is validated in the current process. The workers only send back their errors: unpickling
+the validated models would take about as long as validating them. Meanwhile, the current process builds the
+models with construct_model, which equals the validated models once the shards are known to be valid.
+"""
+
+import itertools
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from openapi_python_generator.parsers.trusted import construct_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Location = Tuple[Union[str, int], ...]
+
+
+def _field_type(model: Type[BaseModel], key: str) -> Any:
+    """
+    The type of the field with the given alias, without Optional.
+    """
+    for name, field in model.model_fields.items():
+        if (field.alias or name) == key:
+            args = typing.get_args(field.annotation)
+            if typing.get_origin(field.annotation) is Union and type(None) in args:
+                (annotation,) = (arg for arg in args if arg is not type(None))
+                return annotation
+            return field.annotation
+    raise KeyError(key)
+
+
+def _sharded_maps(model: Type[BaseModel]) -> List[Tuple[str, ...]]:
+    """
+    The locations of the maps whose entries are validated as separate shards: the paths, the webhooks (3.1)
+    and the maps of the components.
+    """
+    components = _field_type(model, "components")
+    return [(key,) for key in ("paths", "webhooks") if key in model.model_fields] + [
+        ("components", field.alias or name)
+        for name, field in components.model_fields.items()
+    ]
+
+
+@lru_cache(maxsize=None)
+def _entry_adapter(model: Type[BaseModel], location: Tuple[str, ...]) -> TypeAdapter:
+    """
+    The type adapter validating an entry of the map at the location.
+    """
+    annotation: Any = model
+    for key in location:
+        annotation = _field_type(annotation, key)
+    return TypeAdapter(typing.get_args(annotation)[1])
+
+
+def _validate_entry(
+    model: Type[BaseModel], location: Tuple[str, ...], name: str, value: Any
+) -> List[Dict[str, Any]]:
+    """
+    Validates one shard in a worker process.
+    :return: The errors, located in the whole specification.
+    """
+    try:
+        _entry_adapter(model, location).validate_python(value)
+    except ValidationError as e:
+        return _relocate(e, location + (name,))
+    return []
+
+
+def _relocate(error: ValidationError, prefix: Location) -> List[Dict[str, Any]]:
+    """
+    The details of the errors of a validation error, with their location prefixed.
+    """
+    errors = []
+    for details in error.errors():
+        relocated = {
+            "type": details["type"],
+            "loc": prefix + tuple(details["loc"]),
+            "input": details["input"],
+        }
+        if "ctx" in details:
+            relocated["ctx"] = details["ctx"]
+        errors.append(relocated)
+    return errors
+
+
+def json_pointer(loc: Location) -> str:
+    """
+    The JSON pointer (RFC 6901) of the location of a validation error, e.g. /paths/~1pets/get for
+    ("paths", "/pets", "get").
+    :param loc: The location of the error.
+    :return: The JSON pointer.
+    """
+    return "".join("/" + str(key).replace("~", "~0").replace("/", "~1") for key in loc)
+
+
+def parse_sharded(
+    model: Type[ModelT], data: Dict[str, Any], workers: Optional[int] = None
+) -> ModelT:
+    """
+    Validates a specification with the path items and the entries of the components validated in parallel,
+    see the module documentation.
+    :param model: The OpenAPI model of the version of the specification.
+    :param data: The raw specification data.
+    :param workers: Number of worker processes, None for one per CPU. With one worker, the specification is
+        validated in the current process.
+    :return: The parsed specification, equal to the validated one.
+    :raises ValidationError: If the specification is invalid. The errors of all shards are reported, located
+        in the whole specification.
+    """
+    # The specification without the sharded entries, validated in the current process
+    skeleton = dict(data)
+    if isinstance(skeleton.get("components"), dict):
+        skeleton["components"] = dict(skeleton["components"])
+    shards: List[Tuple[Tuple[str, ...], str, Any]] = []
+    for location in _sharded_maps(model):
+        parent = skeleton if len(location) == 1 else skeleton.get("components")
+        if not isinstance(parent, dict) or not isinstance(
+            parent.get(location[-1]), dict
+        ):
+            # Missing, or reported by the validation of the skeleton
+            continue
+        shards.extend(
+            (location, name, value) for name, value in parent[location[-1]].items()
+        )
+        parent[location[-1]] = {}
+
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers == 1 or len(shards) <= 1:
+        return model(**data)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        shard_errors = executor.map(
+            _validate_entry,
+            itertools.repeat(model),
+            *zip(*shards),
+            chunksize=max(1, len(shards) // (workers * 4)),
+        )
+        errors: List[Dict[str, Any]] = []
+        try:
+            model(**skeleton)
+        except ValidationError as e:
+            errors.extend(_relocate(e, ()))
+        openapi: Optional[ModelT] = None
+        if not errors:
+            try:
+                openapi = construct_model(model, data)
+            except ValidationError:
+                # Either reported by the shards, or validated again below.
+                openapi = None
+        for entry_errors in shard_errors:
+            errors.extend(entry_errors)
+
+    if errors:
+        raise ValidationError.from_exception_data(model.__name__, errors)
+    if openapi is None:
+        # The shards are valid, but the construction failed: the whole specification is validated, so the
+        # result or the error is the same as without workers.
+        return model.model_validate(data)
+    return openapi
@@ -0,0 +1,304 @@
+"""
+Watch mode: regenerates a client whenever its specification changes, reusing everything that didn't change.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import click
+import orjson
+
+from openapi_python_generator.common import (
+    EnumStrategy,
+    Formatter,
+    HTTPLibrary,
+    PydanticVersion,
+    ServiceSplit,
+    library_config_dict,
+)
+from openapi_python_generator.generate_data import (
+    format_code,
+    load_spec,
+    parse_spec,
+    render_sources,
+    write_files,
+)
+from openapi_python_generator.language_converters.python.api_config_generator import (
+    generate_api_config,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    generate_models,
+)
+from openapi_python_generator.language_converters.python.operation_filter import (
+    apply_operation_filter,
+)
+from openapi_python_generator.language_converters.python.service_generator import (
+    HTTP_OPERATIONS,
+    generate_operation_id,
+    generate_service_operations,
+    group_service_operations,
+)
+from openapi_python_generator.language_converters.python.symbols import (
+    MODELS,
+    OPERATIONS,
+    SymbolTable,
+)
+from openapi_python_generator.models import (
+    ConversionResult,
+    GenerationContext,
+    Model,
+    OperationFilter,
+    Service,
+    ServiceOperation,
+)
+
+
+def _fingerprint(value: Any) -> bytes:
+    """
+    Canonical serialization of a raw specification fragment, used to detect changes.
+    """
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+class Watcher:
+    """
+    Keeps the state of the previous generation in memory: the rendered models per schema, the rendered
+    operations per path and the formatted content per file. On regeneration, only the schemas and paths
+    whose raw specification changed are rendered again, and only files whose content changed are formatted
+    and written. The identifiers are assigned anew on every regeneration, like in a full generation; if the
+    identifier of a remaining schema or operation changes, everything is rendered again.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path],
+        output: Union[str, Path],
+        library: HTTPLibrary = HTTPLibrary.httpx,
+        env_token_name: Optional[str] = None,
+        use_orjson: bool = False,
+        custom_template_path: Optional[str] = None,
+        pydantic_version: PydanticVersion = PydanticVersion.V2,
+        formatter: Formatter = Formatter.BLACK,
+        operation_filter: Optional[OperationFilter] = None,
+        service_split: ServiceSplit = ServiceSplit.TAG,
+        max_operations_per_service: Optional[int] = None,
+        enum_strategy: EnumStrategy = EnumStrategy.AUTO,
+        trust_spec: bool = False,
+        lazy_components: bool = False,
+        validation_workers: Optional[int] = 1,
+        render_workers: Optional[int] = 1,
+    ):
+        self.source = Path(source)
+        self.output = output
+        self.library_config = library_config_dict[library]
+        self.env_token_name = env_token_name
+        self.context = GenerationContext(
+            use_orjson=use_orjson,
+            custom_template_path=custom_template_path,
+            service_split=service_split,
+            max_operations_per_service=max_operations_per_service,
+            enum_strategy=enum_strategy,
+        )
+        self.pydantic_version = pydantic_version
+        self.formatter = formatter
+        self.operation_filter = operation_filter
+        self.trust_spec = trust_spec
+        self.lazy_components = lazy_components
+        self.validation_workers = validation_workers
+        self.render_workers = render_workers
+
+        self._models: Dict[str, Tuple[bytes, Optional[Model]]] = {}
+        self._operations: Dict[str, Tuple[bytes, List[ServiceOperation]]] = {}
+        self._formatted: Dict[str, Tuple[str, str]] = {}
+        self._identifiers: Dict[Tuple[str, Hashable], str] = {}
+        self._mtime: Optional[int] = None
+
+    def _assign_symbols(self, openapi_obj: Any) -> None:
+        """
+        Replaces the symbol table with one of the current specification, with the models and then the
+        operations named in the order of the specification. Drops the rendered models and operations if the
+        identifier of a name, which they may refer to, changed.
+        """
+        symbols = SymbolTable()
+        identifiers: Dict[Tuple[str, Hashable], str] = {}
+        components = openapi_obj.components
+        if components is not None and components.schemas is not None:
+            for name in components.schemas:
+                identifiers[(MODELS, name)] = symbols.identifier(MODELS, name)
+        for path_name, path in (openapi_obj.paths or {}).items():
+            for http_operation in HTTP_OPERATIONS:
+                operation = getattr(path, http_operation)
+                if operation is not None:
+                    identifiers[(OPERATIONS, (path_name, http_operation))] = (
+                        generate_operation_id(
+                            operation, http_operation, path_name, symbols
+                        )
+                    )
+
+        if any(
+            identifiers.get(key, identifier) != identifier
+            for key, identifier in self._identifiers.items()
+        ):
+            self._models = {}
+            self._operations = {}
+        self._identifiers = identifiers
+        self.context.symbols = symbols
+
+    def _update_models(self, openapi_obj: Any, data: Dict[str, Any]) -> List[Model]:
+        components = openapi_obj.components
+        if components is None or components.schemas is None:
+            self._models = {}
+            return []
+
+        raw_schemas = data.get("components", {}).get("schemas", {})
+        fingerprints = {
+            name: _fingerprint(raw_schemas.get(name)) for name in components.schemas
+        }
+        # Only changed schemas are accessed, so lazily parsed components leave the others unparsed.
+        changed = {
+            name: components.schemas[name]
+            for name in components.schemas
+            if name not in self._models or self._models[name][0] != fingerprints[name]
+        }
+
+        # Named in the order of the specification, like in a full generation.
+        names = {
+            name: self.context.symbols.identifier(MODELS, name)
+            for name in components.schemas
+        }
+        if changed:
+            generated = {
+                model.file_name: model
+                for model in generate_models(
+                    components.model_copy(update={"schemas": changed}),
+                    self.pydantic_version,
+                    self.context,
+                    self.render_workers,
+                )
+            }
+            for name in changed:
+                self._models[name] = (
+                    fingerprints[name],
+                    generated.get(names[name]),
+                )
+
+        self._models = {name: self._models[name] for name in components.schemas}
+        return [model for _, model in self._models.values() if model is not None]
+
+    def _update_services(self, openapi_obj: Any, data: Dict[str, Any]) -> List[Service]:
+        paths = openapi_obj.paths or {}
+        raw_paths = data.get("paths", {})
+        # Operations only refer to components by name, apart from these shared definitions.
+        shared = {
+            key: value
+            for key, value in data.get("components", {}).items()
+            if key != "schemas"
+        }
+        fingerprints = {
+            path_name: _fingerprint([raw_paths.get(path_name), shared])
+            for path_name in paths
+        }
+        changed = {
+            path_name: path
+            for path_name, path in paths.items()
+            if path_name not in self._operations
+            or self._operations[path_name][0] != fingerprints[path_name]
+        }
+
+        if changed:
+            service_ops = generate_service_operations(
+                changed, self.library_config, self.context, self.render_workers
+            )
+            for path_name in changed:
+                self._operations[path_name] = (
+                    fingerprints[path_name],
+                    [so for so in service_ops if so.path_name == path_name],
+                )
+
+        self._operations = {
+            path_name: self._operations[path_name] for path_name in paths
+        }
+        return group_service_operations(
+            [so for _, ops in self._operations.values() for so in ops],
+            self.library_config,
+            self.context,
+        )
+
+    def _format(self, relative: str, content: str) -> str:
+        cached = self._formatted.get(relative)
+        if cached is not None and cached[0] == content:
+            return cached[1]
+        formatted = format_code(content, self.formatter)
+        self._formatted[relative] = (content, formatted)
+        return formatted
+
+    def regenerate(self) -> List[str]:
+        """
+        Loads the specification and regenerates the client incrementally.
+        :return: Relative paths of the files which were written.
+        """
+        self._mtime = self.source.stat().st_mtime_ns
+        data = load_spec(self.source)
+        openapi_obj, _ = parse_spec(
+            data, self.trust_spec, self.lazy_components, self.validation_workers
+        )
+
+        openapi_obj = apply_operation_filter(openapi_obj, self.operation_filter)
+        self._assign_symbols(openapi_obj)
+
+        result = ConversionResult(
+            models=self._update_models(openapi_obj, data),
+            services=self._update_services(openapi_obj, data),
+            api_config=generate_api_config(
+                openapi_obj, self.env_token_name, self.pydantic_version, self.context
+            ),
+            custom_template_path=self.context.custom_template_path,
+            formats=self.context.formats,
+        )
+        sources = render_sources(result)
+        self._formatted = {
+            relative: self._formatted[relative]
+            for relative in sources
+            if relative in self._formatted
+        }
+        files = {
+            relative: self._format(relative, content)
+            for relative, content in sources.items()
+        }
+        return write_files(files, self.output)
+
+    def poll(self) -> Optional[List[str]]:
+        """
+        Regenerates the client if the specification was modified since the last generation.
+        :return: Relative paths of the written files, or None if the specification didn't change.
+        """
+        try:
+            mtime = self.source.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime == self._mtime:
+            return None
+        return self.regenerate()
+
+    def run(self, interval: float = 0.5) -> None:  # pragma: no cover
+        """
+        Watches the specification until interrupted, regenerating the client on every change. Errors in the
+        specification are reported and the last generated client is kept.
+        :param interval: Seconds between two checks of the specification.
+        """
+        click.echo(f"Watching {self.source} for changes. Press Ctrl+C to stop.")
+        while True:
+            start = time.perf_counter()
+            try:
+                written = self.poll()
+            except Exception as e:
+                self._mtime = self.source.stat().st_mtime_ns
+                click.echo(f"Generation failed: {type(e).__name__}: {e}")
+            else:
+                if written is not None:
+                    click.echo(
+                        f"Regenerated {self.output} in {time.perf_counter() - start:.2f}s "
+                        f"({len(written)} files written)"
+                    )
+            time.sleep(interval)
@@ -1,8 +1,12 @@
+import importlib
 import json
 import shutil
+import sys
 from pathlib import Path
+from typing import Callable
 from typing import Dict
 from typing import Generator
+from typing import List
 
 import pytest
 
@@ -40,3 +44,29 @@ def model_data_with_cleanup_fixture(model_data):
     if test_result_path.exists():
         # delete folder and all subfolders
         shutil.rmtree(test_result_path)
+
+
+@pytest.fixture(name="import_generated")
+def import_generated_fixture(tmp_path) -> Generator[Callable, None, None]:
+    """
+    Imports generated files: import_generated(files, "client.models") writes the files as the package client
+    under tmp_path and imports client.models. The imported packages are removed from sys.modules afterwards.
+    """
+    packages: List[str] = []
+
+    def _import(files: Dict[str, str], module: str):
+        package = module.split(".")[0]
+        for relative, content in files.items():
+            path = tmp_path / package / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        packages.append(package)
+        importlib.invalidate_caches()
+        return importlib.import_module(module)
+
+    sys.path.insert(0, str(tmp_path))
+    yield _import
+    sys.path.remove(str(tmp_path))
+    for name in list(sys.modules):
+        if name.split(".")[0] in packages:
+            del sys.modules[name]
@@ -0,0 +1,127 @@
+import importlib
+import sys
+import zipfile
+
+import pytest
+from click.testing import CliRunner
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.archive import compile_source
+from openapi_python_generator.archive import parse_wheel_name
+from openapi_python_generator.archive import write_archive
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.generate_data import generate_data
+from openapi_python_generator.generate_data import generate_sources
+from tests.conftest import test_data_path
+
+
+def _import_from(archive_path, package, module):
+    sys.path.insert(0, str(archive_path))
+    try:
+        return importlib.import_module(f"{package}.{module}")
+    finally:
+        sys.path.remove(str(archive_path))
+        for name in list(sys.modules):
+            if name == package or name.startswith(package + "."):
+                del sys.modules[name]
+
+
+def test_write_wheel(json_data, tmp_path):
+    files = generate_sources(json_data, formatter=Formatter.NONE)
+    wheel = tmp_path / "my_client-1.2.0-py3-none-any.whl"
+    write_archive(files, wheel, dependencies=["httpx", "pydantic>=2"])
+
+    with zipfile.ZipFile(wheel) as archive:
+        names = archive.namelist()
+        assert "my_client/services/general_service.py" in names
+        assert "my_client/__init__.py" in names
+        metadata = archive.read("my_client-1.2.0.dist-info/METADATA").decode()
+        assert "Name: my_client\nVersion: 1.2.0\n" in metadata
+        assert "Requires-Dist: pydantic>=2\n" in metadata
+        record = archive.read("my_client-1.2.0.dist-info/RECORD").decode()
+        recorded = [line.split(",")[0] for line in record.splitlines()]
+        assert sorted(recorded) == sorted(names)
+        assert (
+            archive.read("my_client/api_config.py").decode() == files["api_config.py"]
+        )
+
+    # Nothing but the wheel is left in the output folder
+    assert list(tmp_path.iterdir()) == [wheel]
+
+    # Archives are reproducible
+    content = wheel.read_bytes()
+    write_archive(files, wheel, dependencies=["httpx", "pydantic>=2"])
+    assert wheel.read_bytes() == content
+
+
+def test_write_zip_with_bytecode_is_importable(json_data, tmp_path):
+    files = generate_sources(json_data, formatter=Formatter.NONE)
+    archive_path = tmp_path / "zipped_client.zip"
+    write_archive(files, archive_path, compile_bytecode=True)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert "zipped_client/services/general_service.pyc" in archive.namelist()
+        assert not any(".dist-info/" in name for name in archive.namelist())
+
+    service = _import_from(archive_path, "zipped_client", "services.general_service")
+    assert callable(service.root__get)
+    # The module was loaded from the precompiled bytecode
+    assert service.__file__.endswith(".pyc")
+
+
+def test_compile_source():
+    pyc = compile_source("VALUE = 42\n", "module.py")
+    assert pyc[:4] == importlib.util.MAGIC_NUMBER
+    # Unchecked hash-based pyc
+    assert int.from_bytes(pyc[4:8], "little") == 0b01
+    assert pyc[8:16] == importlib.util.source_hash(b"VALUE = 42\n")
+
+
+def test_invalid_archive_names(tmp_path):
+    with pytest.raises(ValueError):
+        parse_wheel_name("client.whl")
+    with pytest.raises(ValueError):
+        write_archive({}, tmp_path / "my-client.zip")
+    with pytest.raises(ValueError):
+        generate_data(test_data_path, tmp_path / "client.zip", check=True)
+    # A failed write leaves nothing behind
+    with pytest.raises(SyntaxError):
+        write_archive({"broken.py": "def ("}, tmp_path / "c.zip", compile_bytecode=True)
+    assert list(tmp_path.iterdir()) == []
+    assert parse_wheel_name("dist/client-1.0.0.dev1-py3-none-any.whl") == (
+        "client",
+        "1.0.0.dev1",
+    )
+
+
+def test_generate_data_wheel(tmp_path):
+    wheel = tmp_path / "dist" / "client-0.1.0-py3-none-any.whl"
+    generate_data(
+        test_data_path,
+        wheel,
+        HTTPLibrary.requests,
+        use_orjson=True,
+        compile_bytecode=True,
+    )
+    with zipfile.ZipFile(wheel) as archive:
+        metadata = archive.read("client-0.1.0.dist-info/METADATA").decode()
+        assert "Requires-Dist: requests\n" in metadata
+        assert "Requires-Dist: orjson\n" in metadata
+        assert "client/__init__.py" in archive.namelist()
+        assert (
+            f"client/__pycache__/__init__.{sys.implementation.cache_tag}.pyc"
+            in archive.namelist()
+        )
+
+
+def test_cli_archive(tmp_path):
+    output = tmp_path / "client.zip"
+    result = CliRunner().invoke(
+        main, [str(test_data_path), str(output), "--formatter", "none", "--compile"]
+    )
+    assert result.exit_code == 0
+    assert zipfile.is_zipfile(output)
+
+    result = CliRunner().invoke(main, [str(test_data_path), str(output), "--check"])
+    assert result.exit_code == 2
@@ -0,0 +1,102 @@
+import orjson
+import pytest
+import yaml
+from click.testing import CliRunner
+from pydantic import ValidationError
+
+from openapi_python_generator.batch import BatchConfig
+from openapi_python_generator.batch import generate_batch
+from openapi_python_generator.batch import load_batch_config
+from openapi_python_generator.batch import main
+from tests.conftest import test_data_folder
+
+
+def _write_config(tmp_path, specs, workers=None, suffix=".json"):
+    config = {"specs": specs}
+    if workers is not None:
+        config["workers"] = workers
+    path = tmp_path / f"batch{suffix}"
+    if suffix == ".json":
+        path.write_bytes(orjson.dumps(config))
+    else:
+        path.write_text(yaml.dump(config))
+    return path
+
+
+def test_load_batch_config_resolves_relative_paths(tmp_path):
+    path = _write_config(
+        tmp_path,
+        [{"source": "spec.json", "output": "out", "library": "requests"}],
+        workers=3,
+        suffix=".yaml",
+    )
+    config = load_batch_config(path)
+    assert config.workers == 3
+    assert config.specs[0].source == str(tmp_path / "spec.json")
+    assert config.specs[0].output == str(tmp_path / "out")
+    assert config.specs[0].library == "requests"
+
+
+def test_load_batch_config_rejects_other_documents(tmp_path):
+    path = tmp_path / "batch.yaml"
+    path.write_text(yaml.dump([{"source": "spec.json", "output": "out"}]))
+    with pytest.raises(ValidationError) as e:
+        load_batch_config(path)
+    assert e.value.errors()[0]["type"] == "model_type"
+
+    result = CliRunner().invoke(main, [str(path)])
+    assert result.exit_code == 2
+    assert "is not a valid batch configuration" in result.output
+
+
+def test_generate_batch_in_worker_processes(tmp_path):
+    path = _write_config(
+        tmp_path,
+        [
+            {
+                "source": str(test_data_folder / "test_api.json"),
+                "output": "httpx_client",
+                "formatter": "none",
+            },
+            {
+                "source": str(test_data_folder / "test_api_31.json"),
+                "output": "requests_client",
+                "library": "requests",
+                "pydantic_version": "v1",
+                "formatter": "none",
+            },
+            {"source": "missing.json", "output": "missing_client"},
+        ],
+    )
+    results = generate_batch(path, workers=2)
+
+    assert [r.output for r in results] == [
+        str(tmp_path / "httpx_client"),
+        str(tmp_path / "requests_client"),
+        str(tmp_path / "missing_client"),
+    ]
+    assert results[0].error is None and results[1].error is None
+    assert results[2].error is not None and "FileNotFoundError" in results[2].error
+    assert all(r.seconds > 0 for r in results)
+    assert (tmp_path / "httpx_client" / "api_config.py").exists()
+    assert (tmp_path / "requests_client" / "api_config.py").exists()
+
+
+def test_batch_cli(tmp_path):
+    path = _write_config(
+        tmp_path,
+        [
+            {
+                "source": str(test_data_folder / "test_api.json"),
+                "output": "client",
+                "formatter": "none",
+            }
+        ],
+    )
+    result = CliRunner().invoke(main, [str(path), "--workers", "1"])
+    assert result.exit_code == 0
+    assert "client: ok" in result.output
+    assert "total" in result.output
+
+    config = BatchConfig(specs=[{"source": "missing.json", "output": "x"}])
+    assert generate_batch(config)[0].error is not None
@@ -0,0 +1,71 @@
+import sys
+
+from openapi_pydantic.v3.v3_1 import Components
+from openapi_pydantic.v3.v3_1 import DataType
+from openapi_pydantic.v3.v3_1 import Reference
+from openapi_pydantic.v3.v3_1 import Schema
+
+from openapi_python_generator.language_converters.python import ir
+from openapi_python_generator.language_converters.python.model_generator import (
+    analyze_models,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    type_converter,
+)
+from openapi_python_generator.models import GenerationContext
+
+DEPTH = 1000
+
+
+def _nested_arrays(depth: int) -> Schema:
+    # Built bottom up: validating such a document as a whole hits the recursion limit of pydantic itself.
+    schema = Schema(type=DataType.INTEGER)
+    for _ in range(depth):
+        schema = Schema(type=DataType.ARRAY, items=schema)
+    return schema
+
+
+def test_deeply_nested_arrays():
+    assert DEPTH >= sys.getrecursionlimit()
+    conversion = type_converter(_nested_arrays(DEPTH), True)
+    assert conversion.converted_type == "List[" * DEPTH + "int" + "]" * DEPTH
+
+
+def test_deeply_nested_compositions():
+    schema = Schema(type=DataType.STRING)
+    for i in range(DEPTH):
+        if i % 2:
+            schema = Schema(allOf=[schema])
+        else:
+            schema = Schema(anyOf=[schema, Reference(ref="#/components/schemas/Leaf")])
+    conversion = type_converter(schema, False, context=GenerationContext())
+    assert conversion.converted_type.startswith("Optional[Union[Union[")
+    assert conversion.converted_type.count("Leaf") == DEPTH // 2
+    # allOf only keeps the first import of each sub schema
+    assert conversion.import_types == ["from .Leaf import Leaf"]
+
+
+def test_wide_union_shares_conversions():
+    shared = Schema(type=DataType.ARRAY, items=Schema(type=DataType.NUMBER))
+    schema = Schema(oneOf=[shared] * 5000)
+    node = ir.lower(schema)
+    assert len({id(sub) for sub in node.one_of}) == 1
+
+    converted = {}
+    conversion = type_converter(node, True, converted=converted)
+    assert conversion.converted_type == "Union[" + ",".join(["List[float]"] * 5000) + "]"
+    assert len(converted) == 2
+
+
+def test_analyze_deeply_nested_model():
+    components = Components(
+        schemas={
+            "Deep": Schema(
+                type=DataType.OBJECT,
+                required=["values"],
+                properties={"values": _nested_arrays(DEPTH)},
+            )
+        }
+    )
+    (model,) = analyze_models(components)
+    assert model.properties[0].type.converted_type.count("List[") == DEPTH
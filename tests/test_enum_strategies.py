@@ -0,0 +1,111 @@
+import importlib
+from enum import Enum
+
+import pytest
+from pydantic import ValidationError
+
+from openapi_python_generator.common import EnumStrategy
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import PydanticVersion
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.language_converters.python.model_generator import (
+    FROZENSET_ENUM_THRESHOLD,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    LAZY_ENUM_THRESHOLD,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    enum_strategy,
+)
+from openapi_python_generator.models import GenerationContext
+
+
+def _spec(values):
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Enums", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Country": {"type": "string", "enum": values},
+                "Address": {
+                    "type": "object",
+                    "required": ["country"],
+                    "properties": {"country": {"$ref": "#/components/schemas/Country"}},
+                },
+            }
+        },
+    }
+
+
+def test_enum_strategy_by_size():
+    auto = GenerationContext()
+    assert enum_strategy(["a"] * LAZY_ENUM_THRESHOLD, auto) == EnumStrategy.ENUM
+    assert enum_strategy(["a"] * (LAZY_ENUM_THRESHOLD + 1), auto) == EnumStrategy.LAZY
+    assert (
+        enum_strategy(["a"] * (FROZENSET_ENUM_THRESHOLD + 1), auto)
+        == EnumStrategy.FROZENSET
+    )
+    literal = GenerationContext(enum_strategy=EnumStrategy.LITERAL)
+    assert (
+        enum_strategy(["a"] * (FROZENSET_ENUM_THRESHOLD + 1), literal)
+        == EnumStrategy.LITERAL
+    )
+
+
+def test_literal_enum(import_generated):
+    files = generate_sources(
+        _spec(["DE", "AT", "new zealand"]),
+        HTTPLibrary.httpx,
+        formatter=Formatter.NONE,
+        enum_strategy=EnumStrategy.LITERAL,
+    )
+    assert "Country = Literal[" in files["models/Country.py"]
+
+    models = import_generated(files, "enum_client.models")
+    assert models.Address(country="new zealand").country == "new zealand"
+    with pytest.raises(ValidationError):
+        models.Address(country="CH")
+
+
+def test_lazy_enum(import_generated):
+    values = [f"C{i}" for i in range(LAZY_ENUM_THRESHOLD + 1)] + ["c0", "new zealand"]
+    files = generate_sources(_spec(values), HTTPLibrary.httpx, formatter=Formatter.NONE)
+    assert "class Country" not in files["models/Country.py"]
+
+    models = import_generated(files, "enum_client.models")
+    country_module = importlib.import_module("enum_client.models.Country")
+    assert "Country" not in vars(country_module)
+
+    Country = models.Country
+    assert issubclass(Country, Enum) and issubclass(Country, str)
+    assert Country is country_module.Country
+    assert Country.C5.value == "C5"
+    # Colliding member names get a suffix
+    assert Country.C0_1.value == "c0"
+    assert Country.NEW_ZEALAND.value == "new zealand"
+    assert models.Address(country="C7").country is Country.C7
+
+
+@pytest.mark.parametrize("pydantic_version", [PydanticVersion.V1, PydanticVersion.V2])
+def test_frozenset_enum(import_generated, pydantic_version):
+    values = [f"C{i}" for i in range(FROZENSET_ENUM_THRESHOLD + 1)]
+    files = generate_sources(
+        _spec(values),
+        HTTPLibrary.httpx,
+        formatter=Formatter.NONE,
+        pydantic_version=pydantic_version,
+    )
+    content = files["models/Country.py"]
+    assert "_VALUES = frozenset((" in content
+    compile(content, "<string>", "exec")
+    if pydantic_version == PydanticVersion.V1:
+        assert "class Country(str):" in content
+        return
+
+    models = import_generated(files, "enum_client.models")
+    address = models.Address(country="C10000")
+    assert address.country == "C10000" and type(address.country) is str
+    with pytest.raises(ValidationError, match="is not a valid Country"):
+        models.Address(country="C10001")
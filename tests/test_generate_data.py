@@ -1,6 +1,9 @@
+import importlib.util
+import os
 from pathlib import Path
 import shutil
 import subprocess
+from py_compile import PycInvalidationMode
 
 import orjson
 import pytest
@@ -10,9 +13,14 @@ from pydantic import ValidationError
 
 from openapi_python_generator.common import FormatOptions, Formatter, HTTPLibrary
 from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.generate_data import compile_files
+from openapi_python_generator.generate_data import format_code
 from openapi_python_generator.generate_data import generate_data
+from openapi_python_generator.generate_data import generate_sources
 from openapi_python_generator.generate_data import get_open_api
+from openapi_python_generator.generate_data import render_files
 from openapi_python_generator.generate_data import write_data
+from openapi_python_generator.generate_data import write_files
 from openapi_python_generator.language_converters.python.generator import generator
 from tests.conftest import test_data_folder
 from tests.conftest import test_data_path
@@ -191,3 +199,132 @@ def files_are_black_formatted(test_result_path: Path) -> bool:
         result.check_returncode  # raise the error
 
     return result.returncode == 0
+
+
+def test_write_data_skips_unchanged_files(model_data_with_cleanup):
+    result = generator(model_data_with_cleanup, library_config_dict[HTTPLibrary.httpx])
+    write_data(result, test_result_path, Formatter.NONE)
+
+    old_mtime = 1_000_000_000
+    for path in test_result_path.rglob("*.py"):
+        os.utime(path, ns=(old_mtime, old_mtime))
+
+    # Regenerating the identical client doesn't touch any file
+    assert write_files(render_files(result, Formatter.NONE), test_result_path) == []
+    assert all(
+        path.stat().st_mtime_ns == old_mtime for path in test_result_path.rglob("*.py")
+    )
+
+    # Only the changed file is rewritten
+    result.api_config.content += "\n# changed\n"
+    assert write_files(render_files(result, Formatter.NONE), test_result_path) == [
+        "api_config.py"
+    ]
+    assert (test_result_path / "api_config.py").stat().st_mtime_ns != old_mtime
+    assert (test_result_path / "models" / "User.py").stat().st_mtime_ns == old_mtime
+
+    # The staging folder is cleaned up
+    assert not list(test_result_path.parent.glob(f".{test_result_path.name}-*"))
+
+
+def test_write_data_removes_stale_files(model_data_with_cleanup):
+    result = generator(model_data_with_cleanup, library_config_dict[HTTPLibrary.httpx])
+    write_data(result, test_result_path, Formatter.NONE)
+    assert (test_result_path / "models" / "Team.py").exists()
+
+    result.models = [m for m in result.models if m.file_name != "Team"]
+    (test_result_path / "services" / "old_tag_service.py").write_text("")
+    (test_result_path / "models" / "notes.txt").write_text("kept")
+
+    write_data(result, test_result_path, Formatter.NONE)
+
+    assert not (test_result_path / "models" / "Team.py").exists()
+    assert not (test_result_path / "services" / "old_tag_service.py").exists()
+    assert (test_result_path / "models" / "notes.txt").exists()
+    assert "Team" not in (test_result_path / "models" / "__init__.py").read_text()
+
+
+def _pyc(path):
+    return Path(importlib.util.cache_from_source(str(path)))
+
+
+def test_write_data_compiles_bytecode(model_data_with_cleanup):
+    result = generator(model_data_with_cleanup, library_config_dict[HTTPLibrary.httpx])
+    write_data(
+        result,
+        test_result_path,
+        Formatter.NONE,
+        compile_bytecode=True,
+        invalidation_mode=PycInvalidationMode.UNCHECKED_HASH,
+    )
+    files = list(render_files(result, Formatter.NONE))
+    for relative in files:
+        pyc = _pyc(test_result_path / relative).read_bytes()
+        assert pyc[:4] == importlib.util.MAGIC_NUMBER
+        # Unchecked hash-based
+        assert int.from_bytes(pyc[4:8], "little") == 0b01
+
+    # Up-to-date bytecode is kept, the one of changed and stale modules is removed
+    user_pyc = _pyc(test_result_path / "models" / "User.py")
+    old_mtime = 1_000_000_000
+    os.utime(user_pyc, ns=(old_mtime, old_mtime))
+    result.api_config.content += "\n# changed\n"
+    result.models = [m for m in result.models if m.file_name != "EnumComponent"]
+    write_data(result, test_result_path, Formatter.NONE)
+    assert user_pyc.stat().st_mtime_ns == old_mtime
+    assert not _pyc(test_result_path / "api_config.py").exists()
+    assert not _pyc(test_result_path / "models" / "EnumComponent.py").exists()
+
+    # Only the modules without bytecode are compiled again
+    files = render_files(result, Formatter.NONE)
+    assert compile_files(
+        files,
+        test_result_path,
+        PycInvalidationMode.UNCHECKED_HASH,
+        workers=1,
+    ) == ["__init__.py", "api_config.py", "models/__init__.py"]
+
+    # Bytecode of a source changed outside of write_files, or of another invalidation mode, is replaced
+    user = test_result_path / "models" / "User.py"
+    user.write_text(user.read_text() + "\n# edited\n")
+    assert compile_files(
+        files, test_result_path, PycInvalidationMode.UNCHECKED_HASH, workers=1
+    ) == ["models/User.py"]
+    assert (
+        compile_files(
+            files, test_result_path, PycInvalidationMode.UNCHECKED_HASH, workers=1
+        )
+        == []
+    )
+    assert compile_files(files, test_result_path, workers=1) == sorted(files)
+    assert compile_files(files, test_result_path, workers=1) == []
+
+
+def test_compile_files_in_parallel(model_data_with_cleanup):
+    result = generator(model_data_with_cleanup, library_config_dict[HTTPLibrary.httpx])
+    files = render_files(result, Formatter.NONE)
+    write_files(files, test_result_path)
+    assert compile_files(files, test_result_path, workers=2) == sorted(files)
+    assert all(_pyc(test_result_path / relative).exists() for relative in files)
+
+
+def test_generate_sources(json_data, model_data, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = generate_sources(json_data, formatter=Formatter.NONE)
+    assert files == render_files(
+        generator(model_data, library_config_dict[HTTPLibrary.httpx]), Formatter.NONE
+    )
+    assert generate_sources(model_data, formatter=Formatter.NONE) == files
+    assert "services/general_service.py" in files
+    assert list(tmp_path.iterdir()) == []
+
+    formatted = generate_sources(
+        json_data, HTTPLibrary.requests, include_tags=["general"], workers=2
+    )
+    # requests has no async client, and unreferenced schemas are left out
+    assert "services/async_general_service.py" not in formatted
+    assert "models/EnumComponent.py" not in formatted
+    assert "import requests" in formatted["services/general_service.py"]
+    assert formatted["api_config.py"] == format_code(
+        files["api_config.py"], Formatter.BLACK
+    )
@@ -0,0 +1,172 @@
+import importlib.util
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import PydanticVersion
+from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.generate_data import generate_data
+from openapi_python_generator.generate_data import generate_data_targets
+from openapi_python_generator.language_converters.python import common
+from openapi_python_generator.language_converters.python.generator import generator
+from openapi_python_generator.language_converters.python.generator import (
+    generate_targets,
+)
+from openapi_python_generator.models import GenerationTarget
+from tests.conftest import test_data_path
+from tests.conftest import test_result_path
+
+TARGETS = [
+    (HTTPLibrary.httpx, PydanticVersion.V2),
+    (HTTPLibrary.requests, PydanticVersion.V1),
+    (HTTPLibrary.aiohttp, PydanticVersion.V2),
+]
+
+
+def test_generate_targets_matches_separate_generations(model_data):
+    previous = common.get_use_orjson()
+    try:
+        results = generate_targets(
+            model_data,
+            [(library_config_dict[lib], version) for lib, version in TARGETS],
+        )
+        assert len(results) == len(TARGETS)
+        for (library, version), result in zip(TARGETS, results):
+            expected = generator(
+                model_data,
+                library_config_dict[library],
+                pydantic_version=version,
+            )
+            assert result == expected
+    finally:
+        common.set_use_orjson(previous)
+
+
+def test_generate_targets_shares_models_per_pydantic_version(model_data):
+    results = generate_targets(
+        model_data,
+        [
+            (library_config_dict[HTTPLibrary.httpx], PydanticVersion.V2),
+            (library_config_dict[HTTPLibrary.requests], PydanticVersion.V2),
+        ],
+    )
+    assert all(a is b for a, b in zip(results[0].models, results[1].models))
+    assert results[0].services != results[1].services
+
+
+def test_generate_data_targets(model_data_with_cleanup):
+    targets = [
+        GenerationTarget(
+            library=library,
+            pydantic_version=version,
+            output=str(test_result_path / f"{library.value}_{version.value}"),
+        )
+        for library, version in TARGETS
+    ]
+    generate_data_targets(test_data_path, targets, formatter=Formatter.NONE)
+
+    for target in targets:
+        single = test_result_path / "single"
+        generate_data(
+            test_data_path,
+            single,
+            target.library,
+            pydantic_version=target.pydantic_version,
+            formatter=Formatter.NONE,
+        )
+        output = Path(target.output)
+        generated = sorted(p.relative_to(output) for p in output.glob("**/*.py"))
+        assert generated == sorted(
+            p.relative_to(single) for p in single.glob("**/*.py")
+        )
+        for relative in generated:
+            assert (single / relative).read_text() == (output / relative).read_text()
+
+    assert (
+        generate_data_targets(
+            test_data_path, targets, formatter=Formatter.NONE, check=True
+        )
+        == []
+    )
+
+
+def test_generate_data_targets_formats_in_parallel(model_data_with_cleanup):
+    targets = [
+        GenerationTarget(
+            library=library,
+            pydantic_version=version,
+            output=str(test_result_path / f"{library.value}_{version.value}"),
+        )
+        for library, version in TARGETS[:2]
+    ]
+    generate_data_targets(test_data_path, targets, workers=2)
+
+    (test_result_path / "requests_v1" / "api_config.py").write_text("")
+    assert generate_data_targets(test_data_path, targets, check=True) == [
+        str(test_result_path / "requests_v1" / "api_config.py")
+    ]
+
+
+def test_cli_target(model_data_with_cleanup):
+    result = CliRunner().invoke(
+        main,
+        [
+            str(test_data_path),
+            str(test_result_path),
+            "--formatter",
+            "none",
+            "--target",
+            "httpx:v2:httpx_v2",
+            "--target",
+            "requests:v1:requests_v1",
+        ],
+    )
+    assert result.exit_code == 0
+    assert (
+        test_result_path / "httpx_v2" / "services" / "async_general_service.py"
+    ).exists()
+    assert (
+        "import requests"
+        in (
+            test_result_path / "requests_v1" / "services" / "general_service.py"
+        ).read_text()
+    )
+    assert (
+        "ConfigDict"
+        not in (test_result_path / "requests_v1" / "models" / "User.py").read_text()
+    )
+
+
+def test_cli_target_compiles_bytecode(model_data_with_cleanup):
+    result = CliRunner().invoke(
+        main,
+        [
+            str(test_data_path),
+            str(test_result_path),
+            "--formatter",
+            "none",
+            "--target",
+            "httpx:v2:httpx_v2",
+            "--compile",
+            "--invalidation-mode",
+            "unchecked-hash",
+        ],
+    )
+    assert result.exit_code == 0
+    output = test_result_path / "httpx_v2"
+    for module in output.glob("**/*.py"):
+        pyc = Path(importlib.util.cache_from_source(str(module)))
+        # Flags of hash-based .pyc files whose source isn't checked
+        assert int.from_bytes(pyc.read_bytes()[4:8], "little") == 0b01
+
+
+def test_cli_invalid_target():
+    for target in ["httpx:v2", "curl:v2:out", "httpx:v3:out"]:
+        result = CliRunner().invoke(
+            main, [str(test_data_path), str(test_result_path), "--target", target]
+        )
+        assert result.exit_code == 2
+        assert "--target" in result.output
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from openapi_pydantic.v3 import DataType, Schema
+
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.language_converters.python import common
+from openapi_python_generator.language_converters.python.generator import generator
+from openapi_python_generator.language_converters.python.jinja_config import (
+    create_jinja_env,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    type_converter,
+)
+from openapi_python_generator.models import GenerationContext
+
+
+def test_type_converter_uses_explicit_context():
+    schema = Schema(type=DataType.STRING, schema_format="date-time")
+    previous = common.get_use_orjson()
+    common.set_use_orjson(False)
+    try:
+        assert type_converter(schema, True).converted_type == "str"
+        assert (
+            type_converter(
+                schema, True, context=GenerationContext(use_orjson=True)
+            ).converted_type
+            == "datetime"
+        )
+        # The explicit context doesn't leak into the defaults
+        assert common.get_use_orjson() is False
+    finally:
+        common.set_use_orjson(previous)
+
+
+def test_create_jinja_env_per_template_path(tmp_path):
+    (tmp_path / "enum.jinja2").write_text("custom enum {{ name }}")
+    custom = create_jinja_env(GenerationContext(custom_template_path=str(tmp_path)))
+    default = create_jinja_env(GenerationContext())
+
+    assert custom.get_template("enum.jinja2").render(name="X") == "custom enum X"
+    assert "custom" not in default.get_template("enum.jinja2").render(
+        name="X", enum=[]
+    )
+    assert create_jinja_env(GenerationContext()) is default
+
+
+def test_concurrent_generations_with_different_options(model_data, tmp_path):
+    (tmp_path / "enum.jinja2").write_text("CUSTOM_ENUM = '{{ name }}'\n")
+    options = [
+        {"use_orjson": False, "custom_template_path": None},
+        {"use_orjson": True, "custom_template_path": None},
+        {"use_orjson": False, "custom_template_path": str(tmp_path)},
+        {"use_orjson": True, "custom_template_path": str(tmp_path)},
+    ] * 4
+
+    def generate(kwargs):
+        result = generator(
+            model_data, library_config_dict[HTTPLibrary.httpx], **kwargs
+        )
+        return [m.content for m in result.models] + [
+            s.content for s in result.services
+        ]
+
+    expected = [generate(kwargs) for kwargs in options[:4]] * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(generate, options)) == expected
+
+    # The options actually made a difference
+    assert len({tuple(e) for e in expected}) == 4
+    # And the parsed specification wasn't modified by any generation
+    assert generate(options[0]) == expected[0]
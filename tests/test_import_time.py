@@ -0,0 +1,47 @@
+"""Guards that the CLI only imports heavy dependencies on the code paths that need them."""
+
+import subprocess
+import sys
+
+import pytest
+
+from tests.conftest import test_data_folder
+from tests.conftest import test_data_path
+
+HEAVY_MODULES = {"black", "isort", "httpx", "yaml", "openapi_pydantic", "pydantic"}
+
+
+def _imported_modules(*args: str) -> set:
+    """Runs the CLI with -X importtime and returns the names of all imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "openapi_python_generator", *args],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"]])
+def test_version_and_help_import_nothing_heavy(args):
+    assert _imported_modules(*args) & HEAVY_MODULES == set()
+
+
+def test_unformatted_json_generation_skips_formatters(tmp_path):
+    modules = _imported_modules(
+        str(test_data_path), str(tmp_path / "out"), "--formatter", "none"
+    )
+    assert "openapi_pydantic" in modules
+    assert modules & {"black", "isort", "httpx", "yaml"} == set()
+
+
+def test_formatted_yaml_generation_imports_what_it_needs(tmp_path):
+    modules = _imported_modules(
+        str(test_data_folder / "swagger_petstore_3_0_4.yaml"), str(tmp_path / "out")
+    )
+    assert {"black", "isort", "yaml"} <= modules
+    assert "httpx" not in modules
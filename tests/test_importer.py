@@ -0,0 +1,112 @@
+import importlib
+import sys
+
+import orjson
+import pytest
+
+from openapi_python_generator import generate_data
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.importer import ClientFinder
+from openapi_python_generator.importer import _store_cached
+from openapi_python_generator.importer import import_client
+from tests.conftest import test_data_path
+
+
+@pytest.fixture(name="cleanup_clients")
+def cleanup_clients_fixture():
+    yield
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, ClientFinder)]
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("test_api", "my_client"):
+            del sys.modules[name]
+
+
+def test_import_client(tmp_path, cleanup_clients):
+    client = import_client(test_data_path, cache_dir=tmp_path)
+    assert client.__name__ == "test_api"
+    assert client.User.__name__ == "User"
+    assert client.APIConfig.__name__ == "APIConfig"
+
+    from test_api.services import general_service  # type: ignore
+
+    assert callable(general_service.root__get)
+    assert general_service.__spec__.origin == "<test_api>/services/general_service.py"
+    assert len(list(tmp_path.glob("*.marshal"))) == 1
+
+    with pytest.raises(ModuleNotFoundError):
+        importlib.import_module("test_api.services.missing_service")
+
+
+def test_import_client_uses_cache(tmp_path, monkeypatch, cleanup_clients):
+    first = import_client(test_data_path, cache_dir=tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The cached client should be used")
+
+    monkeypatch.setattr(generate_data, "generate_sources", fail)
+    second = import_client(test_data_path, cache_dir=tmp_path)
+    # Imported again from the cache, replacing the previous import
+    assert second is not first
+    assert second.User.model_fields.keys() == first.User.model_fields.keys()
+
+    # Other options are cached separately
+    with pytest.raises(AssertionError):
+        import_client(test_data_path, library=HTTPLibrary.requests, cache_dir=tmp_path)
+
+
+def test_import_client_from_dict(tmp_path, cleanup_clients):
+    data = orjson.loads(test_data_path.read_bytes())
+    with pytest.raises(ValueError):
+        import_client(data, cache_dir=tmp_path)
+    with pytest.raises(ValueError):
+        import_client(data, name="my-client", cache_dir=tmp_path)
+
+    client = import_client(
+        data, name="my_client", include_operations=["root__get"], cache_dir=tmp_path
+    )
+    assert hasattr(client, "RootResponse")
+    assert not hasattr(client, "Team")
+
+    # A corrupt cache entry is regenerated
+    (cache_file,) = tmp_path.glob("*.marshal")
+    cache_file.write_bytes(b"corrupt")
+    client = import_client(
+        data, name="my_client", include_operations=["root__get"], cache_dir=tmp_path
+    )
+    assert hasattr(client, "RootResponse")
+
+
+def test_default_cache_dir(tmp_path, monkeypatch, cleanup_clients):
+    monkeypatch.setenv("OPENAPI_PYTHON_GENERATOR_CACHE", str(tmp_path / "cache"))
+    import_client(test_data_path)
+    assert len(list((tmp_path / "cache").glob("*.marshal"))) == 1
+
+    monkeypatch.delenv("OPENAPI_PYTHON_GENERATOR_CACHE")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    import_client(test_data_path)
+    assert (tmp_path / "xdg" / "openapi-python-generator").is_dir()
+
+
+def test_store_cached_failure_leaves_nothing(tmp_path):
+    with pytest.raises(ValueError):
+        _store_cached(tmp_path / "client.marshal", {"module.py": ("", object())})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_client_cache_depends_on_formats(tmp_path, cleanup_clients):
+    from openapi_python_generator.language_converters.python import type_mapping
+
+    import_client(test_data_path, cache_dir=tmp_path)
+    # Importing type_mapping doesn't change the key.
+    import_client(test_data_path, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.marshal"))) == 1
+
+    type_mapping.register_format("string", "decimal", "Decimal", module="decimal")
+    try:
+        import_client(test_data_path, cache_dir=tmp_path)
+    finally:
+        type_mapping.unregister_format("string", "decimal")
+    assert len(list(tmp_path.glob("*.marshal"))) == 2
+
+    import_client(test_data_path, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.marshal"))) == 2
@@ -0,0 +1,131 @@
+import importlib
+import sys
+
+import pytest
+
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.language_converters.python.imports import (
+    import_statements,
+)
+from openapi_python_generator.language_converters.python.imports import (
+    with_imports,
+)
+
+
+def test_import_statements():
+    source = (
+        "import httpx\n"
+        "from ..api_config import APIConfig\n"
+        "def get_user(user_id: UUID, since: Optional[datetime] = None) -> 'User':\n"
+        "    data: Dict[str, Any] = {}\n"
+        "    return User(**data)\n"
+    )
+    assert import_statements(source, ["User", "Team"], "..models") == [
+        "from typing import Any, Dict, Optional",
+        "from datetime import datetime",
+        "from uuid import UUID",
+        "from ..models.User import User",
+    ]
+    # Names bound by the module itself are not imported
+    assert import_statements("from typing import List\nx: List[int] = []\n") == []
+    assert with_imports("class A:\n    b: 'Optional[int]'\n") == (
+        "class A:\n    b: 'Optional[int]'\n"
+    )
+    assert with_imports("x: Optional[int] = None\n") == (
+        "from typing import Optional\nx: Optional[int] = None\n"
+    )
+    assert with_imports("def (:\n") == "def (:\n"
+
+
+def test_only_annotations_are_scanned_for_forward_references():
+    source = (
+        "class Owner(BaseModel):\n"
+        "    pet: Optional['Pet'] = Field(alias='Team')\n"
+        "    kind: Literal['User'] = 'User'\n"
+        "def get_owner(name: str = 'Team') -> 'Owner':\n"
+        "    return httpx.get('/owners', params={'User': name})\n"
+    )
+    assert import_statements(source, ["Owner", "Pet", "Team", "User"], "..models") == [
+        "from typing import Literal, Optional",
+        "from ..models.Pet import Pet",
+    ]
+
+
+def test_models_may_shadow_typing_names():
+    data, _ = parse_spec(
+        {
+            "openapi": "3.0.3",
+            "info": {"title": "Shadowing", "version": "1.0.0"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "Dict": {
+                        "type": "object",
+                        "properties": {
+                            "values": {"type": "object", "additionalProperties": {}}
+                        },
+                    }
+                }
+            },
+        }
+    )
+    source = generate_sources(data, formatter=Formatter.NONE)["models/Dict.py"]
+    assert source.startswith("from typing import Any, Dict, Optional\n")
+
+    namespace = {"__name__": "shadowing_models_Dict"}
+    exec(source, namespace)
+    model = namespace["Dict"]
+    assert model(values={"a": 1}).values == {"a": 1}
+
+
+@pytest.fixture(name="explicit_client")
+def explicit_client_fixture(json_data, import_generated):
+    files = generate_sources(json_data, formatter=Formatter.NONE)
+    for content in files.values():
+        assert "import *" not in content
+    return import_generated(files, "explicit_client")
+
+
+def test_service_only_imports_used_models(explicit_client):
+    importlib.import_module("explicit_client.services.general_service")
+    models = sorted(
+        name.split(".")[-1]
+        for name in sys.modules
+        if name.startswith("explicit_client.models.")
+    )
+    assert models == ["RootResponse", "Team", "User"]
+
+
+def test_models_are_bound_as_classes(explicit_client):
+    from explicit_client.models.User import User as ImportedUser  # type: ignore
+
+    import explicit_client  # type: ignore
+    from explicit_client import models  # type: ignore
+    from explicit_client.models import EnumComponent, User  # type: ignore
+
+    assert User is ImportedUser
+    assert models.User is User
+    assert explicit_client.User is User
+    assert isinstance(EnumComponent, type)
+    assert sorted(models.__all__) == sorted(
+        [
+            "HTTPValidationError",
+            "RootResponse",
+            "Team",
+            "User",
+            "UserWithUuid",
+            "EnumComponent",
+            "ValidationError",
+        ]
+    )
+    with pytest.raises(AttributeError):
+        models.DoesNotExist
+    with pytest.raises(AttributeError):
+        explicit_client.DoesNotExist
+
+    namespace = {}
+    exec("from explicit_client import *", namespace)
+    assert namespace["Team"].__name__ == "Team"
+    assert "APIConfig" in namespace
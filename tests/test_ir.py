@@ -0,0 +1,79 @@
+from openapi_pydantic.v3 import DataType
+from openapi_pydantic.v3.v3_0 import Reference as Reference30
+from openapi_pydantic.v3.v3_0 import Schema as Schema30
+from openapi_pydantic.v3.v3_1 import Reference as Reference31
+from openapi_pydantic.v3.v3_1 import Schema as Schema31
+
+from openapi_python_generator.language_converters.python import ir
+from openapi_python_generator.language_converters.python.model_generator import (
+    type_converter,
+)
+
+
+def test_lower_is_version_neutral():
+    for schema_cls, reference_cls in [
+        (Schema30, Reference30),
+        (Schema31, Reference31),
+    ]:
+        node = ir.lower(
+            schema_cls(
+                type=DataType.OBJECT,
+                required=["id"],
+                properties={
+                    "id": schema_cls(type=DataType.STRING, schema_format="uuid"),
+                    "owner": reference_cls(ref="#/components/schemas/user-name"),
+                    "tags": schema_cls(
+                        type=DataType.ARRAY, items=schema_cls(type=DataType.STRING)
+                    ),
+                },
+            )
+        )
+        assert isinstance(node, ir.SchemaNode)
+        assert node.type is ir.OBJECT
+        assert node.required == ("id",)
+        assert node.properties["id"].type is ir.STRING
+        assert node.properties["id"].format == "uuid"
+        assert isinstance(node.properties["owner"], ir.RefNode)
+        assert node.properties["owner"].name == "user_name"
+        assert node.properties["tags"].items.type is ir.STRING
+
+
+def test_lower_type_list():
+    node = ir.lower(Schema31(type=[DataType.STRING, DataType.NULL]))
+    assert node.type is ir.STRING
+    assert node.type_list
+    assert node.type_name == str([DataType.STRING, DataType.NULL])
+
+    node = ir.lower(Schema31(type=[]))
+    assert node.type is None and node.type_list
+
+
+def test_lower_shares_nodes():
+    shared = Schema31(type=DataType.INTEGER)
+    memo = {}
+    first = ir.lower(Schema31(allOf=[shared, shared]), memo)
+    assert first.all_of[0] is first.all_of[1]
+    assert ir.lower(shared, memo) is first.all_of[0]
+    assert ir.lower(first) is first
+
+
+def test_lower_schemas():
+    assert ir.lower_schemas(None) == {}
+    nodes = ir.lower_schemas(
+        {
+            "A": Schema30(type=DataType.STRING, enum=["x", "y"]),
+            "B": Reference30(ref="#/components/schemas/A"),
+        }
+    )
+    assert nodes["A"].enum == ("x", "y")
+    assert nodes["B"].ref == "#/components/schemas/A"
+    assert repr(nodes["B"]) == "RefNode('#/components/schemas/A')"
+    assert repr(nodes["A"]) == "SchemaNode(type='string', format=None)"
+
+
+def test_type_converter_accepts_nodes():
+    schema = Schema31(
+        type=DataType.ARRAY, items=Reference31(ref="#/components/schemas/User")
+    )
+    assert type_converter(ir.lower(schema), True) == type_converter(schema, True)
+    assert type_converter(schema, True).converted_type == "List[User]"
@@ -0,0 +1,124 @@
+import pickle
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import load_spec
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.parsers.lazy import LazyComponentMap
+from openapi_python_generator.parsers.lazy import parse_all_components
+from tests.conftest import test_data_folder
+
+SPECS = [
+    "test_api.json",
+    "test_api_31.json",
+    "swagger_petstore_3_0_4.yaml",
+    "openapi_gitea_converted.json",
+    "issue_51.json",
+]
+
+
+def _broken_spec():
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Broken", "version": "1.0.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "operationId": "list_pets",
+                    "tags": ["pets"],
+                    "responses": {
+                        "200": {
+                            "description": "The pets",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Pet"}
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+            "/owners": {
+                "get": {
+                    "operationId": "list_owners",
+                    "tags": ["owners"],
+                    "responses": {"200": {"description": "The owners"}},
+                }
+            },
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                },
+                "Owner": {"type": "text"},
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize("trust_spec", [False, True])
+@pytest.mark.parametrize("spec", SPECS)
+def test_lazy_parse_equals_full_parse(spec, trust_spec):
+    data = load_spec(test_data_folder / spec)
+    parsed, version = parse_spec(data)
+    lazy, lazy_version = parse_spec(data, trust_spec, lazy_components=True)
+
+    assert lazy_version == version
+    assert generate_sources(
+        lazy, HTTPLibrary.httpx, formatter=Formatter.NONE
+    ) == generate_sources(parsed, HTTPLibrary.httpx, formatter=Formatter.NONE)
+    assert lazy == parsed
+    assert pickle.loads(pickle.dumps(lazy)) == parsed
+
+
+@pytest.mark.parametrize("trust_spec", [False, True])
+def test_serialize_after_parsing_all_components(trust_spec):
+    data = load_spec(test_data_folder / "test_api.json")
+    parsed, _ = parse_spec(data)
+    lazy, _ = parse_spec(data, trust_spec, lazy_components=True)
+    lazy.components.schemas["User"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert parse_all_components(lazy).model_dump(
+            by_alias=True
+        ) == parsed.model_dump(by_alias=True)
+        assert parse_all_components(parsed) is parsed
+
+
+def test_unreached_components_stay_unparsed():
+    lazy = parse_spec(_broken_spec(), lazy_components=True)[0]
+    schemas = lazy.components.schemas
+    assert isinstance(schemas, LazyComponentMap)
+
+    sources = generate_sources(
+        lazy, HTTPLibrary.httpx, formatter=Formatter.NONE, include_tags=["pets"]
+    )
+    assert "models/Pet.py" in sources and "models/Owner.py" not in sources
+    assert list(schemas) == ["Pet", "Owner"]
+    assert dict.__getitem__(schemas, "Owner") == {"type": "text"}
+
+
+def test_invalid_component_raises_on_access():
+    with pytest.raises(ValidationError):
+        parse_spec(_broken_spec())
+
+    for trust_spec in (False, True):
+        schemas = parse_spec(_broken_spec(), trust_spec, lazy_components=True)[
+            0
+        ].components.schemas
+        assert schemas["Pet"].properties["name"].type == "string"
+        with pytest.raises(ValidationError) as e:
+            schemas["Owner"]
+        errors = e.value.errors()
+        assert errors and all(
+            error["loc"][:3] == ("components", "schemas", "Owner") for error in errors
+        )
+        assert "enum" in {error["type"] for error in errors}
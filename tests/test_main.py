@@ -26,3 +26,49 @@ def test_main_succeeds(runner: CliRunner, model_data_with_cleanup, library) -> N
         [str(test_data_path), str(test_result_path), "--library", library.value],
     )
     assert result.exit_code == 0
+
+
+def test_main_check(runner: CliRunner, model_data_with_cleanup) -> None:
+    """It verifies the generated client without writing to it."""
+    args = [str(test_data_path), str(test_result_path), "--formatter", "none"]
+
+    result = runner.invoke(main, args + ["--check"])
+    assert result.exit_code == 1
+    assert "api_config.py" in result.output
+    assert not test_result_path.exists()
+
+    assert runner.invoke(main, args).exit_code == 0
+    result = runner.invoke(main, args + ["--check"])
+    assert result.exit_code == 0
+    assert "up to date" in result.output
+
+    (test_result_path / "api_config.py").write_text("# edited by hand\n")
+    (test_result_path / "models" / "Removed.py").write_text("")
+    result = runner.invoke(main, args + ["--check"])
+    assert result.exit_code == 1
+    assert "  api_config.py" in result.output
+    assert "  models/Removed.py" in result.output
+    assert "  models/User.py" not in result.output
+    assert (test_result_path / "api_config.py").read_text() == "# edited by hand\n"
+
+
+def test_main_compile(runner: CliRunner, model_data_with_cleanup) -> None:
+    """It precompiles the generated modules."""
+    result = runner.invoke(
+        main,
+        [
+            str(test_data_path),
+            str(test_result_path),
+            "--formatter",
+            "none",
+            "--compile",
+            "--invalidation-mode",
+            "checked-hash",
+        ],
+    )
+    assert result.exit_code == 0
+    pyc = test_result_path / "models" / "__pycache__"
+    assert len(list(pyc.glob("User.*.pyc"))) == 1
+    # Checked hash-based
+    content = next(pyc.glob("User.*.pyc")).read_bytes()
+    assert int.from_bytes(content[4:8], "little") == 0b11
@@ -0,0 +1,108 @@
+import pytest
+from click.testing import CliRunner
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.language_converters.python.generator import generator
+from openapi_python_generator.language_converters.python.operation_filter import (
+    apply_operation_filter,
+)
+from openapi_python_generator.language_converters.python.operation_filter import (
+    reachable_schemas,
+)
+from openapi_python_generator.models import OperationFilter
+from tests.conftest import test_data_path
+from tests.conftest import test_result_path
+
+
+def _operation_ids(spec):
+    return sorted(
+        op.operationId
+        for path in spec.paths.values()
+        for op in (path.get, path.post, path.put, path.delete, path.patch)
+        if op is not None
+    )
+
+
+def test_empty_filter_keeps_spec(model_data):
+    assert apply_operation_filter(model_data, OperationFilter()) is model_data
+    assert apply_operation_filter(model_data, None) is model_data
+
+
+def test_filter_by_operation_id(model_data):
+    pruned = apply_operation_filter(
+        model_data, OperationFilter(include_operations=["root__get"])
+    )
+    assert _operation_ids(pruned) == ["root__get"]
+    assert list(pruned.components.schemas) == ["RootResponse"]
+    # The original specification is left untouched
+    assert len(model_data.components.schemas) == 7
+
+
+def test_filter_by_path_glob_follows_refs_transitively(model_data):
+    pruned = apply_operation_filter(
+        model_data, OperationFilter(include_paths=["/teams/*"])
+    )
+    assert _operation_ids(pruned) == [
+        "delete_team_teams__team_id__delete",
+        "get_team_teams__team_id__get",
+        "update_team_teams__team_id__patch",
+    ]
+    # Team references User, error responses reference the validation errors
+    assert set(pruned.components.schemas) == {
+        "Team",
+        "User",
+        "HTTPValidationError",
+        "ValidationError",
+    }
+
+
+def test_filter_by_tag_matches_everything(model_data):
+    pruned = apply_operation_filter(
+        model_data, OperationFilter(include_tags=["general"])
+    )
+    assert _operation_ids(pruned) == _operation_ids(model_data)
+
+
+def test_filter_without_match_generates_nothing(model_data):
+    pruned = apply_operation_filter(
+        model_data, OperationFilter(include_tags=["does_not_exist"])
+    )
+    assert pruned.paths == {}
+    assert pruned.components.schemas == {}
+    assert reachable_schemas({}, model_data.components) == []
+
+
+def test_generator_with_filter(model_data):
+    result = generator(
+        model_data,
+        library_config_dict[HTTPLibrary.httpx],
+        operation_filter=OperationFilter(include_operations=["root__get"]),
+    )
+    assert [m.file_name for m in result.models] == ["RootResponse"]
+    operations = [op.operation_id for s in result.services for op in s.operations]
+    assert operations == ["root__get", "root__get"]
+
+
+def test_cli_include_operations(model_data_with_cleanup):
+    result = CliRunner().invoke(
+        main,
+        [
+            str(test_data_path),
+            str(test_result_path),
+            "--include-operations",
+            "root__get",
+            "--include-paths",
+            "/users",
+        ],
+    )
+    assert result.exit_code == 0
+    models = sorted(p.stem for p in (test_result_path / "models").glob("*.py"))
+    assert models == [
+        "HTTPValidationError",
+        "RootResponse",
+        "User",
+        "ValidationError",
+        "__init__",
+    ]
@@ -0,0 +1,84 @@
+import pytest
+
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import PydanticVersion
+from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import load_spec
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.language_converters.python import type_mapping
+from openapi_python_generator.language_converters.python.generator import (
+    generate_targets,
+)
+from openapi_python_generator.language_converters.python.parallel import (
+    RenderJob,
+)
+from openapi_python_generator.language_converters.python.parallel import (
+    render_jobs,
+)
+from tests.conftest import test_data_folder
+
+
+def _render_squares(items, offset):
+    return [item * item + offset for item in items]
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, None])
+def test_render_jobs_keeps_order(workers):
+    items = list(range(50))
+    assert render_jobs(
+        [
+            RenderJob(_render_squares, items, (1,)),
+            RenderJob(_render_squares, [], (1,)),
+            RenderJob(_render_squares, items[:7], (2,)),
+        ],
+        workers,
+    ) == [
+        [item * item + 1 for item in items],
+        [],
+        [item * item + 2 for item in items[:7]],
+    ]
+    assert render_jobs([RenderJob(_render_squares, [], (1,))], workers) == [[]]
+    assert render_jobs([], workers) == []
+
+
+@pytest.mark.parametrize(
+    "spec", ["test_api.json", "test_api_31.json", "openapi_gitea_converted.json"]
+)
+def test_parallel_rendering_equals_serial_rendering(spec):
+    openapi = parse_spec(load_spec(test_data_folder / spec))[0]
+    targets = [
+        (library_config_dict[HTTPLibrary.httpx], PydanticVersion.V2),
+        (library_config_dict[HTTPLibrary.aiohttp], PydanticVersion.V1),
+    ]
+    serial = generate_targets(openapi, targets)
+    parallel = generate_targets(openapi, targets, render_workers=2)
+    assert parallel == serial
+
+
+def test_parallel_rendering_uses_registered_formats():
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": "Prices", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                name: {
+                    "type": "object",
+                    "properties": {"amount": {"type": "string", "format": "decimal"}},
+                }
+                for name in ("Price", "Discount", "Tax")
+            }
+        },
+    }
+    type_mapping.register_format("string", "decimal", "Decimal", module="decimal")
+    try:
+        serial = generate_sources(spec, HTTPLibrary.httpx, formatter=Formatter.NONE)
+        parallel = generate_sources(
+            spec, HTTPLibrary.httpx, formatter=Formatter.NONE, render_workers=2
+        )
+    finally:
+        type_mapping.unregister_format("string", "decimal")
+    assert parallel == serial
+    assert "from decimal import Decimal" in parallel["models/Tax.py"]
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import test_data_folder
+
+
+def _generate(source: Path, output: Path, hash_seed: str) -> None:
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "openapi_python_generator",
+            str(source),
+            str(output),
+            "--formatter",
+            "none",
+        ],
+        check=True,
+        env=env,
+        capture_output=True,
+    )
+
+
+def _read_tree(root: Path):
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    "spec", ["swagger_petstore_3_0_4.yaml", "swagger_petstore_3_1.yaml"]
+)
+def test_output_independent_of_hash_seed(tmp_path, spec):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    _generate(test_data_folder / spec, first, "1")
+    _generate(test_data_folder / spec, second, "2")
+
+    first_tree = _read_tree(first)
+    assert len(first_tree) > 0
+    assert first_tree == _read_tree(second)
+
+
+def test_service_order_independent_of_hash_seed():
+    program = (
+        "from openapi_python_generator.common import HTTPLibrary, library_config_dict\n"
+        "from openapi_python_generator.generate_data import get_open_api\n"
+        "from openapi_python_generator.language_converters.python.generator import generator\n"
+        f"spec, _ = get_open_api({str(test_data_folder / 'swagger_petstore_3_0_4.yaml')!r})\n"
+        "result = generator(spec, library_config_dict[HTTPLibrary.httpx])\n"
+        "print([s.file_name for s in result.services])\n"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", program],
+            check=True,
+            env=dict(os.environ, PYTHONHASHSEED=seed),
+            capture_output=True,
+            text=True,
+        ).stdout
+        for seed in ("1", "2", "3", "4")
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,135 @@
+import pytest
+from click.testing import CliRunner
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.language_converters.python.schema_dedup import (
+    deduplicate_schemas,
+)
+from openapi_python_generator.language_converters.python.schema_dedup import (
+    find_duplicate_schemas,
+)
+
+
+def _address(title):
+    return {
+        "title": title,
+        "type": "object",
+        "required": ["street"],
+        "properties": {
+            "street": {"type": "string", "description": title},
+            "city": {"type": "string"},
+        },
+    }
+
+
+def _customer(address):
+    return {
+        "type": "object",
+        "properties": {"address": {"$ref": f"#/components/schemas/{address}"}},
+    }
+
+
+@pytest.fixture
+def spec():
+    return {
+        "openapi": "3.0.2",
+        "info": {"title": "Duplicates", "version": "1.0.0"},
+        "paths": {
+            "/customers": {
+                "get": {
+                    "operationId": "get_customer",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/CustomerDto"
+                                    }
+                                }
+                            },
+                        }
+                    },
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Address": _address("Address"),
+                "Address1": _address("Address1"),
+                "AddressDto": _address("AddressDto"),
+                "Customer": _customer("Address"),
+                "CustomerDto": _customer("AddressDto"),
+                "Note": {
+                    "type": "object",
+                    "properties": {"description": {"type": "string"}},
+                },
+                "Text": {
+                    "type": "object",
+                    "properties": {"title": {"type": "string"}},
+                },
+            }
+        },
+    }
+
+
+def test_find_duplicate_schemas(spec):
+    openapi = parse_spec(spec)[0]
+    assert find_duplicate_schemas(openapi.components.schemas) == {
+        "Address1": "Address",
+        "AddressDto": "Address",
+        "CustomerDto": "Customer",
+    }
+
+
+def test_deduplicate_schemas(spec):
+    openapi = parse_spec(spec)[0]
+    deduplicated, duplicates = deduplicate_schemas(openapi)
+
+    assert list(deduplicated.components.schemas) == [
+        "Address",
+        "Customer",
+        "Note",
+        "Text",
+    ]
+    response = deduplicated.paths["/customers"].get.responses["200"]
+    assert (
+        response.content["application/json"].media_type_schema.ref
+        == "#/components/schemas/Customer"
+    )
+    # The parsed specification itself is unchanged
+    assert len(openapi.components.schemas) == 7
+    assert (
+        openapi.components.schemas["CustomerDto"].properties["address"].ref
+        == "#/components/schemas/AddressDto"
+    )
+
+    assert deduplicate_schemas(deduplicated) == (deduplicated, {})
+
+
+def test_generate_deduplicated_models(spec, import_generated):
+    files = generate_sources(
+        spec, HTTPLibrary.httpx, formatter=Formatter.NONE, deduplicate_models=True
+    )
+    assert "models/Address.py" in files
+    assert "models/AddressDto.py" not in files
+    assert "-> Customer:" in files["services/default_service.py"]
+
+    client = import_generated(files, "dedup_client")
+    from dedup_client.models import Address, AddressDto
+
+    assert AddressDto is Address
+    assert client.CustomerDto is client.Customer
+
+
+def test_cli_deduplicate_models(tmp_path):
+    result = CliRunner().invoke(
+        main,
+        ["spec.json", str(tmp_path / "out"), "--watch", "--deduplicate-models"],
+    )
+    assert result.exit_code == 2
+    assert "--deduplicate-models" in result.output
@@ -0,0 +1,169 @@
+import sys
+
+from click.testing import CliRunner
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.common import ServiceSplit
+from openapi_python_generator.common import library_config_dict
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.language_converters.python.service_generator import (
+    generate_services,
+)
+from openapi_python_generator.models import GenerationContext
+from tests.conftest import test_data_path
+from tests.conftest import test_result_path
+
+
+def _modules(services):
+    return {
+        s.file_name: [op.operation_id for op in s.operations]
+        for s in services
+        if s.operations
+    }
+
+
+def test_split_by_path(model_data):
+    services = generate_services(
+        model_data.paths,
+        library_config_dict[HTTPLibrary.requests],
+        GenerationContext(service_split=ServiceSplit.PATH),
+    )
+    assert _modules(services) == {
+        "default_service": ["root__get"],
+        "teams_service": [
+            "get_teams_teams_get",
+            "create_team_teams_post",
+            "get_team_teams__team_id__get",
+            "delete_team_teams__team_id__delete",
+            "update_team_teams__team_id__patch",
+        ],
+        "users_service": [
+            "get_users_users_get",
+            "create_user_users_post",
+            "get_user_users__user_id__get",
+            "delete_user_users__user_id__delete",
+            "update_user_users__user_id__patch",
+        ],
+    }
+
+
+def test_split_by_max_operations(model_data):
+    services = generate_services(
+        model_data.paths,
+        library_config_dict[HTTPLibrary.httpx],
+        GenerationContext(max_operations_per_service=4),
+    )
+    modules = _modules(services)
+    assert list(modules) == [
+        "general_1_service",
+        "general_2_service",
+        "general_3_service",
+        "async_general_1_service",
+        "async_general_2_service",
+        "async_general_3_service",
+    ]
+    assert [len(ops) for ops in modules.values()] == [4, 4, 3, 4, 4, 3]
+    assert modules["general_2_service"] == modules["async_general_2_service"]
+    for service in services:
+        compile(service.content, "<string>", "exec")
+
+    # Services below the maximum keep their name
+    services = generate_services(
+        model_data.paths,
+        library_config_dict[HTTPLibrary.httpx],
+        GenerationContext(
+            service_split=ServiceSplit.PATH, max_operations_per_service=5
+        ),
+    )
+    assert "users_service" in _modules(services)
+
+
+def test_split_modules_dont_collide_with_tags():
+    def operation(tag, index):
+        return {
+            "get": {
+                "operationId": f"op{tag}{index}",
+                "tags": [tag],
+                "responses": {"200": {"description": "OK"}},
+            }
+        }
+
+    paths = {f"/users/{i}": operation("users", i) for i in range(3)}
+    paths["/other"] = operation("users_1", 0)
+    data, _ = parse_spec(
+        {
+            "openapi": "3.0.3",
+            "info": {"title": "Collisions", "version": "1.0.0"},
+            "paths": paths,
+        }
+    )
+    services = generate_services(
+        data.paths,
+        library_config_dict[HTTPLibrary.requests],
+        GenerationContext(max_operations_per_service=2),
+    )
+    assert _modules(services) == {
+        "users_1_service": ["opusers_10"],
+        "users_1_1_service": ["opusers0", "opusers1"],
+        "users_2_service": ["opusers2"],
+    }
+
+
+def test_services_index_imports_single_module(json_data, import_generated):
+    files = generate_sources(
+        json_data,
+        HTTPLibrary.httpx,
+        formatter="none",
+        max_operations_per_service=4,
+    )
+    services = import_generated(files, "split_client.services")
+    from split_client.services import get_team_teams__team_id__get  # type: ignore
+
+    assert (
+        get_team_teams__team_id__get.__module__
+        == "split_client.services.general_3_service"
+    )
+    assert "split_client.services.general_1_service" not in sys.modules
+
+    root = services.get_operation("root__get", async_client=True)
+    assert root.__module__ == "split_client.services.async_general_1_service"
+
+    try:
+        services.does_not_exist
+    except AttributeError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("Unknown operations raise AttributeError")
+
+
+def test_cli_service_split(model_data_with_cleanup):
+    result = CliRunner().invoke(
+        main,
+        [
+            str(test_data_path),
+            str(test_result_path),
+            "--formatter",
+            "none",
+            "--library",
+            "aiohttp",
+            "--service-split",
+            "path",
+            "--max-operations-per-service",
+            "3",
+        ],
+    )
+    assert result.exit_code == 0
+    services = sorted(p.name for p in (test_result_path / "services").glob("*.py"))
+    assert services == [
+        "__init__.py",
+        "async_default_service.py",
+        "async_teams_1_service.py",
+        "async_teams_2_service.py",
+        "async_users_1_service.py",
+        "async_users_2_service.py",
+    ]
+    # Async only operations are resolved to their async variant by the index
+    index = (test_result_path / "services" / "__init__.py").read_text()
+    assert '"root__get": "async_default_service"' in index
@@ -0,0 +1,95 @@
+import copy
+
+import pytest
+from click.testing import CliRunner
+from pydantic import ValidationError
+
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.generate_data import load_spec
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.parsers import sharded
+from openapi_python_generator.parsers.sharded import json_pointer
+from tests.conftest import test_data_folder
+
+SPECS = [
+    "test_api.json",
+    "test_api_31.json",
+    "swagger_petstore_3_1.yaml",
+    "openapi_gitea_converted.json",
+    "issue_51.json",
+    "int_valued_floats.json",
+]
+
+
+def _errors(data, validation_workers):
+    with pytest.raises(ValidationError) as e:
+        parse_spec(data, validation_workers=validation_workers)
+    return sorted((error["loc"], error["type"]) for error in e.value.errors())
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_sharded_validation_equals_validation(spec):
+    data = load_spec(test_data_folder / spec)
+    validated, version = parse_spec(data)
+    sharded, sharded_version = parse_spec(data, validation_workers=2)
+
+    assert sharded_version == version
+    assert sharded == validated
+    assert sharded.model_fields_set == validated.model_fields_set
+
+
+def test_sharded_validation_falls_back_to_validation(monkeypatch):
+    def failing_construct_model(model, data):
+        raise ValidationError.from_exception_data(model.__name__, [])
+
+    monkeypatch.setattr(sharded, "construct_model", failing_construct_model)
+    data = load_spec(test_data_folder / "int_valued_floats.json")
+
+    assert parse_spec(data, validation_workers=2) == parse_spec(data)
+
+
+def test_sharded_validation_reports_all_errors():
+    data = copy.deepcopy(load_spec(test_data_folder / "test_api.json"))
+    data["info"] = {"title": "Broken"}
+    data["paths"]["/users/{user_id}"] = {"get": {"responses": 3}}
+    data["components"]["schemas"]["User"] = {"type": "text"}
+
+    errors = _errors(data, 2)
+    assert errors == _errors(data, 1)
+    assert {json_pointer(loc)[:32] for loc, _ in errors} == {
+        "/info/version",
+        "/paths/~1users~1{user_id}/get/re",
+        "/components/schemas/User/Referen",
+        "/components/schemas/User/Schema/",
+    }
+
+
+def test_json_pointer():
+    assert json_pointer(()) == ""
+    assert json_pointer(("paths", "/pets/{id}", "get", "parameters", 0)) == (
+        "/paths/~1pets~1{id}/get/parameters/0"
+    )
+    assert json_pointer(("components", "schemas", "a~b")) == "/components/schemas/a~0b"
+
+
+def test_invalid_spec_reports_json_pointers(tmp_path):
+    spec = tmp_path / "openapi.json"
+    spec.write_text(
+        '{"openapi": "3.0.3", "info": {"title": "Broken", "version": "1.0.0"}, '
+        '"paths": {"/pets": {"get": {"responses": 3}}}}'
+    )
+    result = CliRunner().invoke(
+        main, [str(spec), str(tmp_path / "out"), "--validation-workers", "2"]
+    )
+    assert result.exit_code != 0
+    assert "/paths/~1pets/get/responses:" in result.output
+
+
+def test_cli_rejects_validation_workers_without_validation(tmp_path):
+    spec = str(test_data_folder / "test_api.json")
+    for option in ("--trust-spec", "--lazy-components"):
+        result = CliRunner().invoke(
+            main, [spec, str(tmp_path / "out"), option, "--validation-workers", "2"]
+        )
+        assert result.exit_code == 2
+        assert "--validation-workers can't be combined" in result.output
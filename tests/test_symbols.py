@@ -0,0 +1,127 @@
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.language_converters.python.symbols import MODELS
+from openapi_python_generator.language_converters.python.symbols import OPERATIONS
+from openapi_python_generator.language_converters.python.symbols import SymbolTable
+from openapi_python_generator.language_converters.python.symbols import (
+    normalize_symbol,
+)
+
+
+def test_normalize_symbol_is_cached():
+    normalize_symbol.cache_clear()
+    assert normalize_symbol("user-name") == "user_name"
+    assert normalize_symbol("user-name") == "user_name"
+    assert normalize_symbol("class") == "class_"
+    assert normalize_symbol.cache_info().hits == 1
+
+
+def test_symbol_table():
+    symbols = SymbolTable()
+    assert symbols.identifier(MODELS, "User-Info") == "User_Info"
+    assert symbols.identifier(MODELS, "User_Info") == "User_Info_1"
+    assert symbols.identifier(MODELS, "user_info") == "user_info_2"
+    assert symbols.identifier(MODELS, "User-Info") == "User_Info"
+
+    # Operations are functions, so only exact collisions count
+    assert symbols.identifier(OPERATIONS, "get-user", key=("/a", "get")) == "get_user"
+    assert symbols.identifier(OPERATIONS, "Get_user", key=("/b", "get")) == "Get_user"
+    assert symbols.identifier(OPERATIONS, "get-user", key=("/c", "get")) == "get_user_1"
+    assert symbols.identifier(OPERATIONS, "get-user", key=("/a", "get")) == "get_user"
+
+    assert symbols.renamed == [
+        (MODELS, "User_Info", "User_Info_1"),
+        (MODELS, "user_info", "user_info_2"),
+        (OPERATIONS, "get-user", "get_user_1"),
+    ]
+
+
+def test_colliding_names_are_generated_separately():
+    user = {
+        "type": "object",
+        "required": ["id"],
+        "properties": {"id": {"type": "integer"}},
+    }
+    spec = {
+        "openapi": "3.0.2",
+        "info": {"title": "Collisions", "version": "1.0.0"},
+        "paths": {
+            "/users/{id}": {
+                "get": {
+                    "operationId": "get-user",
+                    "parameters": [
+                        {
+                            "name": "id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/User_Info"}
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+            "/admins/{id}": {
+                "get": {
+                    "operationId": "get_user",
+                    "parameters": [
+                        {
+                            "name": "id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/User-Info"}
+                                }
+                            },
+                        }
+                    },
+                }
+            },
+        },
+        "components": {
+            "schemas": {
+                "User-Info": user,
+                "User_Info": user,
+                "Team": {
+                    "type": "object",
+                    "properties": {
+                        "lead": {"$ref": "#/components/schemas/User_Info"},
+                        "members": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/User-Info"},
+                        },
+                    },
+                },
+            }
+        },
+    }
+    files = generate_sources(spec, HTTPLibrary.requests, formatter=Formatter.NONE)
+
+    assert "class User_Info(BaseModel)" in files["models/User_Info.py"]
+    assert "class User_Info_1(BaseModel)" in files["models/User_Info_1.py"]
+    team = files["models/Team.py"]
+    assert "from .User_Info_1 import User_Info_1" in team
+    assert "lead : Optional[User_Info_1]" in team
+    assert "members : Optional[List[Optional[User_Info]]]" in team
+
+    service = files["services/default_service.py"]
+    assert "def get_user(" in service and "-> User_Info_1:" in service
+    assert "def get_user_1(" in service and "-> User_Info:" in service
+    for content in files.values():
+        compile(content, "<string>", "exec")
@@ -0,0 +1,133 @@
+import gc
+
+import pytest
+from pydantic import ValidationError
+
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.common import HTTPLibrary
+from openapi_python_generator.generate_data import generate_sources
+from openapi_python_generator.generate_data import get_open_api
+from openapi_python_generator.generate_data import load_spec
+from openapi_python_generator.generate_data import parse_spec
+from openapi_python_generator.parsers.trusted import construct_model
+from openapi_pydantic.v3.v3_0 import OpenAPI as OpenAPI30
+from openapi_pydantic.v3.v3_0 import Reference as Reference30
+from openapi_pydantic.v3.v3_0 import Schema as Schema30
+from openapi_pydantic.v3.v3_1 import Schema as Schema31
+from tests.conftest import test_data_folder
+
+SPECS = [
+    "test_api.json",
+    "test_api_31.json",
+    "swagger_petstore_3_0_4.yaml",
+    "swagger_petstore_3_1.yaml",
+    "openapi_gitea_converted.json",
+    "issue_17.json",
+    "issue_51.json",
+    "issue_71_31.json",
+    "int_valued_floats.json",
+]
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_trusted_parse_equals_validated_parse(spec):
+    data = load_spec(test_data_folder / spec)
+    validated, version = parse_spec(data)
+    trusted, trusted_version = parse_spec(data, trust_spec=True)
+
+    assert trusted_version == version
+    assert trusted == validated
+    assert trusted.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+    assert (
+        trusted.model_fields_set == validated.model_fields_set
+        and trusted.info.model_fields_set == validated.info.model_fields_set
+    )
+    assert generate_sources(
+        trusted, HTTPLibrary.httpx, formatter=Formatter.NONE
+    ) == generate_sources(validated, HTTPLibrary.httpx, formatter=Formatter.NONE)
+
+
+def test_trusted_parse_stores_integers_of_float_fields_as_floats():
+    data = load_spec(test_data_folder / "int_valued_floats.json")
+    schema = parse_spec(data, trust_spec=True)[0].components.schemas["EvenCount"]
+
+    assert type(schema.minimum) is float and schema.minimum == 0
+    assert type(schema.multipleOf) is float and schema.multipleOf == 2
+
+
+def test_trusted_parse_resolves_unions_like_validation():
+    schemas = {
+        "reference": {"$ref": "#/components/schemas/Pet"},
+        "reference_with_description": {
+            "$ref": "#/components/schemas/Pet",
+            "description": "A pet",
+        },
+        "schema": {"type": "object", "additionalProperties": False},
+        "nested": {
+            "type": "object",
+            "additionalProperties": {"$ref": "#/components/schemas/Pet"},
+            "x-extension": {"type": "string"},
+        },
+    }
+    for version, schema_type in (("3.0.3", Schema30), ("3.1.0", Schema31)):
+        data = {
+            "openapi": version,
+            "info": {"title": "Unions", "version": "1.0.0"},
+            "paths": {},
+            "components": {"schemas": {"Pet": {"properties": schemas}}},
+        }
+        validated = parse_spec(data)[0]
+        trusted = parse_spec(data, trust_spec=True)[0]
+        assert trusted == validated
+        pet = trusted.components.schemas["Pet"]
+        assert isinstance(pet, schema_type)
+        assert pet.properties["nested"].model_extra == {
+            "x-extension": {"type": "string"}
+        }
+
+    pet = construct_model(OpenAPI30, data | {"openapi": "3.0.3"}).components.schemas[
+        "Pet"
+    ]
+    assert isinstance(pet.properties["reference"], Reference30)
+
+
+@pytest.mark.parametrize(
+    "change, loc, error_type",
+    [
+        ({"info": {"title": "Broken"}}, ("info", "version"), "missing"),
+        ({"paths": {"/pets": []}}, ("paths", "/pets"), "model_type"),
+        (
+            {
+                "paths": {
+                    "/pets": {"get": {"parameters": [{"$ref": 1}], "responses": {}}}
+                }
+            },
+            ("paths", "/pets", "get", "parameters", 0, "$ref"),
+            "string_type",
+        ),
+        (
+            {"components": {"schemas": {"Pet": {"type": "text"}}}},
+            ("components", "schemas", "Pet", "type"),
+            "enum",
+        ),
+    ],
+)
+def test_trusted_parse_checks_structure(change, loc, error_type):
+    data = {
+        "openapi": "3.0.3",
+        "info": {"title": "Broken", "version": "1.0.0"},
+        "paths": {},
+    } | change
+    with pytest.raises(ValidationError):
+        parse_spec(data)
+    with pytest.raises(ValidationError) as e:
+        parse_spec(data, trust_spec=True)
+    (error,) = e.value.errors()
+    assert error["loc"] == loc and error["type"] == error_type
+    assert gc.isenabled()
+
+
+def test_get_open_api_trusted():
+    trusted, version = get_open_api(test_data_folder / "test_api.json", trust_spec=True)
+    assert version == "3.0"
+    assert trusted == get_open_api(test_data_folder / "test_api.json")[0]
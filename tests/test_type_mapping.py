@@ -0,0 +1,110 @@
+import pytest
+from openapi_pydantic.v3 import DataType
+from openapi_pydantic.v3.v3_0 import Schema as Schema30
+from openapi_pydantic.v3.v3_1 import Schema as Schema31
+
+from openapi_python_generator.language_converters.python import type_mapping
+from openapi_python_generator.language_converters.python.imports import (
+    import_statements,
+)
+from openapi_python_generator.language_converters.python.model_generator import (
+    type_converter,
+)
+from openapi_python_generator.models import GenerationContext
+from openapi_python_generator.models import TypeConversion
+
+
+@pytest.fixture
+def decimal_format():
+    type_mapping.register_format("string", "decimal", "Decimal", module="decimal")
+    yield
+    type_mapping.unregister_format("string", "decimal")
+
+
+def test_lookup():
+    assert type_mapping.lookup("integer", None, False).python_type == "int"
+    assert type_mapping.lookup("integer", "int64", False).python_type == "int"
+    assert type_mapping.lookup("string", "date-time", False).python_type == "str"
+    assert type_mapping.lookup("string", "date-time", True).python_type == "datetime"
+    assert type_mapping.lookup("string", "uuid4", True).import_types == [
+        "from pydantic import UUID4"
+    ]
+    assert type_mapping.lookup("mystery", None, False).python_type == "str"
+
+
+def test_register_format(decimal_format):
+    schema = Schema31(
+        type=DataType.ARRAY,
+        items=Schema31(type=DataType.STRING, schema_format="decimal"),
+    )
+    assert type_converter(schema.items, True) == TypeConversion(
+        original_type="string",
+        converted_type="Decimal",
+        import_types=["from decimal import Decimal"],
+    )
+    assert type_converter(schema, False).converted_type == "Optional[List[Decimal]]"
+    assert import_statements("x: List[Decimal] = []") == [
+        "from typing import List",
+        "from decimal import Decimal",
+    ]
+
+    type_mapping.unregister_format("string", "decimal")
+    assert type_converter(schema.items, True).converted_type == "str"
+    assert import_statements("x: List[Decimal] = []") == ["from typing import List"]
+
+
+def test_register_format_requires_orjson():
+    type_mapping.register_format(
+        DataType.STRING, "date", "date", module="datetime", requires_orjson=True
+    )
+    try:
+        schema = Schema30(type=DataType.STRING, schema_format="date")
+        assert (
+            type_converter(
+                schema, True, context=GenerationContext(use_orjson=False)
+            ).converted_type
+            == "str"
+        )
+        assert (
+            type_converter(
+                schema, True, context=GenerationContext(use_orjson=True)
+            ).converted_type
+            == "date"
+        )
+    finally:
+        type_mapping.unregister_format(DataType.STRING, "date")
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_type_list_converts_like_single_type(use_orjson):
+    context = GenerationContext(use_orjson=use_orjson)
+    for schema_format in [None, "date-time", "uuid", "uuid5", "int64"]:
+        for data_type in [DataType.STRING, DataType.INTEGER, DataType.ARRAY]:
+            single = type_converter(
+                Schema30(type=data_type, schema_format=schema_format),
+                True,
+                context=context,
+            )
+            type_list = type_converter(
+                Schema31(type=[data_type, DataType.NULL], schema_format=schema_format),
+                True,
+                context=context,
+            )
+            assert single.converted_type == type_list.converted_type
+            assert single.import_types == type_list.import_types
+
+
+def test_generations_keep_their_formats(decimal_format):
+    schema = Schema31(type=DataType.STRING, schema_format="decimal")
+    context = GenerationContext()
+    type_mapping.unregister_format("string", "decimal")
+    try:
+        # Registering doesn't affect a generation that already started, and vice versa.
+        assert type_converter(schema, True, context=context).converted_type == "Decimal"
+        assert type_converter(schema, True).converted_type == "str"
+        assert import_statements("x: Decimal", formats=context.formats) == [
+            "from decimal import Decimal"
+        ]
+        assert import_statements("x: Decimal") == []
+    finally:
+        type_mapping.register_format("string", "decimal", "Decimal", module="decimal")
@@ -0,0 +1,167 @@
+import os
+
+import orjson
+import pytest
+from click.testing import CliRunner
+
+from openapi_python_generator import watch
+from openapi_python_generator.__main__ import main
+from openapi_python_generator.common import Formatter
+from openapi_python_generator.generate_data import generate_data
+from openapi_python_generator.watch import Watcher
+from tests.conftest import test_data_path
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_bytes(test_data_path.read_bytes())
+    return path
+
+
+def _edit_spec(path, edit):
+    data = orjson.loads(path.read_bytes())
+    edit(data)
+    path.write_bytes(orjson.dumps(data))
+    # Make sure the modification is visible even on file systems with a coarse mtime
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_watcher_matches_full_generation(spec_path, tmp_path):
+    watcher = Watcher(spec_path, tmp_path / "watched", formatter=Formatter.NONE)
+    watcher.regenerate()
+    generate_data(spec_path, tmp_path / "full", formatter=Formatter.NONE)
+
+    def tree(root):
+        return {str(p.relative_to(root)): p.read_text() for p in root.rglob("*.py")}
+
+    assert tree(tmp_path / "watched") == tree(tmp_path / "full")
+
+
+def test_watcher_regenerates_only_changes(spec_path, tmp_path, monkeypatch):
+    output = tmp_path / "client"
+    watcher = Watcher(spec_path, output, formatter=Formatter.BLACK)
+
+    rendered_schemas = []
+    rendered_paths = []
+    formatted = []
+    generate_models = watch.generate_models
+    generate_service_operations = watch.generate_service_operations
+    format_code = watch.format_code
+
+    def spy_models(components, *args):
+        rendered_schemas.extend(components.schemas)
+        return generate_models(components, *args)
+
+    def spy_operations(paths, *args):
+        rendered_paths.extend(paths)
+        return generate_service_operations(paths, *args)
+
+    def spy_format(content, formatter):
+        formatted.append(content)
+        return format_code(content, formatter)
+
+    monkeypatch.setattr(watch, "generate_models", spy_models)
+    monkeypatch.setattr(watch, "generate_service_operations", spy_operations)
+    monkeypatch.setattr(watch, "format_code", spy_format)
+
+    assert len(watcher.regenerate()) > 0
+    assert len(rendered_schemas) == 7
+    assert watcher.poll() is None
+
+    rendered_schemas.clear()
+    rendered_paths.clear()
+    formatted.clear()
+
+    def edit(data):
+        data["components"]["schemas"]["Team"]["properties"]["motto"] = {
+            "type": "string"
+        }
+        data["paths"]["/"]["get"]["summary"] = "Changed"
+        del data["components"]["schemas"]["EnumComponent"]
+
+    _edit_spec(spec_path, edit)
+    written = watcher.poll()
+
+    assert rendered_schemas == ["Team"]
+    assert rendered_paths == ["/"]
+    # The summary isn't part of the rendered service, so only the changed model and the
+    # package and models indexes are formatted again
+    assert len(formatted) == 3
+    assert written == ["models/Team.py", "models/__init__.py", "__init__.py"]
+    assert "motto" in (output / "models" / "Team.py").read_text()
+    assert not (output / "models" / "EnumComponent.py").exists()
+
+
+def _tree(root):
+    return {str(p.relative_to(root)): p.read_text() for p in root.rglob("*.py")}
+
+
+def _rename_schema(data, old, new):
+    schemas = data["components"]["schemas"]
+    data["components"]["schemas"] = {
+        new if name == old else name: schema for name, schema in schemas.items()
+    }
+    renamed = orjson.loads(
+        orjson.dumps(data).replace(
+            f'"#/components/schemas/{old}"'.encode(),
+            f'"#/components/schemas/{new}"'.encode(),
+        )
+    )
+    data.clear()
+    data.update(renamed)
+
+
+def test_watcher_renames_like_full_generation(spec_path, tmp_path):
+    watcher = Watcher(spec_path, tmp_path / "watched", formatter=Formatter.NONE)
+    watcher.regenerate()
+
+    def check(step):
+        full = tmp_path / f"full_{step}"
+        generate_data(spec_path, full, formatter=Formatter.NONE)
+        watcher.poll()
+        assert _tree(tmp_path / "watched") == _tree(full)
+
+    _edit_spec(
+        spec_path,
+        lambda data: _rename_schema(data, "HTTPValidationError", "httpvalidationerror"),
+    )
+    check(0)
+    assert (tmp_path / "watched" / "models" / "httpvalidationerror.py").exists()
+
+    # A schema colliding with an existing one gets a suffix, until the existing one is removed
+    def add_duplicate(data):
+        schemas = data["components"]["schemas"]
+        schemas["HttpValidationError"] = schemas["httpvalidationerror"]
+
+    _edit_spec(spec_path, add_duplicate)
+    check(1)
+    assert (tmp_path / "watched" / "models" / "HttpValidationError_1.py").exists()
+
+    _edit_spec(
+        spec_path,
+        lambda data: data["components"]["schemas"].pop("httpvalidationerror"),
+    )
+    check(2)
+    assert (tmp_path / "watched" / "models" / "HttpValidationError.py").exists()
+
+
+def test_watch_option_validation(spec_path, tmp_path):
+    runner = CliRunner()
+    for options in (
+        ["--check"],
+        ["--deduplicate-models"],
+        ["--compile"],
+        ["--invalidation-mode", "timestamp"],
+        ["--target", "httpx:v2:httpx"],
+    ):
+        result = runner.invoke(
+            main, [str(spec_path), str(tmp_path / "out"), "--watch", *options]
+        )
+        assert result.exit_code == 2
+        assert "--watch can't be combined" in result.output
+    result = runner.invoke(
+        main, ["https://example.com/openapi.json", str(tmp_path / "out"), "--watch"]
+    )
+    assert result.exit_code != 0